@@ -0,0 +1,144 @@
+"""Benchmark of get-by-id lookups built per call against compiled ones.
+
+Concurrent workers look movies up by id for a fixed time, first through
+a SQLAlchemy query built and compiled by `databases` on every call, then
+through the `CompiledQuery` run as an asyncpg prepared statement, and the
+requests per second of both are printed. It uses the DB configured by the
+`DB_*` variables and adds a movie when the table is empty.
+
+With `--compile-only` no DB is needed: only the per-call cost of building
+and compiling the query, which the compiled path does not pay, is timed.
+
+Usage:
+    python -m benchmarks.get_by_id --workers 20 --seconds 10
+    python -m benchmarks.get_by_id --compile-only
+"""
+import argparse
+import asyncio
+import time
+import timeit
+from datetime import date
+from typing import Awaitable, Callable
+
+from sqlalchemy import Select, select
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from cinema_management.db import close_db, database, init_db, movies_table
+from cinema_management.infrastructure.repositories.movie_repository import GET_MOVIE_BY_ID
+
+
+def built_query(movie_id: int) -> Select:
+    """Function building the lookup the way repositories did before.
+
+    Args:
+        movie_id (int): The id of the movie.
+
+    Returns:
+        Select: The query selecting the movie.
+    """
+    return movies_table.select().where(movies_table.c.id == movie_id)
+
+
+async def requests_per_second(
+        lookup: Callable[[int], Awaitable[object]],
+        movie_ids: list[int],
+        workers: int,
+        seconds: float,
+) -> float:
+    """Function running lookups from concurrent workers for a time.
+
+    Args:
+        lookup (Callable[[int], Awaitable[object]]): The lookup of a movie by id.
+        movie_ids (list[int]): The ids to look up in turn.
+        workers (int): The number of concurrent workers.
+        seconds (float): The duration of the run.
+
+    Returns:
+        float: The lookups done per second.
+    """
+    deadline = time.perf_counter() + seconds
+    done = 0
+
+    async def worker(offset: int) -> None:
+        nonlocal done
+        index = offset
+        while time.perf_counter() < deadline:
+            await lookup(movie_ids[index % len(movie_ids)])
+            index += 1
+            done += 1
+
+    await asyncio.gather(*(worker(offset) for offset in range(workers)))
+
+    return done / seconds
+
+
+async def run(workers: int, seconds: float) -> None:
+    """Function running the benchmark against the DB.
+
+    Args:
+        workers (int): The number of concurrent workers.
+        seconds (float): The duration of each run.
+    """
+    await init_db(retries=1, delay=0)
+    try:
+        movie_ids = [row["id"] for row in await database.fetch_all(
+            select(movies_table.c.id).limit(1000)
+        )]
+        if not movie_ids:
+            movie_ids = [await database.execute(movies_table.insert().values(
+                name="Benchmark",
+                length=2.0,
+                premiere=date(2024, 1, 1),
+                director="Benchmark",
+            ))]
+
+        built = await requests_per_second(
+            lambda movie_id: database.fetch_one(built_query(movie_id)),
+            movie_ids,
+            workers,
+            seconds,
+        )
+        compiled = await requests_per_second(
+            lambda movie_id: GET_MOVIE_BY_ID.fetch_one(movie_id=movie_id),
+            movie_ids,
+            workers,
+            seconds,
+        )
+    finally:
+        await close_db()
+
+    print(f"{'built per call':<20}{built:10.0f} req/s")
+    print(f"{'compiled':<20}{compiled:10.0f} req/s ({compiled / built - 1:+.0%})")
+
+
+def compile_only(number: int) -> None:
+    """Function timing the build and compilation of the lookup.
+
+    Args:
+        number (int): The number of compilations.
+    """
+    dialect = asyncpg_dialect()
+    seconds = min(timeit.repeat(
+        lambda: str(built_query(1).compile(dialect=dialect)),
+        number=number,
+        repeat=5,
+    ))
+    print(f"build and compile: {seconds / number * 1e6:.1f} us per call")
+
+
+def main() -> None:
+    """Function running the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--compile-only", action="store_true")
+    args = parser.parse_args()
+
+    if args.compile_only:
+        compile_only(10_000)
+    else:
+        asyncio.run(run(args.workers, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
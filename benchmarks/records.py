@@ -0,0 +1,128 @@
+"""Benchmark converting DB rows into domain models.
+
+It compares the batch validation used by `from_records` with building
+the models by `model_construct`, which skips validation of trusted rows
+but has to convert the seats returned by the DB into tuples itself.
+
+Usage:
+    python -m benchmarks.records --rows 100000
+"""
+import argparse
+import timeit
+from datetime import date, time
+from typing import Any, Callable, List
+
+from cinema_management.core.domains.record import list_adapter
+from cinema_management.core.domains.repertoire import Repertoire
+from cinema_management.core.domains.reservation import Reservation
+
+
+def reservation_rows(count: int) -> List[dict[str, Any]]:
+    """Function preparing rows as returned by the reservations table.
+
+    Args:
+        count (int): The number of rows.
+
+    Returns:
+        List[dict[str, Any]]: The rows.
+    """
+    return [
+        {
+            "id": i,
+            "repertoire_id": i % 50,
+            "firstName": "Jan",
+            "lastName": "Kowalski",
+            "telephone": "123456789",
+            "email": "jan@example.com",
+            "number_of_seats": 2,
+            "seats": [[i % 12, i % 18], [i % 12, i % 18 + 1]],
+        }
+        for i in range(count)
+    ]
+
+
+def repertoire_rows(count: int) -> List[dict[str, Any]]:
+    """Function preparing rows as returned by the repertoires table.
+
+    Args:
+        count (int): The number of rows.
+
+    Returns:
+        List[dict[str, Any]]: The rows.
+    """
+    return [
+        {
+            "id": i,
+            "movie_id": i % 20,
+            "screening_room_id": i % 5,
+            "start_time": time(10 + i % 12, 0),
+            "date": date(2024, 1, 1 + i % 28),
+            "seat_map": b"\x00" * 27,
+        }
+        for i in range(count)
+    ]
+
+
+def constructed_reservations(rows: List[dict[str, Any]]) -> List[Reservation]:
+    """Function building reservations without validation.
+
+    Args:
+        rows (List[dict[str, Any]]): The rows.
+
+    Returns:
+        List[Reservation]: The reservations.
+    """
+    return [
+        Reservation.model_construct(
+            **{**row, "seats": [tuple(seat) for seat in row["seats"]]}
+        )
+        for row in rows
+    ]
+
+
+def measure(name: str, function: Callable[[], Any], repeat: int) -> None:
+    """Function printing the best time of the function.
+
+    Args:
+        name (str): The label of the measurement.
+        function (Callable[[], Any]): The measured function.
+        repeat (int): The number of runs.
+    """
+    best = min(timeit.repeat(function, number=1, repeat=repeat))
+    print(f"{name:<32}{best:8.3f} s")
+
+
+def main() -> None:
+    """Function running the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    reservations = reservation_rows(args.rows)
+    repertoires = repertoire_rows(args.rows)
+
+    measure(
+        "reservations validate",
+        lambda: list_adapter(Reservation).validate_python(reservations),
+        args.repeat,
+    )
+    measure(
+        "reservations model_construct",
+        lambda: constructed_reservations(reservations),
+        args.repeat,
+    )
+    measure(
+        "repertoires validate",
+        lambda: list_adapter(Repertoire).validate_python(repertoires),
+        args.repeat,
+    )
+    measure(
+        "repertoires model_construct",
+        lambda: [Repertoire.model_construct(**row) for row in repertoires],
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
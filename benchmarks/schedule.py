@@ -0,0 +1,148 @@
+"""Benchmark of the schedule generator scaling with movies and rooms.
+
+For every number of movies and rooms, a week is generated into empty
+rooms, then the generated showings are checked for conflicts, once each
+against the `Schedule` index and once in a single `find_conflicts`
+sweep. The times and the part of the opening hours the rooms are busy
+are printed.
+
+Usage:
+    python -m benchmarks.schedule --movies 10 50 200 --rooms 5 10 40
+"""
+import argparse
+import random
+import timeit
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, List
+
+from cinema_management.core.domains.movie import Movie
+from cinema_management.core.domains.schedule import (
+    Schedule,
+    ScheduleRequest,
+    Showing,
+    find_conflicts,
+    generate_schedule,
+)
+from cinema_management.core.domains.screeningroom import ScreeningRoom
+
+BUFFER = timedelta(minutes=15)
+WEEK_START = date(2025, 1, 6)
+
+
+def random_movies(count: int, generator: random.Random) -> List[Movie]:
+    """Function preparing movies of random lengths, premiered before the week.
+
+    Args:
+        count (int): The number of movies.
+        generator (random.Random): The random numbers generator.
+
+    Returns:
+        List[Movie]: The movies.
+    """
+    return [
+        Movie(
+            id=movie_id,
+            name=f"Movie {movie_id}",
+            length=round(generator.uniform(1.3, 3.0), 2),
+            premiere=date(2024, 1, 1),
+            director="Benchmark",
+        )
+        for movie_id in range(1, count + 1)
+    ]
+
+
+def random_rooms(count: int, generator: random.Random) -> List[ScreeningRoom]:
+    """Function preparing screening rooms of random sizes.
+
+    Args:
+        count (int): The number of rooms.
+        generator (random.Random): The random numbers generator.
+
+    Returns:
+        List[ScreeningRoom]: The rooms.
+    """
+    return [
+        ScreeningRoom(
+            id=room_id,
+            number=room_id,
+            rows_count=generator.randint(5, 20),
+            seats_in_row=generator.randint(8, 30),
+        )
+        for room_id in range(1, count + 1)
+    ]
+
+
+def best_time(function: Callable[[], Any], number: int) -> float:
+    """Function timing the function with the best of five runs.
+
+    Args:
+        function (Callable[[], Any]): The timed function.
+        number (int): The number of calls in a run.
+
+    Returns:
+        float: The seconds per call.
+    """
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    """Function running the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--movies", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--rooms", type=int, nargs="+", default=[5, 10, 20, 40])
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--number", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = random.Random(args.seed)
+    request = ScheduleRequest(week_start=WEEK_START, days=args.days)
+    opening_hours = datetime.combine(WEEK_START, request.closing) \
+        - datetime.combine(WEEK_START, request.opening)
+
+    print(
+        f"{'movies':>7}{'rooms':>7}{'showings':>10}{'busy':>7}"
+        f"{'generate ms':>13}{'Schedule ms':>13}{'sweep ms':>10}"
+    )
+    for movies_count in args.movies:
+        movies = random_movies(movies_count, generator)
+        lengths = {movie.id: movie.length for movie in movies}
+        for rooms_count in args.rooms:
+            rooms = random_rooms(rooms_count, generator)
+
+            def generate() -> list:
+                return generate_schedule(movies, rooms, [], request, BUFFER)
+
+            showings = [
+                Showing.of(
+                    repertoire.screening_room_id,
+                    repertoire.date,
+                    repertoire.start_time,
+                    lengths[repertoire.movie_id],
+                    BUFFER,
+                )
+                for repertoire in generate()
+            ]
+            # The first half of the week is already scheduled, the rest is added.
+            half = len(showings) // 2
+            existing, new = showings[:half], showings[half:]
+
+            def check_each() -> list:
+                schedule = Schedule(existing)
+                return [schedule.conflicts(showing) for showing in new]
+
+            assert not any(check_each())
+            assert not find_conflicts(existing, new)
+
+            busy = sum((showing.end - showing.start for showing in showings), timedelta(0))
+            print(
+                f"{movies_count:>7}{rooms_count:>7}{len(showings):>10}"
+                f"{busy / (opening_hours * rooms_count * args.days):>7.0%}"
+                f"{best_time(generate, args.number) * 1e3:>13.1f}"
+                f"{best_time(check_each, args.number) * 1e3:>13.2f}"
+                f"{best_time(lambda: find_conflicts(existing, new), args.number) * 1e3:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark of the best available seats allocator.
+
+Rooms are filled with random groups up to the given occupancy, then the
+time of finding seats for one more group is measured, along with the
+part of the groups seated in more than one row.
+
+Usage:
+    python -m benchmarks.seat_allocator --rows 14 --seats 36
+"""
+import argparse
+import random
+import timeit
+
+from cinema_management.core.domains.seat_map import Seat, SeatMap
+
+
+def filled_map(rows: int, seats: int, occupancy: float, generator: random.Random) -> SeatMap:
+    """Function preparing a seat map taken by random groups.
+
+    Args:
+        rows (int): The number of rows in the room.
+        seats (int): The number of seats in a row.
+        occupancy (float): The part of the seats to take.
+        generator (random.Random): The random numbers generator.
+
+    Returns:
+        SeatMap: The seat map.
+    """
+    seat_map = SeatMap(rows, seats)
+    while seat_map.count_free() > seat_map.capacity * (1 - occupancy):
+        group = seat_map.best_available(generator.randint(1, 6))
+        if group is None:
+            break
+        # Some customers pick their seats, which fragments the rows.
+        if generator.random() < 0.3:
+            free = [
+                Seat(row, number)
+                for row in range(1, rows + 1)
+                for number in range(1, seats + 1)
+                if seat_map.is_free(Seat(row, number))
+            ]
+            group = generator.sample(free, len(group))
+        seat_map.take(group)
+
+    return seat_map
+
+
+def main() -> None:
+    """Function running the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=14)
+    parser.add_argument("--seats", type=int, default=36)
+    parser.add_argument("--maps", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = random.Random(args.seed)
+    print(f"{'occupancy':>10}{'group':>7}{'us/call':>10}{'split':>8}")
+    for occupancy in (0.3, 0.6, 0.9):
+        maps = [
+            filled_map(args.rows, args.seats, occupancy, generator)
+            for _ in range(args.maps)
+        ]
+        for group in (1, 2, 4, 8):
+            calls = [
+                (seat_map, group) for seat_map in maps
+                if seat_map.count_free() >= group
+            ]
+            seconds = timeit.timeit(
+                lambda: [seat_map.best_available(size) for seat_map, size in calls],
+                number=5,
+            )
+            splits = sum(
+                len({seat.row for seat in seat_map.best_available(size) or []}) > 1
+                for seat_map, size in calls
+            )
+            print(
+                f"{occupancy:>10.0%}{group:>7}"
+                f"{seconds / 5 / max(len(calls), 1) * 1e6:>10.1f}"
+                f"{splits / max(len(calls), 1):>8.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""A module containing custom responses used by the endpoints."""
+
+import collections.abc
+import io
+import zipfile
+from functools import cache, wraps
+from typing import Any, AsyncIterator, Callable, List, get_args, get_origin
+
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+NDJSON_BATCH_SIZE = 500
+
+
+async def _ndjson_chunks(
+        models: AsyncIterator[BaseModel],
+        batch_size: int,
+) -> AsyncIterator[bytes]:
+    """A function encoding models as newline-delimited JSON chunks.
+
+    Args:
+        models (AsyncIterator[BaseModel]): The models to encode.
+        batch_size (int): The number of lines sent in a single chunk.
+
+    Returns:
+        AsyncIterator[bytes]: The encoded chunks.
+    """
+
+    lines = []
+    async for model in models:
+        lines.append(model.model_dump_json().encode())
+        if len(lines) >= batch_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+class NDJSONResponse(StreamingResponse):
+    """A response streaming models as newline-delimited JSON."""
+
+    media_type = "application/x-ndjson"
+
+    def __init__(
+            self,
+            models: AsyncIterator[BaseModel],
+            batch_size: int = NDJSON_BATCH_SIZE,
+            **kwargs,
+    ) -> None:
+        """The initializer of the `NDJSON response`.
+
+        Args:
+            models (AsyncIterator[BaseModel]): The models to stream.
+            batch_size (int, optional): The number of lines sent in
+                a single chunk. Defaults to NDJSON_BATCH_SIZE.
+        """
+        super().__init__(_ndjson_chunks(models, batch_size), **kwargs)
+
+
+class _ZipBuffer(io.RawIOBase):
+    """A write-only buffer collecting the archive bytes between chunks.
+
+    It is not seekable, so `zipfile` streams the members and writes
+    their sizes after the data.
+    """
+
+    def __init__(self) -> None:
+        """The initializer of the `zip buffer`."""
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        """The method marking the buffer as writable.
+
+        Returns:
+            bool: Always True.
+        """
+
+        return True
+
+    def write(self, data: bytes) -> int:
+        """The method collecting the written bytes.
+
+        Args:
+            data (bytes): The bytes to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+
+        self._chunks.append(bytes(data))
+
+        return len(data)
+
+    def pop(self) -> bytes:
+        """The method taking the bytes written since the last call.
+
+        Returns:
+            bytes: The written bytes.
+        """
+
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+
+        return data
+
+
+async def _zip_chunks(files: AsyncIterator[tuple[str, bytes]]) -> AsyncIterator[bytes]:
+    """A function packing files into a zip archive chunk by chunk.
+
+    Args:
+        files (AsyncIterator[tuple[str, bytes]]): The file names and contents.
+
+    Returns:
+        AsyncIterator[bytes]: The archive, one chunk per file.
+    """
+
+    buffer = _ZipBuffer()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        async for name, content in files:
+            archive.writestr(name, content)
+            yield buffer.pop()
+
+    yield buffer.pop()
+
+
+class ZipResponse(StreamingResponse):
+    """A response streaming files as a zip archive."""
+
+    media_type = "application/zip"
+
+    def __init__(
+            self,
+            files: AsyncIterator[tuple[str, bytes]],
+            filename: str,
+            **kwargs,
+    ) -> None:
+        """The initializer of the `zip response`.
+
+        Args:
+            files (AsyncIterator[tuple[str, bytes]]): The file names and contents.
+            filename (str): The name of the archive offered for download.
+        """
+        super().__init__(
+            _zip_chunks(files),
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            **kwargs,
+        )
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSON response encoded by pydantic-core straight to bytes."""
+
+    def __init__(
+            self,
+            content: Any,
+            adapter: TypeAdapter | None = None,
+            **kwargs,
+    ) -> None:
+        """The initializer of the `fast JSON response`.
+
+        Args:
+            content (Any): Models, dicts or lists of them.
+            adapter (TypeAdapter | None, optional): The adapter of the
+                response model checking and serializing the content, so
+                fields not in the model are left out. Defaults to None.
+        """
+        self.adapter = adapter
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        """The method encoding the content.
+
+        Args:
+            content (Any): Models, dicts or lists of them.
+
+        Returns:
+            bytes: The encoded JSON document.
+        """
+
+        if self.adapter is not None:
+            return self.adapter.dump_json(self.adapter.validate_python(content))
+
+        return to_json(content)
+
+
+class FastJSONRoute(APIRoute):
+    """A route returning GET results as `FastJSONResponse`.
+
+    FastAPI validates every returned value against `response_model` again
+    and encodes it with the standard `json` module. GET endpoints of a
+    router using this route class are checked and encoded by the adapter
+    of `response_model` in Rust instead. Returned models are accepted
+    without validating them again, dicts are validated, and fields not
+    in the model are left out either way.
+
+    Usage:
+        router = APIRouter(route_class=FastJSONRoute)
+    """
+
+    def __init__(
+            self,
+            path: str,
+            endpoint: Callable[..., Any],
+            **kwargs: Any,
+    ) -> None:
+        """The initializer of the `fast JSON route`.
+
+        Args:
+            path (str): The path of the route.
+            endpoint (Callable[..., Any]): The endpoint function.
+        """
+        methods = kwargs.get("methods") or {"GET"}
+        if "GET" in methods and not getattr(endpoint, "__fast_json__", False):
+            endpoint = _fast_json_endpoint(
+                endpoint,
+                kwargs.get("status_code") or 200,
+                lambda: self.response_model,
+            )
+
+        super().__init__(path, endpoint, **kwargs)
+
+
+@cache
+def _response_adapter(response_model: Any) -> TypeAdapter:
+    """A function building the serializer of the response model once.
+
+    Iterables are serialized as lists, as the endpoints return lists
+    and an iterable adapter expects a generator.
+
+    Args:
+        response_model (Any): The response model of the route.
+
+    Returns:
+        TypeAdapter: The adapter of the model.
+    """
+
+    if get_origin(response_model) is collections.abc.Iterable:
+        response_model = List[get_args(response_model)[0]]  # type: ignore
+
+    return TypeAdapter(response_model)
+
+
+def _fast_json_endpoint(
+        endpoint: Callable[..., Any],
+        status_code: int,
+        response_model: Callable[[], Any],
+) -> Callable[..., Any]:
+    """A function wrapping the endpoint to return `FastJSONResponse`.
+
+    Args:
+        endpoint (Callable[..., Any]): The endpoint function.
+        status_code (int): The status code of successful responses.
+        response_model (Callable[[], Any]): The function getting the
+            response model of the route, known once the route is built.
+
+    Returns:
+        Callable[..., Any]: The wrapped endpoint.
+    """
+
+    @wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Response:
+        content = await endpoint(*args, **kwargs)
+        if isinstance(content, Response):
+            return content
+
+        model = response_model()
+        adapter = _response_adapter(model) if model is not None else None
+
+        return FastJSONResponse(content, adapter=adapter, status_code=status_code)
+
+    wrapper.__fast_json__ = True  # type: ignore
+
+    return wrapper
@@ -2,14 +2,17 @@
 
 from typing import Iterable, List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
+from cinema_management.api.responses import FastJSONRoute
+from cinema_management.config import config
 from cinema_management.container import Container
 from cinema_management.core.domains.movie import Movie, MovieIn
 from cinema_management.core.services.i_movie_service import IMovieService
 from cinema_management.core.services.i_repertoire_service import IRepertoireService
+from cinema_management.utils.cache import LRUCache
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.post("/create", response_model=Movie, status_code=201)
@@ -33,21 +36,43 @@ async def create_movie(
 
     return new_movie.model_dump() if new_movie else {}
 
+@router.post("/bulk", response_model=List[Movie], status_code=201)
+@inject
+async def create_movies(
+        movies: List[MovieIn],
+        service: IMovieService = Depends(Provide[Container.movie_service]),
+) -> Iterable:
+    """An endpoint for adding many movies at once.
+
+    Args:
+        movies (List[MovieIn]): The movies data.
+        service (IMovieService, optional): The injected service dependency.
+
+    Returns:
+        Iterable: The new movies attributes.
+    """
+
+    return await service.add_many(movies)
+
 @router.get("/all", response_model=Iterable[Movie], status_code=200)
 @inject
 async def get_all_movies(
+        limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+        after: int | None = None,
         service: IMovieService = Depends(Provide[Container.movie_service]),
 ) -> Iterable:
-    """An endpoint for getting all movies.
+    """An endpoint for getting a page of movies ordered by id.
 
     Args:
+        limit (int, optional): The maximum number of movies in the page.
+        after (int | None, optional): The id of the last movie of the previous page.
         service (IMovieService, optional): The injected service dependency.
 
     Returns:
         Iterable: The movie attributes collection.
     """
 
-    movies = await service.get_all()
+    movies = await service.get_all(limit=limit, after=after)
 
     return movies
 
@@ -70,6 +95,23 @@ async def get_all_upcoming_movies(
     return movies
 
 
+@router.get("/cache_stats", response_model=dict, status_code=200)
+@inject
+async def get_cache_stats(
+        cache: LRUCache = Depends(Provide[Container.movie_cache]),
+) -> dict:
+    """An endpoint for getting counters of the movie cache.
+
+    Args:
+        cache (LRUCache, optional): The injected cache dependency.
+
+    Returns:
+        dict: The hits, misses, evictions and current size.
+    """
+
+    return cache.stats()
+
+
 @router.get("/{movie_id}",response_model=Movie,status_code=200,)
 @inject
 async def get_movie_by_id(
@@ -113,12 +155,11 @@ async def update_movie(
         dict: The updated movie details.
     """
 
-    if await service.get_by_id(movie_id=movie_id):
-        await service.update_movie(
-            movie_id=movie_id,
-            data=updated_movie,
-        )
-        return {**updated_movie.model_dump(), "id": movie_id}
+    if movie := await service.update_movie(
+        movie_id=movie_id,
+        data=updated_movie,
+    ):
+        return movie.model_dump()
 
     raise HTTPException(status_code=404, detail="Movie not found")
 
@@ -144,13 +185,11 @@ async def delete_movie(
 
     """
 
-    if await repertoire_service.get_by_movie_id(movie_id):
+    if await repertoire_service.exists_by_movie_id(movie_id):
         raise HTTPException(status_code=409, detail="can not delete movie with existing repertoire")
 
 
-    if await movie_service.get_by_id(movie_id=movie_id):
-        await movie_service.delete_movie(movie_id)
-
+    if await movie_service.delete_movie(movie_id):
         return
 
     raise HTTPException(status_code=404, detail="Movie not found")
\ No newline at end of file
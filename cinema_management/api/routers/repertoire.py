@@ -1,17 +1,21 @@
 """A module containing continent endpoints."""
 
+from datetime import date, time
 from typing import Iterable, List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
+from cinema_management.api.responses import FastJSONRoute, NDJSONResponse
+from cinema_management.config import config
 from cinema_management.container import Container
 from cinema_management.core.domains.repertoire import Repertoire, RepertoireIn
+from cinema_management.core.domains.schedule import ScheduleRequest
 from cinema_management.core.services.i_movie_service import IMovieService
 from cinema_management.core.services.i_repertoire_service import IRepertoireService
 from cinema_management.core.services.i_reservation_service import IReservationService
 from cinema_management.core.services.i_screening_room_service import IScreeningRoomService
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.post("/create", response_model=Repertoire, status_code=201)
@@ -30,17 +34,105 @@ async def create_repertoire(
         movie_service (IMovieService, optional): The injected service dependency.
         screening_room_service (IScreening_roomService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if the movie or screening_room does not exist.
+        HTTPException: 409 if the screening_room is occupied at that time.
+
     Returns:
         dict: The new repertoire attributes.
     """
     if await movie_service.get_by_id(repertoire.movie_id) and \
        await screening_room_service.get_by_id(repertoire.screening_room_id):
-            new_repertoire = await repertoire_service.add_repertoire(repertoire)
-            return new_repertoire.model_dump() if new_repertoire else {}
+            if new_repertoire := await repertoire_service.add_repertoire(repertoire):
+                return new_repertoire.model_dump()
+
+            raise HTTPException(status_code=409, detail="Screening room is occupied at that time")
 
     raise HTTPException(status_code=400, detail="Invalid argument(s)")
 
 
+@router.post("/bulk", response_model=List[Repertoire], status_code=201)
+@inject
+async def create_repertoires(
+        repertoires: List[RepertoireIn],
+        repertoire_service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
+        movie_service: IMovieService = Depends(Provide[Container.movie_service]),
+        screening_room_service: IScreeningRoomService = Depends(Provide[Container.screening_room_service]),
+) -> Iterable:
+    """An endpoint for adding many repertoires at once.
+
+    Args:
+        repertoires (List[RepertoireIn]): The repertoires data.
+        repertoire_service (IRepertoireService, optional): The injected service dependency.
+        movie_service (IMovieService, optional): The injected service dependency.
+        screening_room_service (IScreening_roomService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if any referenced movie or screening_room does not exist.
+        HTTPException: 409 if any screening_room is occupied at that time.
+
+    Returns:
+        Iterable: The new repertoires attributes.
+    """
+
+    movie_ids = {repertoire.movie_id for repertoire in repertoires}
+    screening_room_ids = {repertoire.screening_room_id for repertoire in repertoires}
+
+    if await movie_service.get_existing_ids(movie_ids) != movie_ids or \
+       await screening_room_service.get_existing_ids(screening_room_ids) != screening_room_ids:
+        raise HTTPException(status_code=400, detail="Invalid argument(s)")
+
+    new_repertoires = await repertoire_service.add_many(repertoires)
+    if new_repertoires is None:
+        raise HTTPException(status_code=409, detail="Screening room is occupied at that time")
+
+    return new_repertoires
+
+
+@router.post("/schedule", response_model=List[RepertoireIn], status_code=200)
+@inject
+async def plan_schedule(
+        request: ScheduleRequest,
+        service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
+) -> Iterable:
+    """An endpoint for planning repertoires filling the free screening room time.
+
+    Args:
+        request (ScheduleRequest): The parameters of the schedule.
+        service (IRepertoireService, optional): The injected service dependency.
+
+    Returns:
+        Iterable: The planned repertoires, not saved.
+    """
+
+    return await service.generate_schedule(request)
+
+
+@router.post("/schedule/apply", response_model=List[Repertoire], status_code=201)
+@inject
+async def apply_schedule(
+        request: ScheduleRequest,
+        service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
+) -> Iterable:
+    """An endpoint for planning and adding repertoires filling the free screening room time.
+
+    Args:
+        request (ScheduleRequest): The parameters of the schedule.
+        service (IRepertoireService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 409 if the schedule changed while planning.
+
+    Returns:
+        Iterable: The new repertoires attributes.
+    """
+
+    new_repertoires = await service.add_many(await service.generate_schedule(request))
+    if new_repertoires is None:
+        raise HTTPException(status_code=409, detail="Screening room is occupied at that time")
+
+    return new_repertoires
+
 
 @router.get("/taken_seats/{repertoire_id}",response_model=dict,status_code=200,)
 @inject
@@ -82,31 +174,135 @@ async def available_seats(
         Iterable: The repertoire attributes collection.
     """
 
-    if  await service.get_by_id(repertoire_id):
+    if (seats := await service.available_seats(repertoire_id)) is not None:
         return {
-            "available_seats": await service.available_seats(repertoire_id)
+            "available_seats": seats
         }
 
     raise HTTPException(status_code=404, detail="Reservation not found")
 
+@router.get("/seat_map/{repertoire_id}", response_model=dict, status_code=200)
+@inject
+async def seat_map(
+        repertoire_id: int,
+        service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
+) -> dict:
+    """An endpoint for getting picked seats of the repertoire.
+
+    Args:
+        repertoire_id(int): id of the repertoire.
+        service (IRepertoireService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if repertoire does not exist.
+
+    Returns:
+        dict: The room size, the number of free seats and the taken seats.
+    """
+
+    if seats := await service.get_seat_map(repertoire_id):
+        return {
+            "rows_count": seats.rows_count,
+            "seats_in_row": seats.seats_in_row,
+            "free_seats": seats.count_free(),
+            "taken_seats": list(seats.taken()),
+        }
+
+    raise HTTPException(status_code=404, detail="Repertoire not found")
+
+@router.get("", response_model=Iterable[Repertoire], status_code=200)
+@inject
+async def get_repertoires_by_dates(
+        from_date: date | None = Query(None, alias="from"),
+        to_date: date | None = Query(None, alias="to"),
+        movie_id: int | None = None,
+        screening_room_id: int | None = None,
+        limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+        after_date: date | None = None,
+        after_time: time | None = None,
+        after_id: int | None = None,
+        service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
+) -> Iterable:
+    """An endpoint for getting repertoires within the dates ordered by time.
+
+    Without `from`, the upcoming repertoires of today are returned. The next
+    page starts after the date, start time and id of the last repertoire.
+
+    Args:
+        from_date (date | None, optional): The first date of the repertoires.
+        to_date (date | None, optional): The last date of the repertoires,
+            the first date if omitted.
+        movie_id (int | None, optional): The id of the movie.
+        screening_room_id (int | None, optional): The id of the screening_room.
+        limit (int, optional): The maximum number of repertoires.
+        after_date (date | None, optional): The date of the last repertoire
+            of the previous page.
+        after_time (time | None, optional): The start time of the last
+            repertoire of the previous page.
+        after_id (int | None, optional): The id of the last repertoire
+            of the previous page.
+        service (IRepertoireService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the dates are in the wrong order or the cursor
+            is incomplete.
+
+    Returns:
+        Iterable: The repertoire attributes collection.
+    """
+
+    cursor = (after_date, after_time, after_id)
+    if from_date and to_date and from_date > to_date or \
+       None in cursor and any(value is not None for value in cursor):
+        raise HTTPException(status_code=400, detail="Invalid argument(s)")
+
+    return await service.get_by_dates(
+        from_date=from_date,
+        to_date=to_date,
+        movie_id=movie_id,
+        screening_room_id=screening_room_id,
+        limit=limit,
+        after=None if None in cursor else cursor,
+    )
+
 @router.get("/all", response_model=Iterable[Repertoire], status_code=200)
 @inject
 async def get_all_repertoires(
+        limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+        after: int | None = None,
         service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
 ) -> Iterable:
-    """An endpoint for getting all repertoires.
+    """An endpoint for getting a page of repertoires ordered by id.
 
     Args:
+        limit (int, optional): The maximum number of repertoires in the page.
+        after (int | None, optional): The id of the last repertoire of the previous page.
         service (IRepertoireService, optional): The injected service dependency.
 
     Returns:
         Iterable: The repertoire attributes collection.
     """
 
-    repertoires = await service.get_all()
+    repertoires = await service.get_all(limit=limit, after=after)
 
     return repertoires
 
+@router.get("/export", response_class=NDJSONResponse, status_code=200)
+@inject
+async def export_repertoires(
+        service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
+) -> NDJSONResponse:
+    """An endpoint streaming all repertoires as newline-delimited JSON.
+
+    Args:
+        service (IRepertoireService, optional): The injected service dependency.
+
+    Returns:
+        NDJSONResponse: The stream of repertoire attributes, one per line.
+    """
+
+    return NDJSONResponse(service.iterate_all())
+
 
 
 @router.get("/{repertoire_id}",response_model=Repertoire,status_code=200,)
@@ -195,6 +391,8 @@ async def update_repertoire(
     Raises:
         HTTPException: 404 if repertoire does not exist.
         HTTPException: 400 if updated repertoire does Invalid argument(s).
+        HTTPException: 409 if the screening_room is occupied at that time
+            or can not seat the reservations.
 
     Returns:
         dict: The updated repertoire details.
@@ -206,15 +404,19 @@ async def update_repertoire(
     if not await movie_service.get_by_id(updated_repertoire.movie_id):
         raise HTTPException(status_code=400, detail="Invalid argument(s)")
 
+    if not await repertoire_service.get_by_id(repertoire_id):
+        raise HTTPException(status_code=404, detail="Repertoire not found")
 
-    if await repertoire_service.get_by_id(repertoire_id=repertoire_id):
-        await repertoire_service.update_repertoire(
-            repertoire_id=repertoire_id,
-            data=updated_repertoire,
-        )
-        return {**updated_repertoire.model_dump(), "id": repertoire_id}
+    if repertoire := await repertoire_service.update_repertoire(
+        repertoire_id=repertoire_id,
+        data=updated_repertoire,
+    ):
+        return repertoire.model_dump()
 
-    raise HTTPException(status_code=404, detail="Repertoire not found")
+    raise HTTPException(
+        status_code=409,
+        detail="Screening room is occupied at that time or can not seat the reservations",
+    )
 
 
 @router.delete("/{repertoire_id}", status_code=204)
@@ -238,9 +440,7 @@ async def delete_repertoire(
     if await reservation_service.get_by_repertoire_id(repertoire_id):
         raise HTTPException(status_code=409, detail="can not delete repertoire with existing repertoire")
 
-    if await repertoire_service.get_by_id(repertoire_id=repertoire_id):
-        await repertoire_service.delete_repertoire(repertoire_id)
-
+    if await repertoire_service.delete_repertoire(repertoire_id):
         return
 
     raise HTTPException(status_code=404, detail="Repertoire not found")
\ No newline at end of file
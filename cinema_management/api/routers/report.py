@@ -0,0 +1,67 @@
+"""A module containing report endpoints."""
+
+from datetime import date
+from typing import Iterable
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException
+
+from cinema_management.api.responses import FastJSONRoute
+from cinema_management.container import Container
+from cinema_management.core.domains.report import OccupancyReport, RevenueReport
+from cinema_management.core.services.i_report_service import IReportService
+
+router = APIRouter(route_class=FastJSONRoute)
+
+
+@router.get("/occupancy", response_model=Iterable[OccupancyReport], status_code=200)
+@inject
+async def get_occupancy(
+        from_date: date,
+        to_date: date,
+        service: IReportService = Depends(Provide[Container.report_service]),
+) -> Iterable:
+    """An endpoint for getting seat occupancy grouped by day, movie and screening room.
+
+    Args:
+        from_date (date): The first date of the report.
+        to_date (date): The last date of the report.
+        service (IReportService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the dates are in the wrong order.
+
+    Returns:
+        Iterable: The occupancy rows.
+    """
+
+    if from_date > to_date:
+        raise HTTPException(status_code=400, detail="Invalid argument(s)")
+
+    return await service.get_occupancy(from_date, to_date)
+
+
+@router.get("/revenue", response_model=Iterable[RevenueReport], status_code=200)
+@inject
+async def get_revenue(
+        from_date: date,
+        to_date: date,
+        service: IReportService = Depends(Provide[Container.report_service]),
+) -> Iterable:
+    """An endpoint for getting revenue grouped by day, movie and screening room.
+
+    Args:
+        from_date (date): The first date of the report.
+        to_date (date): The last date of the report.
+        service (IReportService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the dates are in the wrong order.
+
+    Returns:
+        Iterable: The revenue rows.
+    """
+
+    if from_date > to_date:
+        raise HTTPException(status_code=400, detail="Invalid argument(s)")
+
+    return await service.get_revenue(from_date, to_date)
@@ -1,15 +1,20 @@
 """A module containing continent endpoints."""
 
-from typing import Iterable
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
+from cinema_management.api.responses import FastJSONRoute, NDJSONResponse, ZipResponse
+from cinema_management.config import config
 from cinema_management.container import Container
 from cinema_management.core.domains.reservation import Reservation, ReservationIn
+from cinema_management.core.domains.seat_hold import SeatHold, SeatHoldIn
 from cinema_management.core.services.i_reservation_service import IReservationService
 from cinema_management.core.services.i_repertoire_service import IRepertoireService
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.post("/create", response_model=Reservation, status_code=201)
@@ -30,35 +35,196 @@ async def create_reservation(
     Returns:
         dict: The new reservation attributes.
     """
-    if not await repertoire_service.get_by_id(reservation.repertoire_id):
+    if await repertoire_service.available_seats(reservation.repertoire_id) is None:
         raise HTTPException(status_code=400, detail="Invalid argument(s)")
 
-    if reservation.number_of_seats > await repertoire_service.available_seats(reservation.repertoire_id):
+    if not await repertoire_service.reserve_seats(
+        reservation.repertoire_id,
+        reservation.number_of_seats,
+    ):
         raise HTTPException(status_code=400, detail="There is no available seats")
 
+    try:
+        new_reservation = await reservation_service.add_reservation(reservation)
+    except Exception:
+        repertoire_service.release_seats(reservation.repertoire_id, reservation.number_of_seats)
+        raise
 
-    new_reservation = await reservation_service.add_reservation(reservation)
+    if not new_reservation:
+        repertoire_service.release_seats(reservation.repertoire_id, reservation.number_of_seats)
+        raise HTTPException(status_code=400, detail="There is no available seats")
+
+    return new_reservation.model_dump()
+
+@router.post("/bulk", response_model=List[Reservation], status_code=201)
+@inject
+async def create_reservations(
+        reservations: List[ReservationIn],
+        reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
+        repertoire_service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
+) -> Iterable:
+    """An endpoint for adding many reservations at once.
+
+    Args:
+        reservations (List[ReservationIn]): The reservations data.
+        reservation_service (IReservationService, optional): The injected service dependency.
+        repertoire_service (IRepertoireService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if any referenced repertoire does not exist.
+        HTTPException: 400 if any repertoire has not enough available seats.
+
+    Returns:
+        Iterable: The new reservations attributes.
+    """
+
+    requested_seats: dict[int, int] = defaultdict(int)
+    for reservation in reservations:
+        requested_seats[reservation.repertoire_id] += reservation.number_of_seats
+
+    available_seats = await repertoire_service.available_seats_many(requested_seats)
+    if available_seats.keys() != requested_seats.keys():
+        raise HTTPException(status_code=400, detail="Invalid argument(s)")
+
+    if not await repertoire_service.reserve_seats_many(requested_seats):
+        raise HTTPException(status_code=400, detail="There is no available seats")
+
+    try:
+        new_reservations = await reservation_service.add_many(reservations)
+    except Exception:
+        repertoire_service.release_seats_many(requested_seats)
+        raise
+
+    if new_reservations is None:
+        repertoire_service.release_seats_many(requested_seats)
+        raise HTTPException(status_code=400, detail="There is no available seats")
+
+    return new_reservations
+
+@router.post("/hold", response_model=SeatHold, status_code=201)
+@inject
+async def hold_seats(
+        hold: SeatHoldIn,
+        repertoire_service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
+) -> dict:
+    """An endpoint for holding seats during checkout.
+
+    The seats are released when the hold is not confirmed in time.
+
+    Args:
+        hold (SeatHoldIn): The hold data.
+        repertoire_service (IRepertoireService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the repertoire does not exist.
+        HTTPException: 400 if the repertoire has not enough available seats.
+
+    Returns:
+        dict: The new hold attributes.
+    """
+
+    if await repertoire_service.available_seats(hold.repertoire_id) is None:
+        raise HTTPException(status_code=400, detail="Invalid argument(s)")
+
+    if new_hold := await repertoire_service.hold_seats(hold):
+        return new_hold.model_dump()
+
+    raise HTTPException(status_code=400, detail="There is no available seats")
+
+@router.post("/hold/{hold_id}/confirm", response_model=Reservation, status_code=201)
+@inject
+async def confirm_hold(
+        hold_id: str,
+        reservation: ReservationIn,
+        repertoire_service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
+) -> dict:
+    """An endpoint for turning the held seats into a reservation.
+
+    Args:
+        hold_id (str): The id of the hold.
+        reservation (ReservationIn): The reservation data matching the hold.
+        repertoire_service (IRepertoireService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if the hold does not exist or expired.
+        HTTPException: 400 if the reservation does not match the hold.
+        HTTPException: 400 if the repertoire has not enough available seats.
+
+    Returns:
+        dict: The new reservation attributes.
+    """
+
+    if not (hold := await repertoire_service.get_hold(hold_id)):
+        raise HTTPException(status_code=404, detail="Hold not found")
+
+    if hold.repertoire_id != reservation.repertoire_id or \
+       hold.number_of_seats != reservation.number_of_seats:
+        raise HTTPException(status_code=400, detail="Invalid argument(s)")
+
+    if not (new_reservation := await repertoire_service.confirm_hold(hold_id, reservation)):
+        raise HTTPException(status_code=400, detail="There is no available seats")
+
+    return new_reservation.model_dump()
+
+@router.delete("/hold/{hold_id}", status_code=204)
+@inject
+async def release_hold(
+        hold_id: str,
+        repertoire_service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
+) -> None:
+    """An endpoint for releasing held seats.
+
+    Args:
+        hold_id (str): The id of the hold.
+        repertoire_service (IRepertoireService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if the hold does not exist or expired.
+    """
+
+    if await repertoire_service.release_hold(hold_id):
+        return
 
-    return new_reservation.model_dump() if new_reservation else {}
+    raise HTTPException(status_code=404, detail="Hold not found")
 
 @router.get("/all", response_model=Iterable[Reservation], status_code=200)
 @inject
 async def get_all_reservations(
+        limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+        after: int | None = None,
         service: IReservationService = Depends(Provide[Container.reservation_service]),
 ) -> Iterable:
-    """An endpoint for getting all reservations.
+    """An endpoint for getting a page of reservations ordered by id.
 
     Args:
+        limit (int, optional): The maximum number of reservations in the page.
+        after (int | None, optional): The id of the last reservation of the previous page.
         service (IReservationService, optional): The injected service dependency.
 
     Returns:
         Iterable: The reservation attributes collection.
     """
 
-    reservations = await service.get_all()
+    reservations = await service.get_all(limit=limit, after=after)
 
     return reservations
 
+@router.get("/export", response_class=NDJSONResponse, status_code=200)
+@inject
+async def export_reservations(
+        service: IReservationService = Depends(Provide[Container.reservation_service]),
+) -> NDJSONResponse:
+    """An endpoint streaming all reservations as newline-delimited JSON.
+
+    Args:
+        service (IReservationService, optional): The injected service dependency.
+
+    Returns:
+        NDJSONResponse: The stream of reservation attributes, one per line.
+    """
+
+    return NDJSONResponse(service.iterate_all())
+
 
 
 @router.get("/id/{reservation_id}",response_model=Reservation,status_code=200,)
@@ -103,29 +269,68 @@ async def get_reservation_by_repertoire_id(
 
     raise HTTPException(status_code=404, detail="Reservation not found")
 
-@router.get("/invoice/{repertoire_id,address}",response_model=dict,status_code=200,)
+@router.get("/invoice/{reservation_id}", response_model=dict, status_code=200)
 @inject
 async def invoice(
-        repertoire_id: int,
+        reservation_id: int,
         address: str,
         service: IReservationService = Depends(Provide[Container.reservation_service]),
-) -> dict | None:
-    """An endpoint for getting reservation by id.
+) -> dict:
+    """An endpoint for getting invoice of the reservation.
 
     Args:
-        repertoire_id (int): The id of the reservation.
-        address (str): The address.
+        reservation_id (int): The id of the reservation.
+        address (str): The address of the buyer.
         service (IReservationService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 404 if reservation does not exist.
+
     Returns:
-        dict | None: The reservation details.
+        dict: The invoice.
     """
-    if await service.get_by_id(repertoire_id):
-        return await service.invoice(repertoire_id, address)
+
+    if invoice := await service.invoice(reservation_id, address):
+        return invoice
 
     raise HTTPException(status_code=404, detail="Reservation not found")
 
 
+@router.get("/invoices", response_class=ZipResponse, status_code=200)
+@inject
+async def invoices(
+        repertoire_id: int | None = None,
+        from_date: date | None = None,
+        to_date: date | None = None,
+        service: IReservationService = Depends(Provide[Container.reservation_service]),
+) -> ZipResponse:
+    """An endpoint for getting invoices of a repertoire or of repertoires within the dates.
+
+    Invoices are rendered as HTML documents and streamed as a zip archive.
+    They are issued without the address of the buyer, which is not stored
+    with the reservations.
+
+    Args:
+        repertoire_id (int | None, optional): The id of the repertoire. Defaults to None.
+        from_date (date | None, optional): The first date of the repertoires. Defaults to None.
+        to_date (date | None, optional): The last date of the repertoires. Defaults to None.
+        service (IReservationService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if neither the repertoire nor both dates are given.
+
+    Returns:
+        ZipResponse: The invoices archive.
+    """
+
+    if repertoire_id is None and (from_date is None or to_date is None):
+        raise HTTPException(status_code=400, detail="Invalid argument(s)")
+
+    return ZipResponse(
+        service.invoices(repertoire_id, from_date, to_date),
+        filename="invoices.zip",
+    )
+
 
 @router.put("/{reservation_id}", response_model=Reservation, status_code=201)
 @inject
@@ -146,43 +351,70 @@ async def update_reservation(
     Raises:
         HTTPException: 404 if reservation does not exist.
         HTTPException: 400 if reservation does invalid argument(s).
+        HTTPException: 400 if the repertoire has not enough available seats.
 
     Returns:
         dict: The updated reservation details.
     """
 
-    if not await repertoire_service.get_by_id(updated_reservation.repertoire_id):
+    if not (reservation := await reservation_service.get_by_id(reservation_id)):
+        raise HTTPException(status_code=404, detail="Reservation not found")
+
+    if await repertoire_service.available_seats(updated_reservation.repertoire_id) is None:
         raise HTTPException(status_code=400, detail="Invalid argument(s)")
 
-    if await reservation_service.get_by_id(reservation_id=reservation_id):
-        await reservation_service.update_reservation(
+    requested_seats = updated_reservation.number_of_seats
+    if reservation.repertoire_id == updated_reservation.repertoire_id:
+        requested_seats -= reservation.number_of_seats
+
+    if not await repertoire_service.reserve_seats(
+        updated_reservation.repertoire_id,
+        requested_seats,
+    ):
+        raise HTTPException(status_code=400, detail="There is no available seats")
+
+    try:
+        updated = await reservation_service.update_reservation(
             reservation_id=reservation_id,
             data=updated_reservation,
         )
-        return {**updated_reservation.model_dump(), "id": reservation_id}
+    except Exception:
+        repertoire_service.release_seats(updated_reservation.repertoire_id, requested_seats)
+        raise
 
-    raise HTTPException(status_code=404, detail="Reservation not found")
+    if not updated:
+        repertoire_service.release_seats(updated_reservation.repertoire_id, requested_seats)
+        if await reservation_service.get_by_id(reservation_id):
+            raise HTTPException(status_code=400, detail="There is no available seats")
+
+        raise HTTPException(status_code=404, detail="Reservation not found")
+
+    if reservation.repertoire_id != updated_reservation.repertoire_id:
+        repertoire_service.release_seats(reservation.repertoire_id, reservation.number_of_seats)
+
+    return updated.model_dump()
 
 
 @router.delete("/{reservation_id}", status_code=204)
 @inject
 async def delete_reservation(
         reservation_id: int,
-        service: IReservationService = Depends(Provide[Container.reservation_service]),
+        reservation_service: IReservationService = Depends(Provide[Container.reservation_service]),
+        repertoire_service: IRepertoireService = Depends(Provide[Container.repertoire_service]),
 ) -> None:
     """An endpoint for deleting reservations.
 
     Args:
         reservation_id (int): The id of the reservation.
-        service (IReservationService, optional): The injected service dependency.
+        reservation_service (IReservationService, optional): The injected service dependency.
+        repertoire_service (IRepertoireService, optional): The injected service dependency.
 
     Raises:
         HTTPException: 404 if reservation does not exist.
     """
 
-    if await service.get_by_id(reservation_id=reservation_id):
-        await service.delete_reservation(reservation_id)
-
+    if reservation := await reservation_service.delete_reservation(reservation_id):
+        repertoire_service.release_seats(reservation.repertoire_id, reservation.number_of_seats)
         return
 
     raise HTTPException(status_code=404, detail="Reservation not found")
\ No newline at end of file
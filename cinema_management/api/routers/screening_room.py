@@ -1,15 +1,18 @@
 """A module containing continent endpoints."""
 
-from typing import Iterable
+from typing import Iterable, List
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
+from cinema_management.api.responses import FastJSONRoute
+from cinema_management.config import config
 from cinema_management.container import Container
 from cinema_management.core.domains.screeningroom import ScreeningRoom, ScreeningRoomIn
 from cinema_management.core.services.i_repertoire_service import IRepertoireService
 from cinema_management.core.services.i_screening_room_service import IScreeningRoomService
+from cinema_management.utils.cache import LRUCache
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 
 @router.post("/create", response_model=ScreeningRoom, status_code=201)
@@ -34,27 +37,65 @@ async def create_screening_room(
 
     return new_screening_room.model_dump() if new_screening_room else {}
 
+@router.post("/bulk", response_model=List[ScreeningRoom], status_code=201)
+@inject
+async def create_screening_rooms(
+        screening_rooms: List[ScreeningRoomIn],
+        service: IScreeningRoomService = Depends(Provide[Container.screening_room_service]),
+) -> Iterable:
+    """An endpoint for adding many screening_rooms at once.
+
+    Args:
+        screening_rooms (List[ScreeningRoomIn]): The screening_rooms data.
+        service (IScreening_roomService, optional): The injected service dependency.
+
+    Returns:
+        Iterable: The new screening_rooms attributes.
+    """
+
+    return await service.add_many(screening_rooms)
+
 @router.get("/all", response_model=Iterable[ScreeningRoom], status_code=200)
 @inject
 async def get_all_screening_rooms(
+        limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+        after: int | None = None,
         service: IScreeningRoomService = Depends(Provide[Container.screening_room_service]),
-
 ) -> Iterable:
-    """An endpoint for getting all screening_rooms.
+    """An endpoint for getting a page of screening_rooms ordered by id.
 
     Args:
+        limit (int, optional): The maximum number of screening_rooms in the page.
+        after (int | None, optional): The id of the last screening_room of the previous page.
         service (IScreening_roomService, optional): The injected service dependency.
 
     Returns:
         Iterable: The screening_room attributes collection.
     """
 
-    screening_rooms = await service.get_all()
+    screening_rooms = await service.get_all(limit=limit, after=after)
 
     return screening_rooms
 
 
 
+@router.get("/cache_stats", response_model=dict, status_code=200)
+@inject
+async def get_cache_stats(
+        cache: LRUCache = Depends(Provide[Container.screening_room_cache]),
+) -> dict:
+    """An endpoint for getting counters of the screening_room cache.
+
+    Args:
+        cache (LRUCache, optional): The injected cache dependency.
+
+    Returns:
+        dict: The hits, misses, evictions and current size.
+    """
+
+    return cache.stats()
+
+
 @router.get("/{screening_room_id}", response_model=ScreeningRoom, status_code=200, )
 @inject
 async def get_screening_room_by_id(
@@ -93,19 +134,22 @@ async def update_screening_room(
 
     Raises:
         HTTPException: 404 if screening_room does not exist.
+        HTTPException: 409 if the reservations do not fit in the new size.
 
     Returns:
         dict: The updated screening_room details.
     """
 
-    if await service.get_by_id(screening_room_id=screening_room_id):
-        await service.update_screening_room(
-            screening_room_id=screening_room_id,
-            data=updated_screening_room,
-        )
-        return {**updated_screening_room.model_dump(), "id": screening_room_id}
+    if not await service.get_by_id(screening_room_id):
+        raise HTTPException(status_code=404, detail="Screening_room not found")
 
-    raise HTTPException(status_code=404, detail="Screening_room not found")
+    if screening_room := await service.update_screening_room(
+        screening_room_id=screening_room_id,
+        data=updated_screening_room,
+    ):
+        return screening_room.model_dump()
+
+    raise HTTPException(status_code=409, detail="Reservations do not fit in the screening room")
 
 
 @router.delete("/{screening_room_id}", status_code=204)
@@ -129,14 +173,12 @@ async def delete_screening_room(
 
     """
 
-    if await repertoire_service.get_by_screening_room_id(screening_room_id):
+    if await repertoire_service.exists_by_screening_room_id(screening_room_id):
         raise HTTPException(status_code=409, detail="can not delete movie with existing repertoire")
 
 
 
-    if await screening_room_service.get_by_id(screening_room_id=screening_room_id):
-
-        await screening_room_service.delete_screening_room(screening_room_id)
+    if await screening_room_service.delete_screening_room(screening_room_id):
         return
 
     raise HTTPException(status_code=404, detail="Screening_room not found")
\ No newline at end of file
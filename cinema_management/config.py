@@ -15,6 +15,24 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_REPLICA_HOSTS: Optional[str] = None
+    DB_FORCE_ROLLBACK: bool = False
+    DB_ECHO: bool = False
+    DB_POOL_MIN_SIZE: int = 5
+    DB_POOL_MAX_SIZE: int = 20
+    DB_STATEMENT_TIMEOUT: float = 30.0
+    DB_MAX_INACTIVE_CONNECTION_LIFETIME: float = 300.0
+    DEFAULT_PAGE_SIZE: int = 100
+    MAX_PAGE_SIZE: int = 1000
+    SEED_DB: bool = False
+    SEED_FILE: Optional[str] = None
+    REBUILD_ROLLUPS: bool = False
+    CACHE_MAX_SIZE: int = 1024
+    CACHE_TTL_SECONDS: float = 300.0
+    SEAT_INVENTORY_RECONCILE_SECONDS: float = 60.0
+    SEAT_HOLD_TTL_SECONDS: float = 600.0
+    CLEANING_BUFFER_MINUTES: float = 15.0
+    INVOICE_WORKERS: Optional[int] = None
 
 
 config = AppConfig()
\ No newline at end of file
@@ -1,45 +1,95 @@
 """Module providing containers injecting dependencies."""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Factory, Resource, Singleton
 
+from cinema_management.config import config
+from cinema_management.infrastructure.repositories.cached_movie_repository import CachedMovieRepository
+from cinema_management.infrastructure.repositories.cached_screening_room_repository import CachedScreeningRoomRepository
 from cinema_management.infrastructure.repositories.movie_repository import MovieRepository
 from cinema_management.infrastructure.repositories.screening_room_repository import   Screening_roomRepository
 from cinema_management.infrastructure.repositories.repertoire_repository import  RepertoireRepository
 from cinema_management.infrastructure.repositories.reservation_repository import  ReservationRepository
+from cinema_management.infrastructure.repositories.report_repository import ReportRepository
 
 from cinema_management.infrastructure.services.movie_service import MovieService
 from cinema_management.infrastructure.services.screening_room_service import  ScreeningRoomService
 from cinema_management.infrastructure.services.repertoire_service import RepertoireService
 from cinema_management.infrastructure.services.reservation_service import ReservationService
+from cinema_management.infrastructure.services.report_service import ReportService
+from cinema_management.infrastructure.services.seat_inventory import SeatInventory
+from cinema_management.utils.cache import DailyCache, LRUCache
+from cinema_management.utils.invoice import init_invoice_executor
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
 
-    movie_repository = Singleton(MovieRepository)
-    screening_room_repository = Singleton(Screening_roomRepository)
-    repertoire_repository = Singleton(RepertoireRepository)
-    reservation_repository = Singleton(ReservationRepository)
+    movie_cache = Singleton(
+        LRUCache,
+        maxsize=config.CACHE_MAX_SIZE,
+        ttl=config.CACHE_TTL_SECONDS,
+    )
+    screening_room_cache = Singleton(
+        LRUCache,
+        maxsize=config.CACHE_MAX_SIZE,
+        ttl=config.CACHE_TTL_SECONDS,
+    )
+
+    movie_repository = Singleton(
+        CachedMovieRepository,
+        repository=Singleton(MovieRepository),
+        cache=movie_cache,
+    )
+    screening_room_repository = Singleton(
+        CachedScreeningRoomRepository,
+        repository=Singleton(Screening_roomRepository),
+        cache=screening_room_cache,
+    )
+    repertoire_repository = Singleton(
+        RepertoireRepository,
+        cleaning_buffer_minutes=config.CLEANING_BUFFER_MINUTES,
+    )
+    reservation_repository = Singleton(
+        ReservationRepository,
+        hold_ttl_seconds=config.SEAT_HOLD_TTL_SECONDS,
+    )
+    report_repository = Singleton(ReportRepository)
+
+    upcoming_movies_cache = Singleton(DailyCache)
+    seat_inventory = Singleton(SeatInventory)
+    invoice_executor = Resource(
+        init_invoice_executor,
+        max_workers=config.INVOICE_WORKERS,
+    )
 
 
 
     movie_service = Factory(
         MovieService,
         movie_repository=movie_repository,
+        upcoming_movies_cache=upcoming_movies_cache,
     )
     reservation_service = Factory(
         ReservationService,
         reservation_repository=reservation_repository,
-
+        invoice_executor=invoice_executor,
     )
 
     screening_room_service = Factory(
         ScreeningRoomService,
         screening_room_repository=screening_room_repository,
+        seat_inventory=seat_inventory,
     )
     repertoire_service = Factory(
         RepertoireService,
         repertoire_repository=repertoire_repository,
         reservation_service = reservation_service,
-        screening_room_service = screening_room_service
+        screening_room_service = screening_room_service,
+        seat_inventory=seat_inventory,
+        movie_service=movie_service,
+        cleaning_buffer_minutes=config.CLEANING_BUFFER_MINUTES,
+    )
+    report_service = Factory(
+        ReportService,
+        report_repository=report_repository,
     )
@@ -1,8 +1,12 @@
 """Module containing movie-related domain models"""
+from typing import Iterable, List
+
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 from datetime import date
 
+from cinema_management.core.domains.record import list_adapter, record_to_dict
+
 class MovieIn(BaseModel):
     """Model representing movie's DTO attributes."""
     name: str
@@ -26,12 +30,23 @@ class Movie(MovieIn):
         Returns:
             MovieDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            name=record_dict.get("name"),  # type: ignore
-            length=record_dict.get("length"), # type: ignore
-            premiere=record_dict.get("premiere"), # type: ignore
-            director=record_dict.get("director"), # type: ignore
+
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["Movie"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        All records are validated in a single call, which avoids paying
+        the per-instance validation overhead on large fetches.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[Movie]: The final DTO instances.
+        """
+
+        return list_adapter(cls).validate_python(
+            [record_to_dict(record) for record in records]
         )
\ No newline at end of file
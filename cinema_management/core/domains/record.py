@@ -0,0 +1,40 @@
+"""Module containing helpers shared by the domain models"""
+from functools import cache
+from typing import Any, List
+
+from asyncpg import Record
+from pydantic import BaseModel, TypeAdapter
+
+
+def record_to_dict(record: Record) -> dict[str, Any]:
+    """A function copying DB record values into a plain dict.
+
+    The `databases` record post-processes every column lookup in Python,
+    while the wrapped asyncpg row already holds the final values, so the
+    raw row is copied directly when available.
+
+    Args:
+        record (Record): The DB record.
+
+    Returns:
+        dict[str, Any]: The record values keyed by column name.
+    """
+
+    return dict(getattr(record, "_mapping", record))
+
+
+@cache
+def list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """A function building the validator of a list of models once.
+
+    Rows from the DB are validated rather than built with `model_construct`,
+    which is slower on pydantic 2.9 (see `benchmarks/records.py`).
+
+    Args:
+        model (type[BaseModel]): The model class.
+
+    Returns:
+        TypeAdapter: The adapter validating a list of the models.
+    """
+
+    return TypeAdapter(List[model])  # type: ignore
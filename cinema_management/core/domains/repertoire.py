@@ -1,10 +1,14 @@
 """Module containing repertoire-related domain models"""
 
+from typing import Iterable, List
+
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 from datetime import date
 from datetime import time
 
+from cinema_management.core.domains.record import list_adapter, record_to_dict
+
 class RepertoireIn(BaseModel):
     """Model representing repertoire's DTO attributes."""
     movie_id: int
@@ -28,12 +32,61 @@ class Repertoire(RepertoireIn):
         Returns:
             RepertoireDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            movie_id=record_dict.get("movie_id"),  # type: ignore
-            screening_room_id=record_dict.get("screening_room_id"), # type: ignore
-            start_time=record_dict.get("start_time"), # type: ignore
-            date=record_dict.get("date"), # type: ignore
-        )
\ No newline at end of file
+
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["Repertoire"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        All records are validated in a single call, which avoids paying
+        the per-instance validation overhead on large fetches.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[Repertoire]: The final DTO instances.
+        """
+
+        return list_adapter(cls).validate_python(
+            [record_to_dict(record) for record in records]
+        )
+
+class RepertoireSeats(BaseModel):
+    """Model representing seat occupancy of a repertoire."""
+    repertoire_id: int
+    capacity: int
+    taken_seats: int
+    available_seats: int
+
+    @classmethod
+    def from_record(cls, record: Record) -> "RepertoireSeats":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            RepertoireSeats: The final DTO instance.
+        """
+
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["RepertoireSeats"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        All records are validated in a single call, which avoids paying
+        the per-instance validation overhead on large fetches.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[RepertoireSeats]: The final DTO instances.
+        """
+
+        return list_adapter(cls).validate_python(
+            [record_to_dict(record) for record in records]
+        )
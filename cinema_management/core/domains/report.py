@@ -0,0 +1,45 @@
+"""Module containing report-related domain models"""
+from datetime import date
+from typing import Iterable, List
+
+from asyncpg import Record
+from pydantic import BaseModel
+
+from cinema_management.core.domains.record import list_adapter, record_to_dict
+
+
+class ReportKey(BaseModel):
+    """Model representing the grouping of report rows."""
+    date: date
+    movie_id: int
+    screening_room_id: int
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["ReportKey"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[ReportKey]: The final DTO instances.
+        """
+
+        return list_adapter(cls).validate_python(
+            [record_to_dict(record) for record in records]
+        )
+
+
+class OccupancyReport(ReportKey):
+    """Model representing seat occupancy of a day, movie and screening room."""
+    repertoires: int
+    capacity: int
+    reserved_seats: int
+    occupancy: float
+
+
+class RevenueReport(ReportKey):
+    """Model representing revenue of a day, movie and screening room."""
+    reservations: int
+    reserved_seats: int
+    revenue: float
@@ -1,6 +1,13 @@
 """Module containing reservation-related domain models"""
+from typing import Iterable, List, Optional
+
 from asyncpg import Record
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from cinema_management.core.domains.record import list_adapter, record_to_dict
+from cinema_management.core.domains.seat_map import Seat
+
+TICKET_PRICE = 30.00
 
 class ReservationIn(BaseModel):
     """Model representing reservation's DTO attributes."""
@@ -10,6 +17,33 @@ class ReservationIn(BaseModel):
     telephone: str
     email: str
     number_of_seats:int
+    seats: Optional[List[Seat]] = None
+
+    @model_validator(mode="after")
+    def check_seats(self) -> "ReservationIn":
+        """A method checking the picked seats match the number of seats.
+
+        Raises:
+            ValueError: If the seats are repeated or their number differs.
+
+        Returns:
+            ReservationIn: The validated reservation.
+        """
+
+        if self.seats is not None and \
+           not len(self.seats) == len(set(self.seats)) == self.number_of_seats:
+            raise ValueError("seats must list number_of_seats different seats")
+
+        return self
+
+    def get_price(self) -> float:
+        """A method calculating the price of the reservation.
+
+        Returns:
+            float: The price of all reserved seats.
+        """
+
+        return self.number_of_seats * TICKET_PRICE
 
 class Reservation(ReservationIn):
     """Model representing reservation's attributes in the database."""
@@ -27,17 +61,23 @@ class Reservation(ReservationIn):
         Returns:
             ReservationDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            repertoire_id=record_dict.get("repertoire_id"),  # type: ignore
-            firstName=record_dict.get("firstName"), # type: ignore
-            lastName=record_dict.get("lastName"), # type: ignore
-            telephone=record_dict.get("telephone"), # type: ignore
-            email=record_dict.get("email"), # type: ignore
-            number_of_seats=record_dict.get("number_of_seats"), # type: ignore
-        )
 
-    def get_price(self) -> float:
-        return self.number_of_seats * 30.00
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["Reservation"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        All records are validated in a single call, which avoids paying
+        the per-instance validation overhead on large fetches.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[Reservation]: The final DTO instances.
+        """
+
+        return list_adapter(cls).validate_python(
+            [record_to_dict(record) for record in records]
+        )
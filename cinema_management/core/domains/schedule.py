@@ -0,0 +1,302 @@
+"""Module containing schedule-related domain models"""
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+from typing import Iterable, Iterator, List, NamedTuple, Sequence
+
+from pydantic import BaseModel, Field, NonNegativeFloat, model_validator
+
+from cinema_management.core.domains.movie import Movie
+from cinema_management.core.domains.repertoire import RepertoireIn
+from cinema_management.core.domains.screeningroom import ScreeningRoom
+
+SCHEDULE_STEP = timedelta(minutes=5)
+
+
+class Showing(NamedTuple):
+    """Model representing the time a repertoire occupies its screening room."""
+    screening_room_id: int
+    start: datetime
+    end: datetime
+
+    @classmethod
+    def of(
+            cls,
+            screening_room_id: int,
+            day: date,
+            start_time: time,
+            length: float,
+            buffer: timedelta,
+    ) -> "Showing":
+        """A method for preparing the showing of a repertoire.
+
+        Args:
+            screening_room_id (int): The id of the screening room.
+            day (date): The date of the repertoire.
+            start_time (time): The start time of the repertoire.
+            length (float): The length of the movie in hours.
+            buffer (timedelta): The cleaning time after the movie.
+
+        Returns:
+            Showing: The occupied time of the room.
+        """
+
+        start = datetime.combine(day, start_time)
+
+        return cls(screening_room_id, start, start + timedelta(hours=length) + buffer)
+
+
+class Schedule:
+    """A class indexing showings per screening room and date.
+
+    Showings of a room and date are sorted by start, along with the running
+    maximum of their ends. The showings starting before a new one ends form
+    a prefix found by binary search, and the new showing overlaps one of
+    them exactly when the maximum end of the prefix is after its start, so
+    a check costs O(log n). Showings running past midnight are caught with
+    the last end of the previous date and the first start of the next one.
+    """
+
+    _starts: dict[tuple[int, date], List[datetime]]
+    _max_ends: dict[tuple[int, date], List[datetime]]
+
+    def __init__(self, showings: Iterable[Showing]) -> None:
+        """The initializer of the `schedule`.
+
+        Args:
+            showings (Iterable[Showing]): The showings of the schedule.
+        """
+        grouped: dict[tuple[int, date], List[Showing]] = defaultdict(list)
+        for showing in showings:
+            grouped[(showing.screening_room_id, showing.start.date())].append(showing)
+
+        self._starts = {}
+        self._max_ends = {}
+        for key, day in grouped.items():
+            day.sort()
+            self._starts[key] = [showing.start for showing in day]
+            self._max_ends[key] = list(accumulate((showing.end for showing in day), max))
+
+    def conflicts(self, showing: Showing) -> bool:
+        """The method checking if the showing overlaps any of the schedule.
+
+        Args:
+            showing (Showing): The new showing.
+
+        Returns:
+            bool: True if the room is occupied at that time.
+        """
+
+        day = showing.start.date()
+        key = (showing.screening_room_id, day)
+        earlier = bisect_left(self._starts.get(key, []), showing.end)
+        if earlier and self._max_ends[key][earlier - 1] > showing.start:
+            return True
+
+        previous_day = self._max_ends.get((showing.screening_room_id, day - timedelta(days=1)))
+        if previous_day and previous_day[-1] > showing.start:
+            return True
+
+        next_day = self._starts.get((showing.screening_room_id, day + timedelta(days=1)))
+
+        return bool(next_day) and next_day[0] < showing.end
+
+
+def find_conflicts(existing: Iterable[Showing], new: Sequence[Showing]) -> List[int]:
+    """Function finding new showings overlapping other showings in one sweep.
+
+    All showings are sorted by room and start once, then swept keeping the
+    latest end reached in the room. A showing starting before that end
+    overlaps the showing which reached it. Overlaps among the existing
+    showings alone are not reported.
+
+    Args:
+        existing (Iterable[Showing]): The scheduled showings.
+        new (Sequence[Showing]): The showings to add.
+
+    Returns:
+        List[int]: The positions of conflicting new showings.
+    """
+
+    events = sorted(
+        [(showing, None) for showing in existing]
+        + [(showing, index) for index, showing in enumerate(new)],
+        key=lambda event: (event[0].screening_room_id, event[0].start),
+    )
+
+    conflicts = set()
+    reach: Showing | None = None
+    reach_index: int | None = None
+    for showing, index in events:
+        if reach and reach.screening_room_id == showing.screening_room_id:
+            if showing.start < reach.end:
+                conflicts.update(i for i in (index, reach_index) if i is not None)
+            if showing.end <= reach.end:
+                continue
+        reach, reach_index = showing, index
+
+    return sorted(conflicts)
+
+
+class ScheduleRequest(BaseModel):
+    """Model representing the parameters of a generated schedule."""
+    week_start: date
+    days: int = Field(7, ge=1, le=31)
+    opening: time = time(10, 0)
+    closing: time = time(23, 0)
+    weights: dict[int, NonNegativeFloat] = Field(default_factory=dict)
+
+    @model_validator(mode="after")
+    def check_hours(self) -> "ScheduleRequest":
+        """A method checking the cinema closes after it opens.
+
+        Raises:
+            ValueError: If the closing time is not after the opening time.
+
+        Returns:
+            ScheduleRequest: The validated request.
+        """
+
+        if self.closing <= self.opening:
+            raise ValueError("closing must be after opening")
+
+        return self
+
+
+def generate_schedule(
+        movies: Iterable[Movie],
+        screening_rooms: Iterable[ScreeningRoom],
+        scheduled: Iterable[Showing],
+        request: ScheduleRequest,
+        buffer: timedelta,
+) -> List[RepertoireIn]:
+    """Function filling free screening room time with repertoires.
+
+    Every day, rooms are filled from the largest one, gap by gap between
+    the scheduled showings, from the opening time until the last showing
+    ends by the closing time. At each start the movie placed is the one
+    least shown relative to its demand weight, counting its screen time
+    so far, unless it would leave the end of the gap too short for any
+    movie. Movies are not shown before their premiere. Without weights,
+    all movies have the same demand. Movies which would not occupy the
+    room for any time, like ones of zero length without a buffer, are
+    skipped, as they could be placed at the same start forever.
+
+    Args:
+        movies (Iterable[Movie]): The movies to show.
+        screening_rooms (Iterable[ScreeningRoom]): The screening rooms.
+        scheduled (Iterable[Showing]): The showings already scheduled.
+        request (ScheduleRequest): The parameters of the schedule.
+        buffer (timedelta): The cleaning time after every movie.
+
+    Returns:
+        List[RepertoireIn]: The new repertoires, none overlapping.
+    """
+
+    movies = list(movies)
+    weights = request.weights or {movie.id: 1.0 for movie in movies}
+    durations = {
+        movie.id: duration
+        for movie in movies
+        if weights.get(movie.id, 0) > 0
+        and (duration := timedelta(hours=movie.length) + buffer) > timedelta(0)
+    }
+    screen_time = {movie_id: timedelta(0) for movie_id in durations}
+
+    busy: dict[int, List[Showing]] = defaultdict(list)
+    for showing in scheduled:
+        busy[showing.screening_room_id].append(showing)
+    rooms = sorted(screening_rooms, key=lambda room: room.number_of_seats(), reverse=True)
+
+    repertoires = []
+    for offset in range(request.days):
+        day = request.week_start + timedelta(days=offset)
+        released = [
+            movie.id for movie in movies
+            if movie.id in durations and movie.premiere <= day
+        ]
+        if not released:
+            continue
+        shortest = min(durations[movie_id] for movie_id in released)
+
+        for room in rooms:
+            for start, end in _free_gaps(
+                    busy[room.id],
+                    datetime.combine(day, request.opening),
+                    datetime.combine(day, request.closing),
+            ):
+                start = _round_up(start)
+                while fitting := [
+                    movie_id for movie_id in released
+                    if start + durations[movie_id] <= end
+                ]:
+                    movie_id = min(fitting, key=lambda movie_id: (
+                        _waste(end - start - durations[movie_id], shortest),
+                        (screen_time[movie_id] + durations[movie_id]) / weights[movie_id],
+                    ))
+                    repertoires.append(RepertoireIn(
+                        movie_id=movie_id,
+                        screening_room_id=room.id,
+                        start_time=start.time(),
+                        date=day,
+                    ))
+                    screen_time[movie_id] += durations[movie_id]
+                    start = _round_up(start + durations[movie_id])
+
+    return repertoires
+
+
+def _free_gaps(
+        showings: Iterable[Showing],
+        opening: datetime,
+        closing: datetime,
+) -> Iterator[tuple[datetime, datetime]]:
+    """Function listing the free time of a room between the showings.
+
+    Args:
+        showings (Iterable[Showing]): The showings in the room.
+        opening (datetime): The start of the day.
+        closing (datetime): The end of the day.
+
+    Returns:
+        Iterator[tuple[datetime, datetime]]: The starts and ends of free time.
+    """
+
+    start = opening
+    for showing in sorted(showings, key=lambda showing: showing.start):
+        if showing.end <= start or showing.start >= closing:
+            continue
+        if showing.start > start:
+            yield start, showing.start
+        start = max(start, showing.end)
+
+    if start < closing:
+        yield start, closing
+
+
+def _waste(left: timedelta, shortest: timedelta) -> timedelta:
+    """Function getting the time of a gap no movie can use any more.
+
+    Args:
+        left (timedelta): The time left in the gap.
+        shortest (timedelta): The duration of the shortest movie.
+
+    Returns:
+        timedelta: The time left if it is shorter than any movie, otherwise 0.
+    """
+
+    return left if left < shortest else timedelta(0)
+
+
+def _round_up(moment: datetime) -> datetime:
+    """Function rounding the moment up to the schedule step.
+
+    Args:
+        moment (datetime): The moment.
+
+    Returns:
+        datetime: The first start time at or after the moment.
+    """
+
+    return moment + (datetime.min - moment) % SCHEDULE_STEP
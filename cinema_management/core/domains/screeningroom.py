@@ -1,7 +1,11 @@
 """Module containing movie-related domain models"""
+from typing import Iterable, List
+
 from asyncpg import Record
 from pydantic import BaseModel, ConfigDict
 
+from cinema_management.core.domains.record import list_adapter, record_to_dict
+
 class ScreeningRoomIn(BaseModel):
     """Model representing movie's DTO attributes."""
     number: int
@@ -24,13 +28,25 @@ class ScreeningRoom(ScreeningRoomIn):
         Returns:
             Screening_roomDTO: The final DTO instance.
         """
-        record_dict = dict(record)
 
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            number=record_dict.get("number"),  # type: ignore
-            rows_count=record_dict.get("rows_count"), # type: ignore
-            seats_in_row=record_dict.get("seats_in_row"), # type: ignore
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["ScreeningRoom"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        All records are validated in a single call, which avoids paying
+        the per-instance validation overhead on large fetches.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[ScreeningRoom]: The final DTO instances.
+        """
+
+        return list_adapter(cls).validate_python(
+            [record_to_dict(record) for record in records]
         )
 
     def number_of_seats(self) -> int:
@@ -0,0 +1,34 @@
+"""Module containing seat hold-related domain models"""
+from datetime import datetime
+
+from asyncpg import Record
+from pydantic import BaseModel, ConfigDict, Field
+
+from cinema_management.core.domains.record import record_to_dict
+
+
+class SeatHoldIn(BaseModel):
+    """Model representing seat hold's DTO attributes."""
+    repertoire_id: int
+    number_of_seats: int = Field(gt=0)
+
+
+class SeatHold(SeatHoldIn):
+    """Model representing an active seat hold."""
+    id: str
+    expires_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @classmethod
+    def from_record(cls, record: Record) -> "SeatHold":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            SeatHold: The final DTO instance.
+        """
+
+        return cls.model_validate(record_to_dict(record))
@@ -0,0 +1,272 @@
+"""Module containing seat-level domain models"""
+import re
+from typing import Iterable, Iterator, List, NamedTuple
+
+from asyncpg import Record
+
+from cinema_management.core.domains.record import record_to_dict
+
+FREE_RUN = re.compile("0+")
+
+
+class Seat(NamedTuple):
+    """Model representing a single seat, both numbers counted from 1."""
+    row: int
+    seat: int
+
+
+class SeatMap:
+    """A class representing taken seats of a repertoire as a packed bitset.
+
+    Seats are stored row by row, one bit per seat, so a room of 14 rows
+    with 36 seats takes 63 bytes.
+    """
+
+    rows_count: int
+    seats_in_row: int
+    _bits: bytearray
+
+    def __init__(
+            self,
+            rows_count: int,
+            seats_in_row: int,
+            data: bytes | None = None,
+    ) -> None:
+        """The initializer of the `seat map`.
+
+        Args:
+            rows_count (int): The number of rows in the room.
+            seats_in_row (int): The number of seats in a row.
+            data (bytes | None, optional): The packed taken seats.
+                Defaults to None, meaning all seats are free.
+
+        Raises:
+            ValueError: If the data does not match the room size.
+        """
+        self.rows_count = rows_count
+        self.seats_in_row = seats_in_row
+        size = (rows_count * seats_in_row + 7) // 8
+        self._bits = bytearray(data) if data else bytearray(size)
+        if len(self._bits) != size:
+            raise ValueError("Seat map does not match the screening room size")
+
+    @classmethod
+    def from_record(cls, record: Record) -> "SeatMap":
+        """A method for preparing the seat map based on DB record.
+
+        Args:
+            record (Record): The DB record with `rows_count`, `seats_in_row`
+                and `seat_map` columns.
+
+        Returns:
+            SeatMap: The seat map of the repertoire.
+        """
+
+        values = record_to_dict(record)
+
+        return cls(values["rows_count"], values["seats_in_row"], values["seat_map"])
+
+    @property
+    def capacity(self) -> int:
+        """The number of seats in the room."""
+
+        return self.rows_count * self.seats_in_row
+
+    def contains(self, seat: Seat) -> bool:
+        """The method checking if the seat exists in the room.
+
+        Args:
+            seat (Seat): The seat.
+
+        Returns:
+            bool: True if the seat is within the room.
+        """
+
+        return 1 <= seat.row <= self.rows_count and 1 <= seat.seat <= self.seats_in_row
+
+    def is_free(self, seat: Seat) -> bool:
+        """The method checking if the seat is free.
+
+        Args:
+            seat (Seat): The seat within the room.
+
+        Returns:
+            bool: True if the seat is not taken.
+        """
+
+        index = self._index(seat)
+
+        return not self._bits[index >> 3] & (1 << (index & 7))
+
+    def count_free(self) -> int:
+        """The method counting free seats.
+
+        Returns:
+            int: The number of seats not taken.
+        """
+
+        return self.capacity - int.from_bytes(self._bits, "little").bit_count()
+
+    def taken(self) -> Iterator[Seat]:
+        """The method listing taken seats.
+
+        Returns:
+            Iterator[Seat]: The taken seats row by row.
+        """
+
+        for row in range(1, self.rows_count + 1):
+            for number in range(1, self.seats_in_row + 1):
+                seat = Seat(row, number)
+                if not self.is_free(seat):
+                    yield seat
+
+    def take(self, seats: Iterable[Seat]) -> bool:
+        """The method taking the seats if all of them exist and are free.
+
+        Args:
+            seats (Iterable[Seat]): The seats to take.
+
+        Returns:
+            bool: True if the seats were taken.
+        """
+
+        seats = list(seats)
+        if not all(self.contains(seat) and self.is_free(seat) for seat in seats):
+            return False
+
+        for seat in seats:
+            index = self._index(seat)
+            self._bits[index >> 3] |= 1 << (index & 7)
+
+        return True
+
+    def release(self, seats: Iterable[Seat]) -> None:
+        """The method freeing the seats.
+
+        Args:
+            seats (Iterable[Seat]): The seats to free, seats outside
+                the room are ignored.
+        """
+
+        for seat in seats:
+            if self.contains(seat):
+                index = self._index(seat)
+                self._bits[index >> 3] &= ~(1 << (index & 7))
+
+    def best_available(self, number_of_seats: int) -> List[Seat] | None:
+        """The method finding the best free seats for a group.
+
+        Adjacent seats in one row are preferred, the closer the block is
+        to the centre of the row and to the middle row, the better. If no
+        row has a long enough block, the group is split into the fewest
+        blocks possible, taking the longest free blocks first. The seats
+        are not taken.
+
+        Args:
+            number_of_seats (int): The size of the group.
+
+        Returns:
+            List[Seat] | None: The seats or None if not enough are free.
+        """
+
+        if number_of_seats < 1 or self.count_free() < number_of_seats:
+            return None
+
+        runs = self._free_runs()
+        seats: List[Seat] = []
+        remaining = number_of_seats
+        while remaining:
+            fitting = [run for run in runs if run[2] >= remaining]
+            if fitting:
+                row, start = min(
+                    (self._place(run, remaining) for run in fitting),
+                    key=lambda block: self._score(block[0], block[1], remaining),
+                )
+                length = remaining
+            else:
+                run = max(runs, key=lambda run: (run[2], -self._score(*run)))
+                runs.remove(run)
+                row, start, length = run
+
+            seats.extend(Seat(row, number) for number in range(start, start + length))
+            remaining -= length
+
+        return seats
+
+    def to_bytes(self) -> bytes:
+        """The method packing the seat map for storage.
+
+        Returns:
+            bytes: The packed taken seats.
+        """
+
+        return bytes(self._bits)
+
+    def _free_runs(self) -> List[tuple[int, int, int]]:
+        """A private method listing blocks of adjacent free seats.
+
+        Returns:
+            List[tuple[int, int, int]]: The row, the first seat and the
+                length of every block.
+        """
+
+        bits = int.from_bytes(self._bits, "little")
+        mask = (1 << self.seats_in_row) - 1
+        runs = []
+        for row in range(self.rows_count):
+            row_bits = (bits >> (row * self.seats_in_row)) & mask
+            # Reversed, so that the n-th character is the n-th seat.
+            seats = format(row_bits, f"0{self.seats_in_row}b")[::-1]
+            runs.extend(
+                (row + 1, match.start() + 1, match.end() - match.start())
+                for match in FREE_RUN.finditer(seats)
+            )
+
+        return runs
+
+    def _place(self, run: tuple[int, int, int], number_of_seats: int) -> tuple[int, int]:
+        """A private method placing a group in a block closest to the centre.
+
+        Args:
+            run (tuple[int, int, int]): The row, the first seat and the
+                length of the free block.
+            number_of_seats (int): The size of the group.
+
+        Returns:
+            tuple[int, int]: The row and the first seat of the group.
+        """
+
+        row, start, length = run
+        centred = round((self.seats_in_row + 1 - number_of_seats) / 2)
+
+        return row, min(max(centred, start), start + length - number_of_seats)
+
+    def _score(self, row: int, start: int, number_of_seats: int) -> float:
+        """A private method scoring a block of seats, lower is better.
+
+        Args:
+            row (int): The row of the block.
+            start (int): The first seat of the block.
+            number_of_seats (int): The length of the block.
+
+        Returns:
+            float: The distance from the centre of the room, relative
+                to its size.
+        """
+
+        column_offset = abs(start + (number_of_seats - 1) / 2 - (self.seats_in_row + 1) / 2)
+        row_offset = abs(row - (self.rows_count + 1) / 2)
+
+        return column_offset / self.seats_in_row + row_offset / self.rows_count
+
+    def _index(self, seat: Seat) -> int:
+        """A private method getting the bit index of the seat.
+
+        Args:
+            seat (Seat): The seat within the room.
+
+        Returns:
+            int: The index of the seat bit.
+        """
+
+        return (seat.row - 1) * self.seats_in_row + seat.seat - 1
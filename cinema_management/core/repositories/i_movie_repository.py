@@ -1,6 +1,7 @@
 """Module containing movie repository abstractions."""
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import Any, Iterable
 from cinema_management.core.domains.movie import MovieIn
 
@@ -8,13 +9,34 @@ class IMovieRepository(ABC):
     """An abstract class representing protocol of continent repository."""
 
     @abstractmethod
-    async def get_all_movies(self) -> Iterable[Any]:
-        """The abstract getting all movies from the data storage.
+    async def get_all_movies(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Any]:
+        """The abstract getting movies from the data storage ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of movies
+                to return. Defaults to None.
+            after (int | None, optional): Return only movies with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Any]: Movies in the data storage.
         """
 
+    @abstractmethod
+    async def get_upcoming_movies(self, after: date) -> Iterable[Any]:
+        """The abstract getting movies premiering after the provided date.
+
+        Args:
+            after (date): The date the premiere has to follow.
+
+        Returns:
+            Iterable[Any]: Upcoming movies ordered by premiere.
+        """
+
     @abstractmethod
     async def get_by_id(self, movie_id: int) -> Any | None:
         """The abstract getting movie by provided id.
@@ -37,6 +59,28 @@ class IMovieRepository(ABC):
             Any | None: The newly added movie.
         """
 
+    @abstractmethod
+    async def add_many(self, data: Iterable[MovieIn]) -> Iterable[Any]:
+        """The abstract adding many movies to the data storage at once.
+
+        Args:
+            data (Iterable[MovieIn]): The details of the new movies.
+
+        Returns:
+            Iterable[Any]: The newly added movies.
+        """
+
+    @abstractmethod
+    async def get_existing_ids(self, movie_ids: Iterable[int]) -> set[int]:
+        """The abstract getting which of the provided movie ids exist.
+
+        Args:
+            movie_ids (Iterable[int]): The ids to look up.
+
+        Returns:
+            set[int]: The ids present in the data storage.
+        """
+
     @abstractmethod
     async def update_movie(
             self,
@@ -1,7 +1,8 @@
 """Module containing repertoire repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from datetime import date, time
+from typing import Any, AsyncIterator, Iterable
 
 from cinema_management.core.domains.repertoire import RepertoireIn
 
@@ -10,13 +11,33 @@ class IRepertoireRepository(ABC):
     """An abstract class representing protocol of continent repository."""
 
     @abstractmethod
-    async def get_all_repertoires(self) -> Iterable[Any]:
-        """The abstract getting all repertoires from the data storage.
+    async def get_all_repertoires(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Any]:
+        """The abstract getting repertoires from the data storage ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of repertoires
+                to return. Defaults to None.
+            after (int | None, optional): Return only repertoires with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Any]: Repertoires in the data storage.
         """
 
+    @abstractmethod
+    def iterate_repertoires(self) -> AsyncIterator[Any]:
+        """The abstract streaming all repertoires from the data storage.
+
+        Rows are fetched with a server-side cursor, one at a time.
+
+        Returns:
+            AsyncIterator[Any]: Repertoires in the data storage ordered by id.
+        """
+
     @abstractmethod
     async def get_by_id(self, repertoire_id: int) -> Any | None:
         """The abstract getting repertoire by provided id.
@@ -28,6 +49,137 @@ class IRepertoireRepository(ABC):
             Any | None: The repertoire details.
         """
 
+    @abstractmethod
+    async def get_by_dates(
+            self,
+            from_date: date,
+            to_date: date,
+            from_time: time | None = None,
+            movie_id: int | None = None,
+            screening_room_id: int | None = None,
+            limit: int | None = None,
+            after: tuple[date, time, int] | None = None,
+    ) -> Iterable[Any]:
+        """The abstract getting repertoires within the dates ordered by time.
+
+        Args:
+            from_date (date): The first date of the repertoires.
+            to_date (date): The last date of the repertoires.
+            from_time (time | None, optional): The earliest start time on the
+                first date. Defaults to None.
+            movie_id (int | None, optional): The id of the movie. Defaults to None.
+            screening_room_id (int | None, optional): The id of the screening_room.
+                Defaults to None.
+            limit (int | None, optional): The maximum number of repertoires
+                to return. Defaults to None.
+            after (tuple[date, time, int] | None, optional): Return only
+                repertoires following this (date, start_time, id) cursor.
+                Defaults to None.
+
+        Returns:
+            Iterable[Any]: Repertoires within the dates.
+        """
+
+    @abstractmethod
+    async def get_by_movie_id(self, movie_id: int) -> Iterable[Any]:
+        """The abstract getting repertoires by provided movie id.
+
+        Args:
+            movie_id (int): The id of the movie.
+
+        Returns:
+            Iterable[Any]: Repertoires of the movie.
+        """
+
+    @abstractmethod
+    async def get_by_screening_room_id(self, screening_room_id: int) -> Iterable[Any]:
+        """The abstract getting repertoires by provided screening_room id.
+
+        Args:
+            screening_room_id (int): The id of the screening_room.
+
+        Returns:
+            Iterable[Any]: Repertoires of the screening_room.
+        """
+
+    @abstractmethod
+    async def exists_by_movie_id(self, movie_id: int) -> bool:
+        """The abstract checking if any repertoire of the movie exists.
+
+        Args:
+            movie_id (int): The id of the movie.
+
+        Returns:
+            bool: True if the movie has at least one repertoire.
+        """
+
+    @abstractmethod
+    async def exists_by_screening_room_id(self, screening_room_id: int) -> bool:
+        """The abstract checking if any repertoire in the screening_room exists.
+
+        Args:
+            screening_room_id (int): The id of the screening_room.
+
+        Returns:
+            bool: True if the screening_room has at least one repertoire.
+        """
+
+    @abstractmethod
+    async def get_seats(self, repertoire_id: int) -> Any | None:
+        """The abstract getting seat occupancy of the repertoire.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            Any | None: The capacity, taken and available seats.
+        """
+
+    @abstractmethod
+    async def get_seats_many(self, repertoire_ids: Iterable[int]) -> Iterable[Any]:
+        """The abstract getting seat occupancy of many repertoires at once.
+
+        Args:
+            repertoire_ids (Iterable[int]): The ids of the repertoires.
+
+        Returns:
+            Iterable[Any]: The seat occupancy of the existing repertoires.
+        """
+
+    @abstractmethod
+    async def get_seat_map(self, repertoire_id: int) -> Any | None:
+        """The abstract getting taken seats map of the repertoire.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            Any | None: The seat map if the repertoire exists.
+        """
+
+    @abstractmethod
+    async def get_seats_from_date(self, from_date: date) -> Iterable[Any]:
+        """The abstract getting seat occupancy of repertoires from the date on.
+
+        Args:
+            from_date (date): The first date of the repertoires.
+
+        Returns:
+            Iterable[Any]: The seat occupancy of the repertoires.
+        """
+
+    @abstractmethod
+    async def get_showings(self, from_date: date, to_date: date) -> Iterable[Any]:
+        """The abstract getting the time repertoires within the dates occupy their rooms.
+
+        Args:
+            from_date (date): The first date of the repertoires.
+            to_date (date): The last date of the repertoires.
+
+        Returns:
+            Iterable[Any]: The showings, including the cleaning buffer.
+        """
+
     @abstractmethod
     async def add_repertoire(self, data: RepertoireIn) -> Any | None:
         """The abstract adding new repertoire to the data storage.
@@ -36,7 +188,20 @@ class IRepertoireRepository(ABC):
             data (RepertoireIn): The details of the new repertoire.
 
         Returns:
-            Any | None: The newly added repertoire.
+            Any | None: The newly added repertoire or None if it overlaps
+                another repertoire in the screening room.
+        """
+
+    @abstractmethod
+    async def add_many(self, data: Iterable[RepertoireIn]) -> Iterable[Any] | None:
+        """The abstract adding many repertoires to the data storage at once.
+
+        Args:
+            data (Iterable[RepertoireIn]): The details of the new repertoires.
+
+        Returns:
+            Iterable[Any] | None: The newly added repertoires or None if any
+                of them overlaps another repertoire in its screening room.
         """
 
     @abstractmethod
@@ -52,7 +217,9 @@ class IRepertoireRepository(ABC):
             data (RepertoireIn): The details of the updated repertoire.
 
         Returns:
-            Any | None: The updated repertoire details.
+            Any | None: The updated repertoire details or None if it does not
+                exist, overlaps another repertoire in the screening room
+                or its reservations do not fit in the new room.
         """
 
     @abstractmethod
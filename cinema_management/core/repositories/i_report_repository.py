@@ -0,0 +1,45 @@
+"""Module containing report repository abstractions."""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Iterable
+
+
+class IReportRepository(ABC):
+    """An abstract class representing protocol of report repository."""
+
+    @abstractmethod
+    async def get_occupancy(self, from_date: date, to_date: date) -> Iterable[Any]:
+        """The abstract getting seat occupancy grouped by day, movie and screening room.
+
+        Args:
+            from_date (date): The first date of the report.
+            to_date (date): The last date of the report.
+
+        Returns:
+            Iterable[Any]: The occupancy rows.
+        """
+
+    @abstractmethod
+    async def get_revenue(self, from_date: date, to_date: date) -> Iterable[Any]:
+        """The abstract getting revenue grouped by day, movie and screening room.
+
+        Args:
+            from_date (date): The first date of the report.
+            to_date (date): The last date of the report.
+
+        Returns:
+            Iterable[Any]: The revenue rows.
+        """
+
+    @abstractmethod
+    async def rebuild_rollups(self) -> None:
+        """The abstract computing the repertoire rollups from all reservations."""
+
+    @abstractmethod
+    async def rollups_missing(self) -> bool:
+        """The abstract checking whether the rollups lack existing reservations.
+
+        Returns:
+            bool: True if there are reservations but no rollups.
+        """
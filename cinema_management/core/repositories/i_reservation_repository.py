@@ -1,22 +1,44 @@
 """Module containing reservation repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from datetime import date
+from typing import Any, AsyncIterator, Iterable
 
 from cinema_management.core.domains.reservation import ReservationIn
+from cinema_management.core.domains.seat_hold import SeatHoldIn
 
 
 class IReservationRepository(ABC):
     """An abstract class representing protocol of continent repository."""
 
     @abstractmethod
-    async def get_all_reservations(self) -> Iterable[Any]:
-        """The abstract getting all reservations from the data storage.
+    async def get_all_reservations(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Any]:
+        """The abstract getting reservations from the data storage ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of reservations
+                to return. Defaults to None.
+            after (int | None, optional): Return only reservations with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Any]: Reservations in the data storage.
         """
 
+    @abstractmethod
+    def iterate_reservations(self) -> AsyncIterator[Any]:
+        """The abstract streaming all reservations from the data storage.
+
+        Rows are fetched with a server-side cursor, one at a time.
+
+        Returns:
+            AsyncIterator[Any]: Reservations in the data storage ordered by id.
+        """
+
     @abstractmethod
     async def get_by_id(self, reservation_id: int) -> Any | None:
         """The abstract getting reservation by provided id.
@@ -28,17 +50,54 @@ class IReservationRepository(ABC):
             Any | None: The reservation details.
         """
 
+    @abstractmethod
+    async def get_by_repertoire_id(self, repertoire_id: int) -> Iterable[Any]:
+        """The abstract getting reservations by provided repertoire id.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            Iterable[Any]: Reservations of the repertoire.
+        """
+
+    @abstractmethod
+    async def get_by_dates(self, from_date: date, to_date: date) -> Iterable[Any]:
+        """The abstract getting reservations of repertoires within the dates.
 
+        Args:
+            from_date (date): The first date of the repertoires.
+            to_date (date): The last date of the repertoires.
+
+        Returns:
+            Iterable[Any]: Reservations of the repertoires ordered by id.
+        """
 
     @abstractmethod
-    async def add_reservation(self, data: ReservationIn) -> Any | None:
+    async def add_reservation(self, data: ReservationIn, hold_id: str | None = None) -> Any | None:
         """The abstract adding new reservation to the data storage.
 
         Args:
             data (ReservationIn): The details of the new reservation.
+            hold_id (str | None, optional): The id of the active hold whose
+                seats the reservation takes. Defaults to None.
+
+        Returns:
+            Any | None: The newly added reservation or None if the
+                repertoire does not exist, has not enough available seats
+                or the hold is not active for the same seats.
+        """
+
+    @abstractmethod
+    async def add_many(self, data: Iterable[ReservationIn]) -> Iterable[Any] | None:
+        """The abstract adding many reservations to the data storage at once.
+
+        Args:
+            data (Iterable[ReservationIn]): The details of the new reservations.
 
         Returns:
-            Any | None: The newly added reservation.
+            Iterable[Any] | None: The newly added reservations or None if any
+                repertoire does not exist or has not enough available seats.
         """
 
     @abstractmethod
@@ -54,16 +113,55 @@ class IReservationRepository(ABC):
             data (ReservationIn): The details of the updated reservation.
 
         Returns:
-            Any | None: The updated reservation details.
+            Any | None: The updated reservation details or None if it does
+                not exist or the repertoire has not enough available seats.
         """
 
     @abstractmethod
-    async def delete_reservation(self, reservation_id: int) -> bool:
+    async def delete_reservation(self, reservation_id: int) -> Any | None:
         """The abstract updating removing reservation from the data storage.
 
         Args:
             reservation_id (int): The id of the reservation.
 
         Returns:
-            bool: Success of the operation.
-        """
\ No newline at end of file
+            Any | None: The removed reservation.
+        """
+
+    @abstractmethod
+    async def add_hold(self, data: SeatHoldIn) -> Any | None:
+        """The abstract holding free seats of the repertoire for a limited time.
+
+        Args:
+            data (SeatHoldIn): The details of the hold.
+
+        Returns:
+            Any | None: The new hold or None if the repertoire does not
+                exist or has not enough available seats.
+        """
+
+    @abstractmethod
+    async def get_hold(self, hold_id: str) -> Any | None:
+        """The abstract getting the active seat hold.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            Any | None: The hold if it is active.
+        """
+
+    @abstractmethod
+    async def delete_hold(self, hold_id: str) -> Any | None:
+        """The abstract ending the active seat hold, freeing its seats.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            Any | None: The ended hold if it was active.
+        """
+
+    @abstractmethod
+    async def delete_expired_holds(self) -> None:
+        """The abstract removing holds past their expiry time."""
\ No newline at end of file
@@ -9,8 +9,18 @@ class IScreeningRoomRepository(ABC):
     """An abstract class representing protocol of continent repository."""
 
     @abstractmethod
-    async def get_all_screening_rooms(self) -> Iterable[Any]:
-        """The abstract getting all screening_rooms from the data storage.
+    async def get_all_screening_rooms(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Any]:
+        """The abstract getting screening_rooms from the data storage ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of screening_rooms
+                to return. Defaults to None.
+            after (int | None, optional): Return only screening_rooms with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Any]: Screening_rooms in the data storage.
@@ -38,6 +48,28 @@ class IScreeningRoomRepository(ABC):
             Any | None: The newly added screening_room.
         """
 
+    @abstractmethod
+    async def add_many(self, data: Iterable[ScreeningRoomIn]) -> Iterable[Any]:
+        """The abstract adding many screening_rooms to the data storage at once.
+
+        Args:
+            data (Iterable[ScreeningRoomIn]): The details of the new screening_rooms.
+
+        Returns:
+            Iterable[Any]: The newly added screening_rooms.
+        """
+
+    @abstractmethod
+    async def get_existing_ids(self, screening_room_ids: Iterable[int]) -> set[int]:
+        """The abstract getting which of the provided screening_room ids exist.
+
+        Args:
+            screening_room_ids (Iterable[int]): The ids to look up.
+
+        Returns:
+            set[int]: The ids present in the data storage.
+        """
+
     @abstractmethod
     async def update_screening_room(
             self,
@@ -51,7 +83,8 @@ class IScreeningRoomRepository(ABC):
             data (ScreeningRoomIn): The details of the updated screening_room.
 
         Returns:
-            Any | None: The updated screening_room details.
+            Any | None: The updated screening_room details or None if it
+                does not exist or the reservations do not fit in the new size.
         """
 
     @abstractmethod
@@ -8,8 +8,18 @@ class IMovieService(ABC):
     """A class representing movie repository."""
 
     @abstractmethod
-    async def get_all(self) -> Iterable[Movie]:
-        """The method getting all movies from the repository.
+    async def get_all(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Movie]:
+        """The method getting movies from the repository ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of movies
+                to return. Defaults to None.
+            after (int | None, optional): Return only movies with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Movie]: All movies.
@@ -45,6 +55,28 @@ class IMovieService(ABC):
             Movie | None: Full details of the newly added movie.
         """
 
+    @abstractmethod
+    async def add_many(self, data: Iterable[MovieIn]) -> Iterable[Movie]:
+        """The method adding many movies to the data storage at once.
+
+        Args:
+            data (Iterable[MovieIn]): The details of the new movies.
+
+        Returns:
+            Iterable[Movie]: Full details of the newly added movies.
+        """
+
+    @abstractmethod
+    async def get_existing_ids(self, movie_ids: Iterable[int]) -> set[int]:
+        """The method getting which of the provided movie ids exist.
+
+        Args:
+            movie_ids (Iterable[int]): The ids to look up.
+
+        Returns:
+            set[int]: The ids present in the data storage.
+        """
+
     @abstractmethod
     async def update_movie(
             self,
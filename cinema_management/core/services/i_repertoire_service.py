@@ -1,20 +1,43 @@
 """Module containing repertoire service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable, List
-from cinema_management.core.domains.repertoire import Repertoire, RepertoireIn
+from datetime import date, time
+from typing import AsyncIterator, Iterable, List, Mapping
+from cinema_management.core.domains.repertoire import Repertoire, RepertoireIn, RepertoireSeats
+from cinema_management.core.domains.reservation import Reservation, ReservationIn
+from cinema_management.core.domains.schedule import ScheduleRequest
+from cinema_management.core.domains.seat_hold import SeatHold, SeatHoldIn
+from cinema_management.core.domains.seat_map import SeatMap
 
 class IRepertoireService(ABC):
     """A class representing repertoire repository."""
 
     @abstractmethod
-    async def get_all(self) -> Iterable[Repertoire]:
-        """The method getting all repertoires from the repository.
+    async def get_all(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Repertoire]:
+        """The method getting repertoires from the repository ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of repertoires
+                to return. Defaults to None.
+            after (int | None, optional): Return only repertoires with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Repertoire]: All repertoires.
         """
 
+    @abstractmethod
+    def iterate_all(self) -> AsyncIterator[Repertoire]:
+        """The method streaming all repertoires from the repository.
+
+        Returns:
+            AsyncIterator[Repertoire]: All repertoires ordered by id.
+        """
+
     @abstractmethod
     async def get_by_id(self, repertoire_id: int) -> Repertoire | None:
         """The method getting repertoire by provided id.
@@ -37,6 +60,40 @@ class IRepertoireService(ABC):
             Repertoire | None: The repertoire details.
         """
 
+    @abstractmethod
+    async def get_by_dates(
+            self,
+            from_date: date | None = None,
+            to_date: date | None = None,
+            movie_id: int | None = None,
+            screening_room_id: int | None = None,
+            limit: int | None = None,
+            after: tuple[date, time, int] | None = None,
+    ) -> Iterable[Repertoire]:
+        """The method getting repertoires within the dates ordered by time.
+
+        Without the first date, the repertoires start from now, so past
+        showings are skipped. Without the last date, only repertoires of
+        the first date are returned.
+
+        Args:
+            from_date (date | None, optional): The first date of the repertoires.
+                Defaults to None.
+            to_date (date | None, optional): The last date of the repertoires.
+                Defaults to None.
+            movie_id (int | None, optional): The id of the movie. Defaults to None.
+            screening_room_id (int | None, optional): The id of the screening_room.
+                Defaults to None.
+            limit (int | None, optional): The maximum number of repertoires
+                to return. Defaults to None.
+            after (tuple[date, time, int] | None, optional): Return only
+                repertoires following this (date, start_time, id) cursor.
+                Defaults to None.
+
+        Returns:
+            Iterable[Repertoire]: Repertoires within the dates.
+        """
+
     @abstractmethod
     async def get_by_movie_id(self, movie_id: int) -> List[Repertoire] | None:
         """The method getting repertoire by provided movie id.
@@ -48,6 +105,61 @@ class IRepertoireService(ABC):
             Repertoire | None: The repertoire details.
         """
 
+    @abstractmethod
+    async def exists_by_movie_id(self, movie_id: int) -> bool:
+        """The method checking if any repertoire of the movie exists.
+
+        Args:
+            movie_id (int): The id of the movie.
+
+        Returns:
+            bool: True if the movie has at least one repertoire.
+        """
+
+    @abstractmethod
+    async def exists_by_screening_room_id(self, screening_room_id: int) -> bool:
+        """The method checking if any repertoire in the screening_room exists.
+
+        Args:
+            screening_room_id (int): The id of the screening_room.
+
+        Returns:
+            bool: True if the screening_room has at least one repertoire.
+        """
+
+    @abstractmethod
+    async def get_seats(self, repertoire_id: int) -> RepertoireSeats | None:
+        """The method getting seat occupancy by provided repertoire_id.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            RepertoireSeats | None: The capacity, taken and available seats.
+        """
+
+    @abstractmethod
+    async def get_seats_many(self, repertoire_ids: Iterable[int]) -> Iterable[RepertoireSeats]:
+        """The method getting seat occupancy of many repertoires at once.
+
+        Args:
+            repertoire_ids (Iterable[int]): The ids of the repertoires.
+
+        Returns:
+            Iterable[RepertoireSeats]: The seat occupancy of the existing repertoires.
+        """
+
+    @abstractmethod
+    async def get_seat_map(self, repertoire_id: int) -> SeatMap | None:
+        """The method getting taken seats map by provided repertoire_id.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            SeatMap | None: The seat map if the repertoire exists.
+        """
+
     @abstractmethod
     async def number_of_taken_seats(self, repertoire_id: int) -> int:
         """The method getting number of taken seats by provided repertoire_id.
@@ -60,16 +172,117 @@ class IRepertoireService(ABC):
         """
 
     @abstractmethod
-    async def available_seats(self, repertoire_id: int) -> int:
+    async def available_seats(self, repertoire_id: int) -> int | None:
         """The method getting number of free seats by provided repertoire_id.
 
         Args:
             repertoire_id (int): The id of the repertoire.
 
         Returns:
-            number of free seats.
+            int | None: The number of free seats if the repertoire exists.
+        """
+
+    @abstractmethod
+    async def available_seats_many(self, repertoire_ids: Iterable[int]) -> dict[int, int]:
+        """The method getting number of free seats of many repertoires at once.
+
+        Args:
+            repertoire_ids (Iterable[int]): The ids of the repertoires.
+
+        Returns:
+            dict[int, int]: The number of free seats by id of existing repertoires.
         """
 
+    @abstractmethod
+    async def reserve_seats(self, repertoire_id: int, number_of_seats: int) -> bool:
+        """The method taking free seats of the repertoire.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+            number_of_seats (int): The number of seats to take.
+
+        Returns:
+            bool: True if the seats were taken.
+        """
+
+    @abstractmethod
+    async def reserve_seats_many(self, number_of_seats: Mapping[int, int]) -> bool:
+        """The method taking free seats of many repertoires, all or nothing.
+
+        Args:
+            number_of_seats (Mapping[int, int]): The number of seats by repertoire id.
+
+        Returns:
+            bool: True if the seats were taken.
+        """
+
+    @abstractmethod
+    def release_seats(self, repertoire_id: int, number_of_seats: int) -> None:
+        """The method giving taken seats of the repertoire back.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+            number_of_seats (int): The number of seats to give back.
+        """
+
+    @abstractmethod
+    def release_seats_many(self, number_of_seats: Mapping[int, int]) -> None:
+        """The method giving taken seats of many repertoires back.
+
+        Args:
+            number_of_seats (Mapping[int, int]): The number of seats by repertoire id.
+        """
+
+    @abstractmethod
+    async def hold_seats(self, data: SeatHoldIn) -> SeatHold | None:
+        """The method holding free seats of the repertoire for a limited time.
+
+        Args:
+            data (SeatHoldIn): The details of the hold.
+
+        Returns:
+            SeatHold | None: The new hold or None if not enough seats are free.
+        """
+
+    @abstractmethod
+    async def get_hold(self, hold_id: str) -> SeatHold | None:
+        """The method getting the active seat hold.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            SeatHold | None: The hold if it is active.
+        """
+
+    @abstractmethod
+    async def release_hold(self, hold_id: str) -> SeatHold | None:
+        """The method ending the seat hold, freeing its seats.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            SeatHold | None: The ended hold if it was active.
+        """
+
+    @abstractmethod
+    async def confirm_hold(self, hold_id: str, data: ReservationIn) -> Reservation | None:
+        """The method turning the seat hold into a reservation.
+
+        Args:
+            hold_id (str): The id of the hold.
+            data (ReservationIn): The details of the reservation matching the hold.
+
+        Returns:
+            Reservation | None: The new reservation or None if the hold is not
+                active for the same seats or the seats are not free any more.
+        """
+
+    @abstractmethod
+    async def reconcile_seats(self) -> None:
+        """The method reloading free seats of upcoming repertoires from the repository."""
+
     @abstractmethod
     async def add_repertoire(self, data: RepertoireIn) -> Repertoire | None:
         """The method adding new repertoire to the data storage.
@@ -78,7 +291,31 @@ class IRepertoireService(ABC):
             data (RepertoireIn): The details of the new repertoire.
 
         Returns:
-            Repertoire | None: Full details of the newly added repertoire.
+            Repertoire | None: Full details of the newly added repertoire or None
+                if it overlaps another repertoire in the screening room.
+        """
+
+    @abstractmethod
+    async def add_many(self, data: Iterable[RepertoireIn]) -> Iterable[Repertoire] | None:
+        """The method adding many repertoires to the data storage at once.
+
+        Args:
+            data (Iterable[RepertoireIn]): The details of the new repertoires.
+
+        Returns:
+            Iterable[Repertoire] | None: Full details of the newly added repertoires
+                or None if any of them overlaps another repertoire in its screening room.
+        """
+
+    @abstractmethod
+    async def generate_schedule(self, request: ScheduleRequest) -> List[RepertoireIn]:
+        """The method planning repertoires filling the free screening room time.
+
+        Args:
+            request (ScheduleRequest): The parameters of the schedule.
+
+        Returns:
+            List[RepertoireIn]: The planned repertoires, not saved.
         """
 
     @abstractmethod
@@ -94,7 +331,9 @@ class IRepertoireService(ABC):
             data (RepertoireIn): The details of the updated repertoire.
 
         Returns:
-            Repertoire | None: The updated repertoire details.
+            Repertoire | None: The updated repertoire details or None if it does not
+                exist, overlaps another repertoire in the screening room
+                or its reservations do not fit in the new room.
         """
 
     @abstractmethod
@@ -0,0 +1,47 @@
+"""Module containing report service abstractions."""
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterable
+
+from cinema_management.core.domains.report import OccupancyReport, RevenueReport
+
+
+class IReportService(ABC):
+    """A class representing report service."""
+
+    @abstractmethod
+    async def get_occupancy(self, from_date: date, to_date: date) -> Iterable[OccupancyReport]:
+        """The method getting seat occupancy grouped by day, movie and screening room.
+
+        Args:
+            from_date (date): The first date of the report.
+            to_date (date): The last date of the report.
+
+        Returns:
+            Iterable[OccupancyReport]: The occupancy rows.
+        """
+
+    @abstractmethod
+    async def get_revenue(self, from_date: date, to_date: date) -> Iterable[RevenueReport]:
+        """The method getting revenue grouped by day, movie and screening room.
+
+        Args:
+            from_date (date): The first date of the report.
+            to_date (date): The last date of the report.
+
+        Returns:
+            Iterable[RevenueReport]: The revenue rows.
+        """
+
+    @abstractmethod
+    async def rebuild_rollups(self) -> None:
+        """The method computing the report rollups from all reservations."""
+
+    @abstractmethod
+    async def rollups_missing(self) -> bool:
+        """The method checking whether the report rollups lack existing reservations.
+
+        Returns:
+            bool: True if there are reservations but no rollups.
+        """
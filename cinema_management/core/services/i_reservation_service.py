@@ -1,22 +1,42 @@
 """Module containing reservation service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable, List
+from datetime import date
+from typing import AsyncIterator, Iterable, List
 
 from cinema_management.core.domains.reservation import Reservation, ReservationIn
+from cinema_management.core.domains.seat_hold import SeatHold, SeatHoldIn
 
 
 class IReservationService(ABC):
     """A class representing reservation repository."""
 
     @abstractmethod
-    async def get_all(self) -> Iterable[Reservation]:
-        """The method getting all reservations from the repository.
+    async def get_all(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Reservation]:
+        """The method getting reservations from the repository ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of reservations
+                to return. Defaults to None.
+            after (int | None, optional): Return only reservations with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Reservation]: All reservations.
         """
 
+    @abstractmethod
+    def iterate_all(self) -> AsyncIterator[Reservation]:
+        """The method streaming all reservations from the repository.
+
+        Returns:
+            AsyncIterator[Reservation]: All reservations ordered by id.
+        """
+
     @abstractmethod
     async def get_by_id(self, reservation_id: int) -> Reservation | None:
         """The method getting reservation by provided id.
@@ -51,26 +71,71 @@ class IReservationService(ABC):
         """
 
     @abstractmethod
-    async def invoice(self,reservation_id: id,address: str) -> dict:
-        """The method getting invoice by provided repertoire_id.
+    async def invoice(self, reservation_id: int, address: str) -> dict | None:
+        """The method getting invoice by provided reservation_id.
+
+        Args:
+            reservation_id (int): The id of the reservation.
+            address (str): The address of the buyer.
+
+        Returns:
+            dict | None: The invoice if the reservation exists.
+        """
+
+    @abstractmethod
+    def invoices(
+            self,
+            repertoire_id: int | None = None,
+            from_date: date | None = None,
+            to_date: date | None = None,
+    ) -> AsyncIterator[tuple[str, bytes]]:
+        """The method rendering invoices of a repertoire or of repertoires within the dates.
+
+        The reservations do not store the addresses of the buyers, so
+        they are left off these invoices.
 
         Args:
-            reservation_id (int): The id of the repertoire.
-            address (str): The address.
+            repertoire_id (int | None, optional): The id of the repertoire.
+                Defaults to None.
+            from_date (date | None, optional): The first date of the repertoires,
+                used without the repertoire_id. Defaults to None.
+            to_date (date | None, optional): The last date of the repertoires,
+                used without the repertoire_id. Defaults to None.
 
         Returns:
-            invoice.
+            AsyncIterator[tuple[str, bytes]]: The file names and HTML documents
+                of the invoices.
         """
 
     @abstractmethod
-    async def add_reservation(self, data: ReservationIn) -> Reservation | None:
+    async def add_reservation(
+            self,
+            data: ReservationIn,
+            hold_id: str | None = None,
+    ) -> Reservation | None:
         """The method adding new reservation to the data storage.
 
         Args:
             data (ReservationIn): The details of the new reservation.
+            hold_id (str | None, optional): The id of the active hold whose
+                seats the reservation takes. Defaults to None.
+
+        Returns:
+            Reservation | None: Full details of the newly added reservation or None
+                if the repertoire does not exist, has not enough available seats
+                or the hold is not active for the same seats.
+        """
+
+    @abstractmethod
+    async def add_many(self, data: Iterable[ReservationIn]) -> Iterable[Reservation] | None:
+        """The method adding many reservations to the data storage at once.
+
+        Args:
+            data (Iterable[ReservationIn]): The details of the new reservations.
 
         Returns:
-            Reservation | None: Full details of the newly added reservation.
+            Iterable[Reservation] | None: The newly added reservations or None if any
+                repertoire does not exist or has not enough available seats.
         """
 
     @abstractmethod
@@ -86,16 +151,55 @@ class IReservationService(ABC):
             data (ReservationIn): The details of the updated reservation.
 
         Returns:
-            Reservation | None: The updated reservation details.
+            Reservation | None: The updated reservation details or None if it does
+                not exist or the repertoire has not enough available seats.
         """
 
     @abstractmethod
-    async def delete_reservation(self, reservation_id: int) -> bool:
+    async def delete_reservation(self, reservation_id: int) -> Reservation | None:
         """The method updating removing reservation from the data storage.
 
         Args:
             reservation_id (int): The id of the reservation.
 
         Returns:
-            bool: Success of the operation.
-        """
\ No newline at end of file
+            Reservation | None: The removed reservation.
+        """
+
+    @abstractmethod
+    async def add_hold(self, data: SeatHoldIn) -> SeatHold | None:
+        """The method holding free seats of the repertoire for a limited time.
+
+        Args:
+            data (SeatHoldIn): The details of the hold.
+
+        Returns:
+            SeatHold | None: The new hold or None if the repertoire does not
+                exist or has not enough available seats.
+        """
+
+    @abstractmethod
+    async def get_hold(self, hold_id: str) -> SeatHold | None:
+        """The method getting the active seat hold.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            SeatHold | None: The hold if it is active.
+        """
+
+    @abstractmethod
+    async def delete_hold(self, hold_id: str) -> SeatHold | None:
+        """The method ending the active seat hold, freeing its seats.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            SeatHold | None: The ended hold if it was active.
+        """
+
+    @abstractmethod
+    async def delete_expired_holds(self) -> None:
+        """The method removing holds past their expiry time."""
\ No newline at end of file
@@ -9,8 +9,18 @@ class IScreeningRoomService(ABC):
     """A class representing screening_room repository."""
 
     @abstractmethod
-    async def get_all(self) -> Iterable[ScreeningRoom]:
-        """The method getting all screening_rooms from the repository.
+    async def get_all(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[ScreeningRoom]:
+        """The method getting screening_rooms from the repository ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of screening_rooms
+                to return. Defaults to None.
+            after (int | None, optional): Return only screening_rooms with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[ScreeningRoom]: All screening_rooms.
@@ -42,6 +52,28 @@ class IScreeningRoomService(ABC):
             ScreeningRoom | None: Full details of the newly added screening_room.
         """
 
+    @abstractmethod
+    async def add_many(self, data: Iterable[ScreeningRoomIn]) -> Iterable[ScreeningRoom]:
+        """The method adding many screening_rooms to the data storage at once.
+
+        Args:
+            data (Iterable[ScreeningRoomIn]): The details of the new screening_rooms.
+
+        Returns:
+            Iterable[ScreeningRoom]: Full details of the newly added screening_rooms.
+        """
+
+    @abstractmethod
+    async def get_existing_ids(self, screening_room_ids: Iterable[int]) -> set[int]:
+        """The method getting which of the provided screening_room ids exist.
+
+        Args:
+            screening_room_ids (Iterable[int]): The ids to look up.
+
+        Returns:
+            set[int]: The ids present in the data storage.
+        """
+
     @abstractmethod
     async def update_screening_room(
             self,
@@ -55,7 +87,8 @@ class IScreeningRoomService(ABC):
             data (ScreeningRoomIn): The details of the updated screening_room.
 
         Returns:
-            ScreeningRoom | None: The updated screening_room details.
+            ScreeningRoom | None: The updated screening_room details or None if it
+                does not exist or the reservations do not fit in the new size.
         """
 
     @abstractmethod
@@ -1,11 +1,18 @@
 """A module providing database access."""
 
 import asyncio
+import itertools
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
 
 import databases
 import sqlalchemy
-from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
+from asyncpg import Record  # type: ignore
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.schema import CreateIndex, CreateTable
 from asyncpg.exceptions import (    # type: ignore
     CannotConnectNowError,
     ConnectionDoesNotExistError,
@@ -22,7 +29,7 @@ movies_table = sqlalchemy.Table(
     sqlalchemy.Column("id",sqlalchemy.Integer,primary_key=True),
     sqlalchemy.Column("name",sqlalchemy.String),
     sqlalchemy.Column("length",sqlalchemy.Float),
-    sqlalchemy.Column("premiere",sqlalchemy.Date),
+    sqlalchemy.Column("premiere",sqlalchemy.Date,index=True),
     sqlalchemy.Column("director",sqlalchemy.String),
 )
 
@@ -41,44 +48,224 @@ repertoires_table = sqlalchemy.Table(
     "repertoires",
     metadata,
     sqlalchemy.Column("id",sqlalchemy.Integer,primary_key=True),
-    sqlalchemy.Column("movie_id",sqlalchemy.ForeignKey("movies.id"),nullable=False),
-    sqlalchemy.Column("screening_room_id",sqlalchemy.ForeignKey("screening_rooms.id"),nullable=False),
+    sqlalchemy.Column("movie_id",sqlalchemy.ForeignKey("movies.id"),nullable=False,index=True),
+    sqlalchemy.Column("screening_room_id",sqlalchemy.ForeignKey("screening_rooms.id"),nullable=False,index=True),
     sqlalchemy.Column("start_time",sqlalchemy.Time),
     sqlalchemy.Column("date",sqlalchemy.Date),
+    sqlalchemy.Column("seat_map",sqlalchemy.LargeBinary,nullable=True),
+    sqlalchemy.Index("ix_repertoires_date_start_time","date","start_time"),
 
 )
 reservations_table = sqlalchemy.Table(
     "reservations",
     metadata,
     sqlalchemy.Column("id",sqlalchemy.Integer,primary_key=True),
-    sqlalchemy.Column("repertoire_id",sqlalchemy.ForeignKey("repertoires.id"),nullable=False),
+    sqlalchemy.Column("repertoire_id",sqlalchemy.ForeignKey("repertoires.id"),nullable=False,index=True),
     sqlalchemy.Column("firstName",sqlalchemy.String),
     sqlalchemy.Column("lastName",sqlalchemy.String),
     sqlalchemy.Column("telephone",sqlalchemy.String),
     sqlalchemy.Column("email",sqlalchemy.String),
     sqlalchemy.Column("number_of_seats",sqlalchemy.Integer),
+    sqlalchemy.Column("seats",ARRAY(sqlalchemy.Integer,dimensions=2),nullable=True),
 
 )
-db_uri = (
-    f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
-    f"@{config.DB_HOST}/{config.DB_NAME}"
+repertoire_rollups_table = sqlalchemy.Table(
+    "repertoire_rollups",
+    metadata,
+    sqlalchemy.Column(
+        "repertoire_id",
+        sqlalchemy.ForeignKey("repertoires.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("reservations",sqlalchemy.Integer,nullable=False),
+    sqlalchemy.Column("reserved_seats",sqlalchemy.Integer,nullable=False),
+    sqlalchemy.Column("revenue",sqlalchemy.Numeric(12, 2),nullable=False),
 )
-
-engine = create_async_engine(
-    db_uri,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
+seat_holds_table = sqlalchemy.Table(
+    "seat_holds",
+    metadata,
+    sqlalchemy.Column("id",sqlalchemy.String,primary_key=True),
+    sqlalchemy.Column(
+        "repertoire_id",
+        sqlalchemy.ForeignKey("repertoires.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    ),
+    sqlalchemy.Column("number_of_seats",sqlalchemy.Integer,nullable=False),
+    sqlalchemy.Column("expires_at",sqlalchemy.DateTime(timezone=True),nullable=False,index=True),
 )
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+
+def get_db_uri(host: str | None) -> str:
+    """Function building the URI of the configured DB on the host.
+
+    Args:
+        host (str | None): The host of the DB server.
+
+    Returns:
+        str: The DB URI.
+    """
+    return (
+        f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
+        f"@{host}/{config.DB_NAME}"
+    )
+
+
+db_uri = get_db_uri(config.DB_HOST)
+
+pool_options = {
+    "min_size": config.DB_POOL_MIN_SIZE,
+    "max_size": config.DB_POOL_MAX_SIZE,
+    "max_inactive_connection_lifetime": config.DB_MAX_INACTIVE_CONNECTION_LIFETIME,
+    "server_settings": {
+        "statement_timeout": str(int(config.DB_STATEMENT_TIMEOUT * 1000)),
+    },
+}
 
 database = databases.Database(
     db_uri,
-    force_rollback=True,
+    force_rollback=config.DB_FORCE_ROLLBACK,
+    **pool_options,
 )
 
+replicas = [
+    databases.Database(get_db_uri(host.strip()), **pool_options)
+    for host in (config.DB_REPLICA_HOSTS or "").split(",")
+    if host.strip() and not config.DB_FORCE_ROLLBACK
+]
+_next_replica = itertools.cycle(replicas)
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+_primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+
+def reader() -> databases.Database:
+    """Function getting the DB serving read-only queries.
+
+    Replicas are used in turn, unless the current request has already
+    written to the primary, which then serves its reads as well.
+
+    Returns:
+        databases.Database: The replica or the primary DB.
+    """
+    if not replicas or _primary_pinned.get() or _primary_reads.get():
+        return database
+
+    return next(_next_replica)
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Function serving the reads made inside the block by the primary.
+
+    It is meant for reads whose results outlive the request, like cache
+    refills, which must not keep the data of a lagging replica.
+
+    Yields:
+        None: Nothing, the reads are routed while the block runs.
+    """
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+def writer() -> databases.Database:
+    """Function getting the DB serving writes.
+
+    Later reads of the current request are served by the primary too,
+    so they see the written data.
+
+    Returns:
+        databases.Database: The primary DB.
+    """
+    _primary_pinned.set(True)
+
+    return database
+
+if config.DB_ECHO:
+    logging.getLogger("databases").setLevel(logging.DEBUG)
+    logging.getLogger("databases").addHandler(logging.StreamHandler())
+
+class CompiledQuery:
+    """A class holding a query compiled to SQL once.
+
+    The query is run directly on the asyncpg connection, which keeps it
+    as a prepared statement, so neither SQLAlchemy compilation nor
+    statement planning is repeated on later calls.
+
+    Usage:
+        query = CompiledQuery(
+            select(movies_table)
+            .where(movies_table.c.id == sqlalchemy.bindparam("movie_id"))
+        )
+        record = await query.fetch_one(movie_id=1)
+    """
+
+    sql: str
+    _params: tuple[str, ...]
+
+    def __init__(self, query: sqlalchemy.ClauseElement) -> None:
+        """The initializer of the `compiled query`.
+
+        Args:
+            query (sqlalchemy.ClauseElement): The query with named bind parameters.
+        """
+        compiled = query.compile(dialect=asyncpg_dialect())
+        self.sql = str(compiled)
+        self._params = tuple(compiled.positiontup or ())
+
+    async def fetch_one(self, **params: Any) -> Record | None:
+        """The method running the query and getting the first row.
+
+        Args:
+            **params (Any): The values of the bind parameters.
+
+        Returns:
+            Record | None: The first row if any.
+        """
+
+        async with reader().connection() as connection:
+            return await connection.raw_connection.fetchrow(
+                self.sql,
+                *(params[name] for name in self._params),
+            )
+
+
+# Serializes schema creation of app instances starting at the same time.
+SCHEMA_LOCK_ID = 0x63696E656D61
+
+# Columns added to tables after their first release. Creating a table
+# which already exists does not add its new columns.
+ADDED_COLUMNS = [
+    repertoires_table.c.seat_map,
+    reservations_table.c.seats,
+]
+
+
+def add_column_ddl(column: sqlalchemy.Column) -> str:
+    """Function building the statement adding the column if it is missing.
+
+    Args:
+        column (sqlalchemy.Column): The nullable column to add.
+
+    Returns:
+        str: The ALTER TABLE statement.
+    """
+    dialect = asyncpg_dialect()
+    preparer = dialect.identifier_preparer
+
+    return (
+        f"ALTER TABLE {preparer.format_table(column.table)} "
+        f"ADD COLUMN IF NOT EXISTS {preparer.format_column(column)} "
+        f"{column.type.compile(dialect=dialect)}"
+    )
+
 
 async def init_db(retries: int = 5, delay: int = 5) -> None:
-    """Function initializing the DB.
+    """Function connecting to the DB and creating missing tables and columns.
 
     Args:
         retries (int, optional): Number of retries of connect to DB.
@@ -87,16 +274,36 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
     """
     for attempt in range(retries):
         try:
-            async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
-            return
+            await database.connect()
+            for replica in replicas:
+                await replica.connect()
+            break
         except (
-                OperationalError,
-                DatabaseError,
+                OSError,
                 CannotConnectNowError,
                 ConnectionDoesNotExistError,
         ) as e:
             print(f"Attempt {attempt + 1} failed: {e}")
             await asyncio.sleep(delay)
+    else:
+        raise ConnectionError("Could not connect to DB after several retries.")
+
+    async with database.transaction():
+        await database.execute(
+            sqlalchemy.select(sqlalchemy.func.pg_advisory_xact_lock(SCHEMA_LOCK_ID))
+        )
+        for table in metadata.sorted_tables:
+            await database.execute(CreateTable(table, if_not_exists=True))
+        for column in ADDED_COLUMNS:
+            await database.execute(add_column_ddl(column))
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                await database.execute(CreateIndex(index, if_not_exists=True))
+
 
-    raise ConnectionError("Could not connect to DB after several retries.")
\ No newline at end of file
+async def close_db() -> None:
+    """Function disconnecting from the DB and its replicas."""
+    for replica in replicas:
+        if replica.is_connected:
+            await replica.disconnect()
+    await database.disconnect()
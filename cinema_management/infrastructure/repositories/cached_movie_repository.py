@@ -0,0 +1,153 @@
+"""Module containing caching movie repository implementation."""
+
+from datetime import date
+from typing import Any, Iterable
+
+from cinema_management.core.repositories.i_movie_repository import IMovieRepository
+from cinema_management.core.domains.movie import MovieIn
+from cinema_management.db import primary_reads
+from cinema_management.utils.cache import LRUCache
+
+
+class CachedMovieRepository(IMovieRepository):
+    """A class caching movies read by id from the wrapped repository."""
+
+    _repository: IMovieRepository
+    _cache: LRUCache
+
+    def __init__(self, repository: IMovieRepository, cache: LRUCache) -> None:
+        """The initializer of the `cached movie repository`.
+
+        Args:
+            repository (IMovieRepository): The wrapped repository.
+            cache (LRUCache): The cache of movies keyed by id.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def get_all_movies(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Any]:
+        """The method getting movies from the data storage ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of movies
+                to return. Defaults to None.
+            after (int | None, optional): Return only movies with id
+                greater than this cursor. Defaults to None.
+
+        Returns:
+            Iterable[Any]: Movies in the data storage.
+        """
+
+        return await self._repository.get_all_movies(limit=limit, after=after)
+
+    async def get_upcoming_movies(self, after: date) -> Iterable[Any]:
+        """The method getting movies premiering after the provided date.
+
+        Args:
+            after (date): The date the premiere has to follow.
+
+        Returns:
+            Iterable[Any]: Upcoming movies ordered by premiere.
+        """
+
+        return await self._repository.get_upcoming_movies(after)
+
+    async def get_by_id(self, movie_id: int) -> Any | None:
+        """The method getting movie by provided id.
+
+        Args:
+            movie_id (int): The id of the movie.
+
+        Returns:
+            Any | None: The movie details.
+        """
+
+        if (movie := self._cache.get(movie_id)) is None:
+            with primary_reads():
+                movie = await self._repository.get_by_id(movie_id)
+            if movie is not None:
+                self._cache.set(movie_id, movie)
+
+        return movie
+
+    async def add_movie(self, data: MovieIn) -> Any | None:
+        """The method adding new movie to the data storage.
+
+        Args:
+            data (MovieIn): The details of the new movie.
+
+        Returns:
+            Any | None: The newly added movie.
+        """
+
+        return await self._repository.add_movie(data)
+
+    async def add_many(self, data: Iterable[MovieIn]) -> Iterable[Any]:
+        """The method adding many movies to the data storage at once.
+
+        Args:
+            data (Iterable[MovieIn]): The details of the new movies.
+
+        Returns:
+            Iterable[Any]: The newly added movies.
+        """
+
+        return await self._repository.add_many(data)
+
+    async def get_existing_ids(self, movie_ids: Iterable[int]) -> set[int]:
+        """The method getting which of the provided movie ids exist.
+
+        Only ids missing from the cache are looked up in the data storage.
+
+        Args:
+            movie_ids (Iterable[int]): The ids to look up.
+
+        Returns:
+            set[int]: The ids present in the data storage.
+        """
+
+        movie_ids = set(movie_ids)
+        cached_ids = {movie_id for movie_id in movie_ids if self._cache.get(movie_id) is not None}
+        if cached_ids == movie_ids:
+            return cached_ids
+
+        return cached_ids | await self._repository.get_existing_ids(movie_ids - cached_ids)
+
+    async def update_movie(
+            self,
+            movie_id: int,
+            data: MovieIn,
+    ) -> Any | None:
+        """The method updating movie data in the data storage.
+
+        Args:
+            movie_id (int): The id of the movie.
+            data (MovieIn): The details of the updated movie.
+
+        Returns:
+            Any | None: The updated movie details.
+        """
+
+        movie = await self._repository.update_movie(movie_id=movie_id, data=data)
+        self._cache.invalidate(movie_id)
+
+        return movie
+
+    async def delete_movie(self, movie_id: int) -> bool:
+        """The method updating removing movie from the data storage.
+
+        Args:
+            movie_id (int): The id of the movie.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        deleted = await self._repository.delete_movie(movie_id)
+        self._cache.invalidate(movie_id)
+
+        return deleted
@@ -0,0 +1,141 @@
+"""Module containing caching screening_room repository implementation."""
+
+from typing import Any, Iterable
+
+from cinema_management.core.repositories.i_screening_room_repository import IScreeningRoomRepository
+from cinema_management.core.domains.screeningroom import ScreeningRoomIn
+from cinema_management.db import primary_reads
+from cinema_management.utils.cache import LRUCache
+
+
+class CachedScreeningRoomRepository(IScreeningRoomRepository):
+    """A class caching screening_rooms read by id from the wrapped repository."""
+
+    _repository: IScreeningRoomRepository
+    _cache: LRUCache
+
+    def __init__(self, repository: IScreeningRoomRepository, cache: LRUCache) -> None:
+        """The initializer of the `cached screening_room repository`.
+
+        Args:
+            repository (IScreeningRoomRepository): The wrapped repository.
+            cache (LRUCache): The cache of screening_rooms keyed by id.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def get_all_screening_rooms(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Any]:
+        """The method getting screening_rooms from the data storage ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of screening_rooms
+                to return. Defaults to None.
+            after (int | None, optional): Return only screening_rooms with id
+                greater than this cursor. Defaults to None.
+
+        Returns:
+            Iterable[Any]: Screening_rooms in the data storage.
+        """
+
+        return await self._repository.get_all_screening_rooms(limit=limit, after=after)
+
+    async def get_by_id(self, screening_room_id: int) -> Any | None:
+        """The method getting screening_room by provided id.
+
+        Args:
+            screening_room_id (int): The id of the screening_room.
+
+        Returns:
+            Any | None: The screening_room details.
+        """
+
+        if (screening_room := self._cache.get(screening_room_id)) is None:
+            with primary_reads():
+                screening_room = await self._repository.get_by_id(screening_room_id)
+            if screening_room is not None:
+                self._cache.set(screening_room_id, screening_room)
+
+        return screening_room
+
+    async def add_screening_room(self, data: ScreeningRoomIn) -> Any | None:
+        """The method adding new screening_room to the data storage.
+
+        Args:
+            data (ScreeningRoomIn): The details of the new screening_room.
+
+        Returns:
+            Any | None: The newly added screening_room.
+        """
+
+        return await self._repository.add_screening_room(data)
+
+    async def add_many(self, data: Iterable[ScreeningRoomIn]) -> Iterable[Any]:
+        """The method adding many screening_rooms to the data storage at once.
+
+        Args:
+            data (Iterable[ScreeningRoomIn]): The details of the new screening_rooms.
+
+        Returns:
+            Iterable[Any]: The newly added screening_rooms.
+        """
+
+        return await self._repository.add_many(data)
+
+    async def get_existing_ids(self, screening_room_ids: Iterable[int]) -> set[int]:
+        """The method getting which of the provided screening_room ids exist.
+
+        Only ids missing from the cache are looked up in the data storage.
+
+        Args:
+            screening_room_ids (Iterable[int]): The ids to look up.
+
+        Returns:
+            set[int]: The ids present in the data storage.
+        """
+
+        screening_room_ids = set(screening_room_ids)
+        cached_ids = {screening_room_id for screening_room_id in screening_room_ids if self._cache.get(screening_room_id) is not None}
+        if cached_ids == screening_room_ids:
+            return cached_ids
+
+        return cached_ids | await self._repository.get_existing_ids(screening_room_ids - cached_ids)
+
+    async def update_screening_room(
+            self,
+            screening_room_id: int,
+            data: ScreeningRoomIn,
+    ) -> Any | None:
+        """The method updating screening_room data in the data storage.
+
+        Args:
+            screening_room_id (int): The id of the screening_room.
+            data (ScreeningRoomIn): The details of the updated screening_room.
+
+        Returns:
+            Any | None: The updated screening_room details or None if it
+                does not exist or the reservations do not fit in the new size.
+        """
+
+        screening_room = await self._repository.update_screening_room(screening_room_id=screening_room_id, data=data)
+        self._cache.invalidate(screening_room_id)
+
+        return screening_room
+
+    async def delete_screening_room(self, screening_room_id: int) -> bool:
+        """The method updating removing screening_room from the data storage.
+
+        Args:
+            screening_room_id (int): The id of the screening_room.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        deleted = await self._repository.delete_screening_room(screening_room_id)
+        self._cache.invalidate(screening_room_id)
+
+        return deleted
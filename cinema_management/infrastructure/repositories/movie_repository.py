@@ -1,22 +1,41 @@
 """Module containing movie repository implementation."""
 
+from datetime import date
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import bindparam, select, join
 
 from cinema_management.core.repositories.i_movie_repository import IMovieRepository
 from cinema_management.core.domains.movie import Movie, MovieIn
 from cinema_management.db import (
+    CompiledQuery,
+    BULK_INSERT_CHUNK_SIZE,
     movies_table,
-    database,
+    reader,
+    writer,
+)
+
+GET_MOVIE_BY_ID = CompiledQuery(
+    movies_table.select()
+    .where(movies_table.c.id == bindparam("movie_id"))
 )
 
 class MovieRepository(IMovieRepository):
     """A class representing continent DB repository."""
 
-    async def get_all_movies(self) -> Iterable[Any]:
-        """The method getting all movies from the data storage.
+    async def get_all_movies(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Any]:
+        """The method getting movies from the data storage ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of movies
+                to return. Defaults to None.
+            after (int | None, optional): Return only movies with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Any]: Movies in the data storage.
@@ -24,10 +43,34 @@ class MovieRepository(IMovieRepository):
 
         query = (
             select(movies_table)
+            .order_by(movies_table.c.id.asc())
         )
-        movies = await database.fetch_all(query)
+        if after is not None:
+            query = query.where(movies_table.c.id > after)
+        if limit is not None:
+            query = query.limit(limit)
+        movies = await reader().fetch_all(query)
+
+        return Movie.from_records(movies)
 
-        return [Movie.from_record(movie) for movie in movies]
+    async def get_upcoming_movies(self, after: date) -> Iterable[Any]:
+        """The method getting movies premiering after the provided date.
+
+        Args:
+            after (date): The date the premiere has to follow.
+
+        Returns:
+            Iterable[Any]: Upcoming movies ordered by premiere.
+        """
+
+        query = (
+            select(movies_table)
+            .where(movies_table.c.premiere > after)
+            .order_by(movies_table.c.premiere.asc(), movies_table.c.id.asc())
+        )
+        movies = await reader().fetch_all(query)
+
+        return Movie.from_records(movies)
 
     async def get_by_id(self, movie_id: int) -> Any | None:
         """The method getting movie by provided id.
@@ -56,11 +99,58 @@ class MovieRepository(IMovieRepository):
             Any | None: The newly added movie.
         """
 
-        query = movies_table.insert().values(**data.model_dump())
-        new_movie_id = await database.execute(query)
-        new_movie = await self._get_by_id(new_movie_id)
+        query = (
+            movies_table.insert()
+            .values(**data.model_dump())
+            .returning(movies_table)
+        )
+        new_movie = await writer().fetch_one(query)
+
+        return Movie.from_record(new_movie) if new_movie else None
 
-        return Movie(**dict(new_movie)) if new_movie else None
+    async def add_many(self, data: Iterable[MovieIn]) -> Iterable[Any]:
+        """The method adding many movies to the data storage at once.
+
+        The rows are written with multi-row inserts in a single transaction.
+
+        Args:
+            data (Iterable[MovieIn]): The details of the new movies.
+
+        Returns:
+            Iterable[Any]: The newly added movies.
+        """
+
+        values = [movie.model_dump() for movie in data]
+        new_movies = []
+
+        async with writer().transaction():
+            for start in range(0, len(values), BULK_INSERT_CHUNK_SIZE):
+                query = (
+                    movies_table.insert()
+                    .values(values[start:start + BULK_INSERT_CHUNK_SIZE])
+                    .returning(movies_table)
+                )
+                new_movies.extend(await writer().fetch_all(query))
+
+        return Movie.from_records(new_movies)
+
+    async def get_existing_ids(self, movie_ids: Iterable[int]) -> set[int]:
+        """The method getting which of the provided movie ids exist.
+
+        Args:
+            movie_ids (Iterable[int]): The ids to look up.
+
+        Returns:
+            set[int]: The ids present in the data storage.
+        """
+
+        query = (
+            select(movies_table.c.id)
+            .where(movies_table.c.id.in_(set(movie_ids)))
+        )
+        rows = await reader().fetch_all(query)
+
+        return {row["id"] for row in rows}
 
     async def update_movie(
             self,
@@ -77,19 +167,15 @@ class MovieRepository(IMovieRepository):
             Any | None: The updated movie details.
         """
 
-        if self._get_by_id(movie_id):
-            query = (
-                movies_table.update()
-                .where(movies_table.c.id == movie_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-
-            movie = await self._get_by_id(movie_id)
-
-            return Movie(**dict(movie)) if movie else None
+        query = (
+            movies_table.update()
+            .where(movies_table.c.id == movie_id)
+            .values(**data.model_dump())
+            .returning(movies_table)
+        )
+        movie = await writer().fetch_one(query)
 
-        return None
+        return Movie.from_record(movie) if movie else None
 
     async def delete_movie(self, movie_id: int) -> bool:
         """The method updating removing movie from the data storage.
@@ -101,15 +187,12 @@ class MovieRepository(IMovieRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(movie_id):
-            query = movies_table \
-                .delete() \
-                .where(movies_table.c.id == movie_id)
-            await database.execute(query)
-
-            return True
+        query = movies_table \
+            .delete() \
+            .where(movies_table.c.id == movie_id) \
+            .returning(movies_table.c.id)
 
-        return False
+        return await writer().fetch_one(query) is not None
 
     async def _get_by_id(self, movie_id: int) -> Record | None:
         """A private method getting movie from the DB based on its ID.
@@ -121,9 +204,4 @@ class MovieRepository(IMovieRepository):
             Any | None: Movie record if exists.
         """
 
-        query = (
-            movies_table.select()
-            .where(movies_table.c.id == movie_id)
-        )
-
-        return await database.fetch_one(query)
\ No newline at end of file
+        return await GET_MOVIE_BY_ID.fetch_one(movie_id=movie_id)
\ No newline at end of file
@@ -1,22 +1,58 @@
 """Module containing repertoire repository implementation."""
 
-from typing import Any, Iterable
+from datetime import date, time, timedelta
+from typing import Any, AsyncIterator, Iterable, List
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select
+from sqlalchemy import Select, bindparam, exists, func, select, tuple_
 
 from cinema_management.core.repositories.i_repertoire_repository import IRepertoireRepository
-from cinema_management.core.domains.repertoire import Repertoire, RepertoireIn
+from cinema_management.core.domains.repertoire import Repertoire, RepertoireIn, RepertoireSeats
+from cinema_management.core.domains.schedule import Schedule, Showing, find_conflicts
+from cinema_management.core.domains.seat_map import SeatMap
 from cinema_management.db import (
+    CompiledQuery,
+    BULK_INSERT_CHUNK_SIZE,
+    movies_table,
     repertoires_table,
-    database,
+    reservations_table,
+    screening_rooms_table,
+    reader,
+    writer,
+)
+from cinema_management.infrastructure.repositories.seat_maps import held_seats, rebuild_seat_maps
+
+GET_REPERTOIRE_BY_ID = CompiledQuery(
+    repertoires_table.select()
+    .where(repertoires_table.c.id == bindparam("repertoire_id"))
 )
 
 class RepertoireRepository(IRepertoireRepository):
     """A class representing continent DB repository."""
 
-    async def get_all_repertoires(self) -> Iterable[Any]:
-        """The method getting all repertoires from the data storage.
+    _cleaning_buffer: timedelta
+
+    def __init__(self, cleaning_buffer_minutes: float = 0) -> None:
+        """The initializer of the `repertoire repository`.
+
+        Args:
+            cleaning_buffer_minutes (float, optional): The time a screening room
+                stays occupied after a movie ends. Defaults to 0.
+        """
+        self._cleaning_buffer = timedelta(minutes=cleaning_buffer_minutes)
+
+    async def get_all_repertoires(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Any]:
+        """The method getting repertoires from the data storage ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of repertoires
+                to return. Defaults to None.
+            after (int | None, optional): Return only repertoires with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Any]: Repertoires in the data storage.
@@ -24,11 +60,31 @@ class RepertoireRepository(IRepertoireRepository):
 
         query = (
             select(repertoires_table)
-            
+            .order_by(repertoires_table.c.id.asc())
         )
-        repertoires = await database.fetch_all(query)
+        if after is not None:
+            query = query.where(repertoires_table.c.id > after)
+        if limit is not None:
+            query = query.limit(limit)
+        repertoires = await reader().fetch_all(query)
+
+        return Repertoire.from_records(repertoires)
+
+    async def iterate_repertoires(self) -> AsyncIterator[Any]:
+        """The method streaming all repertoires from the data storage.
+
+        Rows are fetched with a server-side cursor, one at a time.
 
-        return [Repertoire.from_record(repertoire) for repertoire in repertoires]
+        Returns:
+            AsyncIterator[Any]: Repertoires in the data storage ordered by id.
+        """
+
+        query = (
+            select(repertoires_table)
+            .order_by(repertoires_table.c.id.asc())
+        )
+        async for repertoire in reader().iterate(query):
+            yield Repertoire.from_record(repertoire)
 
     async def get_by_id(self, repertoire_id: int) -> Any | None:
         """The method getting repertoire by provided id.
@@ -44,24 +100,308 @@ class RepertoireRepository(IRepertoireRepository):
 
         return Repertoire.from_record(repertoire) if repertoire else None
 
+    async def get_by_dates(
+            self,
+            from_date: date,
+            to_date: date,
+            from_time: time | None = None,
+            movie_id: int | None = None,
+            screening_room_id: int | None = None,
+            limit: int | None = None,
+            after: tuple[date, time, int] | None = None,
+    ) -> Iterable[Any]:
+        """The method getting repertoires within the dates ordered by time.
+
+        The rows are read in order from the (date, start_time) index,
+        starting at the first date and time, so earlier showings are not
+        scanned.
+
+        Args:
+            from_date (date): The first date of the repertoires.
+            to_date (date): The last date of the repertoires.
+            from_time (time | None, optional): The earliest start time on the
+                first date. Defaults to None.
+            movie_id (int | None, optional): The id of the movie. Defaults to None.
+            screening_room_id (int | None, optional): The id of the screening_room.
+                Defaults to None.
+            limit (int | None, optional): The maximum number of repertoires
+                to return. Defaults to None.
+            after (tuple[date, time, int] | None, optional): Return only
+                repertoires following this (date, start_time, id) cursor.
+                Defaults to None.
+
+        Returns:
+            Iterable[Any]: Repertoires within the dates.
+        """
+
+        if from_time is None:
+            starts_after = repertoires_table.c.date >= from_date
+        else:
+            starts_after = tuple_(
+                repertoires_table.c.date,
+                repertoires_table.c.start_time,
+            ) >= tuple_(from_date, from_time)
+
+        if after is not None:
+            # The (date, start_time) bound lets the index skip to the cursor.
+            after_date, after_time, after_id = after
+            starts_after = starts_after & (
+                tuple_(repertoires_table.c.date, repertoires_table.c.start_time)
+                >= tuple_(after_date, after_time)
+            ) & (
+                tuple_(
+                    repertoires_table.c.date,
+                    repertoires_table.c.start_time,
+                    repertoires_table.c.id,
+                ) > tuple_(after_date, after_time, after_id)
+            )
+
+        query = (
+            select(repertoires_table)
+            .where(starts_after)
+            .where(repertoires_table.c.date <= to_date)
+            .order_by(
+                repertoires_table.c.date.asc(),
+                repertoires_table.c.start_time.asc(),
+                repertoires_table.c.id.asc(),
+            )
+        )
+        if movie_id is not None:
+            query = query.where(repertoires_table.c.movie_id == movie_id)
+        if screening_room_id is not None:
+            query = query.where(repertoires_table.c.screening_room_id == screening_room_id)
+        if limit is not None:
+            query = query.limit(limit)
+        repertoires = await reader().fetch_all(query)
+
+        return Repertoire.from_records(repertoires)
+
+    async def get_by_movie_id(self, movie_id: int) -> Iterable[Any]:
+        """The method getting repertoires by provided movie id.
+
+        Args:
+            movie_id (int): The id of the movie.
+
+        Returns:
+            Iterable[Any]: Repertoires of the movie.
+        """
+
+        query = (
+            select(repertoires_table)
+            .where(repertoires_table.c.movie_id == movie_id)
+        )
+        repertoires = await reader().fetch_all(query)
+
+        return Repertoire.from_records(repertoires)
+
+    async def get_by_screening_room_id(self, screening_room_id: int) -> Iterable[Any]:
+        """The method getting repertoires by provided screening_room id.
+
+        Args:
+            screening_room_id (int): The id of the screening_room.
+
+        Returns:
+            Iterable[Any]: Repertoires of the screening_room.
+        """
+
+        query = (
+            select(repertoires_table)
+            .where(repertoires_table.c.screening_room_id == screening_room_id)
+        )
+        repertoires = await reader().fetch_all(query)
+
+        return Repertoire.from_records(repertoires)
+
+    async def exists_by_movie_id(self, movie_id: int) -> bool:
+        """The method checking if any repertoire of the movie exists.
+
+        Args:
+            movie_id (int): The id of the movie.
+
+        Returns:
+            bool: True if the movie has at least one repertoire.
+        """
+
+        query = select(
+            exists().where(repertoires_table.c.movie_id == movie_id)
+        )
+
+        return bool(await reader().fetch_val(query))
+
+    async def exists_by_screening_room_id(self, screening_room_id: int) -> bool:
+        """The method checking if any repertoire in the screening_room exists.
+
+        Args:
+            screening_room_id (int): The id of the screening_room.
+
+        Returns:
+            bool: True if the screening_room has at least one repertoire.
+        """
+
+        query = select(
+            exists().where(repertoires_table.c.screening_room_id == screening_room_id)
+        )
+
+        return bool(await reader().fetch_val(query))
+
+    async def get_seats(self, repertoire_id: int) -> Any | None:
+        """The method getting seat occupancy of the repertoire.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            Any | None: The capacity, taken and available seats.
+        """
+
+        query = (
+            self._seats_query()
+            .where(repertoires_table.c.id == repertoire_id)
+        )
+        seats = await reader().fetch_one(query)
+
+        return RepertoireSeats.from_record(seats) if seats else None
+
+    async def get_seats_many(self, repertoire_ids: Iterable[int]) -> Iterable[Any]:
+        """The method getting seat occupancy of many repertoires at once.
+
+        Args:
+            repertoire_ids (Iterable[int]): The ids of the repertoires.
+
+        Returns:
+            Iterable[Any]: The seat occupancy of the existing repertoires.
+        """
+
+        query = (
+            self._seats_query()
+            .where(repertoires_table.c.id.in_(set(repertoire_ids)))
+        )
+        seats = await reader().fetch_all(query)
+
+        return RepertoireSeats.from_records(seats)
+
+    async def get_seat_map(self, repertoire_id: int) -> Any | None:
+        """The method getting taken seats map of the repertoire.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            Any | None: The seat map if the repertoire exists.
+        """
+
+        query = (
+            select(
+                repertoires_table.c.seat_map,
+                screening_rooms_table.c.rows_count,
+                screening_rooms_table.c.seats_in_row,
+            )
+            .select_from(
+                repertoires_table.join(
+                    screening_rooms_table,
+                    repertoires_table.c.screening_room_id == screening_rooms_table.c.id,
+                )
+            )
+            .where(repertoires_table.c.id == repertoire_id)
+        )
+        seat_map = await reader().fetch_one(query)
+
+        return SeatMap.from_record(seat_map) if seat_map else None
+
+    async def get_seats_from_date(self, from_date: date) -> Iterable[Any]:
+        """The method getting seat occupancy of repertoires from the date on.
+
+        Args:
+            from_date (date): The first date of the repertoires.
+
+        Returns:
+            Iterable[Any]: The seat occupancy of the repertoires.
+        """
+
+        query = (
+            self._seats_query()
+            .where(repertoires_table.c.date >= from_date)
+        )
+        seats = await reader().fetch_all(query)
+
+        return RepertoireSeats.from_records(seats)
+
+    async def get_showings(self, from_date: date, to_date: date) -> Iterable[Any]:
+        """The method getting the time repertoires within the dates occupy their rooms.
+
+        Args:
+            from_date (date): The first date of the repertoires.
+            to_date (date): The last date of the repertoires.
+
+        Returns:
+            Iterable[Any]: The showings, including the cleaning buffer.
+        """
+
+        showings = await reader().fetch_all(self._showings_query(from_date, to_date))
+
+        return self._showings(showings)
+
     async def add_repertoire(self, data: RepertoireIn) -> Any | None:
         """The method adding new repertoire to the data storage.
 
+        The screening room is locked for the transaction and the repertoire
+        is inserted only if the room is free for the length of the movie
+        and the cleaning buffer.
+
         Args:
             data (RepertoireIn): The details of the new repertoire.
 
         Returns:
-            Repertoire: Full details of the newly added repertoire.
+            Any | None: The newly added repertoire or None if it overlaps
+                another repertoire in the screening room.
+        """
+
+        query = (
+            repertoires_table.insert()
+            .values(**data.model_dump())
+            .returning(repertoires_table)
+        )
+
+        async with writer().transaction():
+            if await self._has_conflicts([data]):
+                return None
+
+            new_repertoire = await writer().fetch_one(query)
+
+        return Repertoire.from_record(new_repertoire) if new_repertoire else None
+
+    async def add_many(self, data: Iterable[RepertoireIn]) -> Iterable[Any] | None:
+        """The method adding many repertoires to the data storage at once.
+
+        The rows are written with multi-row inserts in a single transaction,
+        after locking the screening rooms and checking the repertoires
+        overlap neither each other nor the scheduled ones.
+
+        Args:
+            data (Iterable[RepertoireIn]): The details of the new repertoires.
 
         Returns:
-            Any | None: The newly added repertoire.
+            Iterable[Any] | None: The newly added repertoires or None if any
+                of them overlaps another repertoire in its screening room.
         """
 
-        query = repertoires_table.insert().values(**data.model_dump())
-        new_repertoire_id = await database.execute(query)
-        new_repertoire = await self._get_by_id(new_repertoire_id)
+        data = list(data)
+        values = [repertoire.model_dump() for repertoire in data]
+        new_repertoires = []
+
+        async with writer().transaction():
+            if await self._has_conflicts(data):
+                return None
 
-        return Repertoire(**dict(new_repertoire)) if new_repertoire else None
+            for start in range(0, len(values), BULK_INSERT_CHUNK_SIZE):
+                query = (
+                    repertoires_table.insert()
+                    .values(values[start:start + BULK_INSERT_CHUNK_SIZE])
+                    .returning(repertoires_table)
+                )
+                new_repertoires.extend(await writer().fetch_all(query))
+
+        return Repertoire.from_records(new_repertoires)
 
     async def update_repertoire(
             self,
@@ -70,27 +410,55 @@ class RepertoireRepository(IRepertoireRepository):
     ) -> Any | None:
         """The method updating repertoire data in the data storage.
 
+        The screening room is locked for the transaction and the repertoire
+        is updated only if the room is free besides the repertoire itself.
+        When the repertoire moves to another room, its seat map is rebuilt
+        from the seats of its reservations for the new room.
+
         Args:
             repertoire_id (int): The id of the repertoire.
             data (RepertoireIn): The details of the updated repertoire.
 
         Returns:
-            Any | None: The updated repertoire details.
+            Any | None: The updated repertoire details or None if it does not
+                exist, overlaps another repertoire in the screening room
+                or its reservations do not fit in the new room.
         """
 
-        if self._get_by_id(repertoire_id):
-            query = (
-                repertoires_table.update()
-                .where(repertoires_table.c.id == repertoire_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+        query = (
+            repertoires_table.update()
+            .where(repertoires_table.c.id == repertoire_id)
+            .values(**data.model_dump())
+            .returning(repertoires_table)
+        )
 
-            repertoire = await self._get_by_id(repertoire_id)
+        async with writer().transaction():
+            if await self._has_conflicts([data], excluded_repertoire_id=repertoire_id):
+                return None
 
-            return Repertoire(**dict(repertoire)) if repertoire else None
+            current = await writer().fetch_one(
+                select(repertoires_table.c.screening_room_id)
+                .where(repertoires_table.c.id == repertoire_id)
+                .with_for_update()
+            )
+            if not current:
+                return None
+
+            if current["screening_room_id"] != data.screening_room_id:
+                screening_room = await writer().fetch_one(
+                    select(screening_rooms_table.c.rows_count, screening_rooms_table.c.seats_in_row)
+                    .where(screening_rooms_table.c.id == data.screening_room_id)
+                )
+                if not screening_room or not await rebuild_seat_maps(
+                    [repertoire_id],
+                    screening_room["rows_count"],
+                    screening_room["seats_in_row"],
+                ):
+                    return None
+
+            repertoire = await writer().fetch_one(query)
 
-        return None
+        return Repertoire.from_record(repertoire) if repertoire else None
 
     async def delete_repertoire(self, repertoire_id: int) -> bool:
         """The method updating removing repertoire from the data storage.
@@ -102,15 +470,167 @@ class RepertoireRepository(IRepertoireRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(repertoire_id):
-            query = repertoires_table \
-                .delete() \
-                .where(repertoires_table.c.id == repertoire_id)
-            await database.execute(query)
+        query = repertoires_table \
+            .delete() \
+            .where(repertoires_table.c.id == repertoire_id) \
+            .returning(repertoires_table.c.id)
+
+        return await writer().fetch_one(query) is not None
 
-            return True
+    async def _has_conflicts(
+            self,
+            repertoires: List[RepertoireIn],
+            excluded_repertoire_id: int | None = None,
+    ) -> bool:
+        """A private method checking the repertoires against the room schedules.
+
+        The screening rooms are locked for the transaction, so concurrent
+        writes can not schedule overlapping repertoires. Showings of the
+        rooms are loaded for the dates of the repertoires and the days
+        around them. A single repertoire is checked against the schedule
+        index, many of them are checked in one sweep.
+
+        Args:
+            repertoires (List[RepertoireIn]): The new or updated repertoires.
+            excluded_repertoire_id (int | None, optional): The id of the
+                updated repertoire, left out of the schedule. Defaults to None.
+
+        Returns:
+            bool: True if any repertoire overlaps another one.
+        """
+
+        if not repertoires:
+            return False
+
+        screening_room_ids = sorted({repertoire.screening_room_id for repertoire in repertoires})
+        await writer().fetch_all(
+            select(screening_rooms_table.c.id)
+            .where(screening_rooms_table.c.id.in_(screening_room_ids))
+            .order_by(screening_rooms_table.c.id)
+            .with_for_update()
+        )
+
+        movies = await writer().fetch_all(
+            select(movies_table.c.id, movies_table.c.length)
+            .where(movies_table.c.id.in_({repertoire.movie_id for repertoire in repertoires}))
+        )
+        lengths = {movie["id"]: movie["length"] for movie in movies}
+        new = [
+            Showing.of(
+                repertoire.screening_room_id,
+                repertoire.date,
+                repertoire.start_time,
+                lengths.get(repertoire.movie_id) or 0,
+                self._cleaning_buffer,
+            )
+            for repertoire in repertoires
+        ]
 
-        return False
+        dates = [repertoire.date for repertoire in repertoires]
+        query = (
+            self._showings_query(
+                min(dates) - timedelta(days=1),
+                max(dates) + timedelta(days=1),
+            )
+            .where(repertoires_table.c.screening_room_id.in_(screening_room_ids))
+        )
+        if excluded_repertoire_id is not None:
+            query = query.where(repertoires_table.c.id != excluded_repertoire_id)
+        existing = self._showings(await writer().fetch_all(query))
+
+        if len(new) == 1:
+            return Schedule(existing).conflicts(new[0])
+
+        return bool(find_conflicts(existing, new))
+
+    @staticmethod
+    def _showings_query(from_date: date, to_date: date) -> Select:
+        """A private method building the query of the time repertoires occupy rooms.
+
+        Args:
+            from_date (date): The first date of the repertoires.
+            to_date (date): The last date of the repertoires.
+
+        Returns:
+            Select: The rooms, dates, start times and movie lengths.
+        """
+
+        return (
+            select(
+                repertoires_table.c.screening_room_id,
+                repertoires_table.c.date,
+                repertoires_table.c.start_time,
+                func.coalesce(movies_table.c.length, 0).label("length"),
+            )
+            .select_from(
+                repertoires_table.join(
+                    movies_table,
+                    movies_table.c.id == repertoires_table.c.movie_id,
+                )
+            )
+            .where(repertoires_table.c.date.between(from_date, to_date))
+        )
+
+    def _showings(self, records: Iterable[Record]) -> List[Showing]:
+        """A private method preparing showings based on DB records.
+
+        Args:
+            records (Iterable[Record]): The records of the showings query.
+
+        Returns:
+            List[Showing]: The showings, including the cleaning buffer.
+        """
+
+        return [
+            Showing.of(
+                showing["screening_room_id"],
+                showing["date"],
+                showing["start_time"],
+                showing["length"],
+                self._cleaning_buffer,
+            )
+            for showing in records
+        ]
+
+    @staticmethod
+    def _seats_query() -> Select:
+        """A private method building the seat occupancy query.
+
+        The room capacity and the sum of reserved seats are computed
+        by the DB in a single statement grouped by repertoire. Seats in
+        active holds are not available, although they are not taken yet.
+
+        Returns:
+            Select: The query without any repertoire filter.
+        """
+
+        capacity = screening_rooms_table.c.rows_count * screening_rooms_table.c.seats_in_row
+        taken_seats = func.coalesce(func.sum(reservations_table.c.number_of_seats), 0)
+
+        return (
+            select(
+                repertoires_table.c.id.label("repertoire_id"),
+                capacity.label("capacity"),
+                taken_seats.label("taken_seats"),
+                (capacity - taken_seats - held_seats(repertoires_table.c.id)).label("available_seats"),
+            )
+            .select_from(
+                repertoires_table
+                .join(
+                    screening_rooms_table,
+                    screening_rooms_table.c.id == repertoires_table.c.screening_room_id,
+                )
+                .outerjoin(
+                    reservations_table,
+                    reservations_table.c.repertoire_id == repertoires_table.c.id,
+                )
+            )
+            .group_by(
+                repertoires_table.c.id,
+                screening_rooms_table.c.rows_count,
+                screening_rooms_table.c.seats_in_row,
+            )
+        )
 
     async def _get_by_id(self, repertoire_id: int) -> Record | None:
         """A private method getting repertoire from the DB based on its ID.
@@ -122,9 +642,4 @@ class RepertoireRepository(IRepertoireRepository):
             Any | None: Repertoire record if exists.
         """
 
-        query = (
-            repertoires_table.select()
-            .where(repertoires_table.c.id == repertoire_id)
-        )
-
-        return await database.fetch_one(query)
\ No newline at end of file
+        return await GET_REPERTOIRE_BY_ID.fetch_one(repertoire_id=repertoire_id)
\ No newline at end of file
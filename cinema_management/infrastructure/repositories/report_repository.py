@@ -0,0 +1,161 @@
+"""Module containing report repository implementation."""
+
+from datetime import date
+from decimal import Decimal
+from typing import Any, Iterable
+
+from sqlalchemy import Float, Numeric, Select, cast, exists, func, literal, select, text
+
+from cinema_management.core.domains.report import OccupancyReport, RevenueReport
+from cinema_management.core.domains.reservation import TICKET_PRICE
+from cinema_management.core.repositories.i_report_repository import IReportRepository
+from cinema_management.db import (
+    primary_reads,
+    repertoire_rollups_table,
+    repertoires_table,
+    reservations_table,
+    screening_rooms_table,
+    reader,
+    writer,
+)
+
+
+class ReportRepository(IReportRepository):
+    """A class representing report DB repository.
+
+    Reports are read from the repertoire rollups, which reservation
+    writes keep up to date, so no reservation is scanned.
+    """
+
+    async def get_occupancy(self, from_date: date, to_date: date) -> Iterable[Any]:
+        """The method getting seat occupancy grouped by day, movie and screening room.
+
+        Args:
+            from_date (date): The first date of the report.
+            to_date (date): The last date of the report.
+
+        Returns:
+            Iterable[Any]: The occupancy rows.
+        """
+
+        capacity = func.sum(screening_rooms_table.c.rows_count * screening_rooms_table.c.seats_in_row)
+        reserved_seats = func.coalesce(func.sum(repertoire_rollups_table.c.reserved_seats), 0)
+
+        query = self._report_query(
+            from_date,
+            to_date,
+            func.count(repertoires_table.c.id).label("repertoires"),
+            capacity.label("capacity"),
+            reserved_seats.label("reserved_seats"),
+            func.coalesce(
+                cast(reserved_seats, Float) / func.nullif(cast(capacity, Float), 0),
+                0,
+            ).label("occupancy"),
+        )
+        rows = await reader().fetch_all(query)
+
+        return OccupancyReport.from_records(rows)
+
+    async def get_revenue(self, from_date: date, to_date: date) -> Iterable[Any]:
+        """The method getting revenue grouped by day, movie and screening room.
+
+        Args:
+            from_date (date): The first date of the report.
+            to_date (date): The last date of the report.
+
+        Returns:
+            Iterable[Any]: The revenue rows.
+        """
+
+        query = self._report_query(
+            from_date,
+            to_date,
+            *(
+                func.coalesce(func.sum(repertoire_rollups_table.c[name]), 0).label(name)
+                for name in ("reservations", "reserved_seats", "revenue")
+            ),
+        )
+        rows = await reader().fetch_all(query)
+
+        return RevenueReport.from_records(rows)
+
+    async def rebuild_rollups(self) -> None:
+        """The method computing the repertoire rollups from all reservations.
+
+        Reservation writes wait for the rebuild, so none of them is
+        counted twice or missed.
+        """
+
+        seats = func.sum(reservations_table.c.number_of_seats)
+        ticket_price = literal(Decimal(str(TICKET_PRICE)), Numeric(12, 2))
+
+        async with writer().transaction():
+            await writer().execute(text("LOCK TABLE reservations IN SHARE MODE"))
+            await writer().execute(repertoire_rollups_table.delete())
+            await writer().execute(
+                repertoire_rollups_table.insert()
+                .from_select(
+                    ["repertoire_id", "reservations", "reserved_seats", "revenue"],
+                    select(
+                        reservations_table.c.repertoire_id,
+                        func.count(),
+                        seats,
+                        seats * ticket_price,
+                    )
+                    .group_by(reservations_table.c.repertoire_id),
+                )
+            )
+
+    async def rollups_missing(self) -> bool:
+        """The method checking whether the rollups lack existing reservations.
+
+        It is the case when the rollups table has just been created or
+        emptied, while the reservations are already stored.
+
+        Returns:
+            bool: True if there are reservations but no rollups.
+        """
+
+        query = select(
+            exists(select(reservations_table.c.id))
+            & ~exists(select(repertoire_rollups_table.c.repertoire_id))
+        )
+        with primary_reads():
+            return await reader().fetch_val(query)
+
+    @staticmethod
+    def _report_query(from_date: date, to_date: date, *columns: Any) -> Select:
+        """A private method building a report query over the repertoire rollups.
+
+        Args:
+            from_date (date): The first date of the report.
+            to_date (date): The last date of the report.
+            *columns (Any): The aggregated columns.
+
+        Returns:
+            Select: The query grouped and ordered by day, movie and screening room.
+        """
+
+        keys = (
+            repertoires_table.c.date,
+            repertoires_table.c.movie_id,
+            repertoires_table.c.screening_room_id,
+        )
+
+        return (
+            select(*keys, *columns)
+            .select_from(
+                repertoires_table
+                .join(
+                    screening_rooms_table,
+                    screening_rooms_table.c.id == repertoires_table.c.screening_room_id,
+                )
+                .outerjoin(
+                    repertoire_rollups_table,
+                    repertoire_rollups_table.c.repertoire_id == repertoires_table.c.id,
+                )
+            )
+            .where(repertoires_table.c.date.between(from_date, to_date))
+            .group_by(*keys)
+            .order_by(*keys)
+        )
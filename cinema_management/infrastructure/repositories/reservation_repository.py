@@ -1,22 +1,63 @@
 """Module containing reservation repository implementation."""
 
-from typing import Any, Iterable
+import uuid
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, AsyncIterator, Iterable, List, Mapping
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import ColumnElement, ScalarSelect, and_, bindparam, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
 
 from cinema_management.core.repositories.i_reservation_repository import IReservationRepository
 from cinema_management.core.domains.reservation import Reservation, ReservationIn
+from cinema_management.core.domains.seat_hold import SeatHold, SeatHoldIn
+from cinema_management.core.domains.seat_map import SeatMap
 from cinema_management.db import (
+    CompiledQuery,
+    BULK_INSERT_CHUNK_SIZE,
+    repertoire_rollups_table,
+    repertoires_table,
     reservations_table,
-    database,
+    screening_rooms_table,
+    seat_holds_table,
+    reader,
+    writer,
+)
+from cinema_management.infrastructure.repositories.seat_maps import held_seats
+
+GET_RESERVATION_BY_ID = CompiledQuery(
+    reservations_table.select()
+    .where(reservations_table.c.id == bindparam("reservation_id"))
 )
 
 class ReservationRepository(IReservationRepository):
     """A class representing continent DB repository."""
 
-    async def get_all_reservations(self) -> Iterable[Any]:
-        """The method getting all reservations from the data storage.
+    _hold_ttl: timedelta
+
+    def __init__(self, hold_ttl_seconds: float = 600) -> None:
+        """The initializer of the `reservation repository`.
+
+        Args:
+            hold_ttl_seconds (float, optional): The lifetime of a seat hold.
+                Defaults to 600.
+        """
+        self._hold_ttl = timedelta(seconds=hold_ttl_seconds)
+
+    async def get_all_reservations(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Any]:
+        """The method getting reservations from the data storage ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of reservations
+                to return. Defaults to None.
+            after (int | None, optional): Return only reservations with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Any]: Reservations in the data storage.
@@ -24,11 +65,31 @@ class ReservationRepository(IReservationRepository):
 
         query = (
             select(reservations_table)
-
+            .order_by(reservations_table.c.id.asc())
         )
-        reservations = await database.fetch_all(query)
+        if after is not None:
+            query = query.where(reservations_table.c.id > after)
+        if limit is not None:
+            query = query.limit(limit)
+        reservations = await reader().fetch_all(query)
 
-        return [Reservation.from_record(reservation) for reservation in reservations]
+        return Reservation.from_records(reservations)
+
+    async def iterate_reservations(self) -> AsyncIterator[Any]:
+        """The method streaming all reservations from the data storage.
+
+        Rows are fetched with a server-side cursor, one at a time.
+
+        Returns:
+            AsyncIterator[Any]: Reservations in the data storage ordered by id.
+        """
+
+        query = (
+            select(reservations_table)
+            .order_by(reservations_table.c.id.asc())
+        )
+        async for reservation in reader().iterate(query):
+            yield Reservation.from_record(reservation)
 
     async def get_by_id(self, reservation_id: int) -> Any | None:
         """The method getting reservation by provided id.
@@ -44,26 +105,168 @@ class ReservationRepository(IReservationRepository):
 
         return Reservation.from_record(reservation) if reservation else None
 
+    async def get_by_repertoire_id(self, repertoire_id: int) -> Iterable[Any]:
+        """The method getting reservations by provided repertoire id.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            Iterable[Any]: Reservations of the repertoire.
+        """
+
+        query = (
+            select(reservations_table)
+            .where(reservations_table.c.repertoire_id == repertoire_id)
+        )
+        reservations = await reader().fetch_all(query)
+
+        return Reservation.from_records(reservations)
+
+    async def get_by_dates(self, from_date: date, to_date: date) -> Iterable[Any]:
+        """The method getting reservations of repertoires within the dates.
+
+        Args:
+            from_date (date): The first date of the repertoires.
+            to_date (date): The last date of the repertoires.
+
+        Returns:
+            Iterable[Any]: Reservations of the repertoires ordered by id.
+        """
+
+        query = (
+            select(reservations_table)
+            .select_from(
+                reservations_table.join(
+                    repertoires_table,
+                    reservations_table.c.repertoire_id == repertoires_table.c.id,
+                )
+            )
+            .where(repertoires_table.c.date.between(from_date, to_date))
+            .order_by(reservations_table.c.id.asc())
+        )
+        reservations = await reader().fetch_all(query)
 
+        return Reservation.from_records(reservations)
 
-    async def add_reservation(self, data: ReservationIn) -> Any | None:
+    async def add_reservation(self, data: ReservationIn, hold_id: str | None = None) -> Any | None:
         """The method adding new reservation to the data storage.
 
+        The repertoire row is locked for the transaction and the reservation
+        is inserted only if enough seats are still free, so concurrent
+        reservations can not overbook the repertoire. Picked seats are
+        marked as taken in the seat map of the repertoire, otherwise the
+        best available seats are assigned. The rollup of the repertoire
+        is updated in the same transaction.
+
         Args:
             data (ReservationIn): The details of the new reservation.
+            hold_id (str | None, optional): The id of the active hold whose
+                seats the reservation takes. It ends with the reservation
+                added. Defaults to None.
 
         Returns:
-            Reservation: Full details of the newly added reservation.
+            Any | None: The newly added reservation or None if the repertoire
+                does not exist, has not enough available seats or the hold
+                is not active for the same seats.
+        """
+
+        async with writer().transaction():
+            if not await self._lock_repertoires([data.repertoire_id]):
+                return None
+
+            if hold_id is not None:
+                hold = await writer().fetch_one(
+                    self._active_hold_query(hold_id)
+                    .where(seat_holds_table.c.repertoire_id == data.repertoire_id)
+                    .where(seat_holds_table.c.number_of_seats == data.number_of_seats)
+                )
+                if not hold:
+                    return None
+
+            seats_taken = await self._take_seats([data])
+            if seats_taken is None:
+                return None
+
+            [data], seat_maps = seats_taken
+            values = self._values(data)
+
+            query = (
+                reservations_table.insert()
+                .from_select(
+                    list(values),
+                    select(*(
+                        literal(value, reservations_table.c[name].type)
+                        for name, value in values.items()
+                    ))
+                    .where(self._has_available_seats(
+                        data.repertoire_id,
+                        data.number_of_seats,
+                        excluded_hold_id=hold_id,
+                    )),
+                )
+                .returning(reservations_table)
+            )
+            new_reservation = await writer().fetch_one(query)
+            if new_reservation:
+                await self._save_seat_maps(seat_maps)
+                await self._update_rollups(added=[data])
+                if hold_id is not None:
+                    await writer().execute(
+                        seat_holds_table.delete().where(seat_holds_table.c.id == hold_id)
+                    )
+
+        return Reservation.from_record(new_reservation) if new_reservation else None
+
+    async def add_many(self, data: Iterable[ReservationIn]) -> Iterable[Any] | None:
+        """The method adding many reservations to the data storage at once.
+
+        The rows are written with multi-row inserts in a single transaction,
+        after locking the repertoires and checking they have enough seats.
+
+        Args:
+            data (Iterable[ReservationIn]): The details of the new reservations.
 
         Returns:
-            Any | None: The newly added reservation.
+            Iterable[Any] | None: The newly added reservations or None if any
+                repertoire does not exist or has not enough available seats.
         """
 
-        query = reservations_table.insert().values(**data.model_dump())
-        new_reservation_id = await database.execute(query)
-        new_reservation = await self._get_by_id(new_reservation_id)
+        data = list(data)
+        if not data:
+            return []
+
+        requested_seats: dict[int, int] = defaultdict(int)
+        for reservation in data:
+            requested_seats[reservation.repertoire_id] += reservation.number_of_seats
+        new_reservations = []
+
+        async with writer().transaction():
+            if await self._lock_repertoires(requested_seats) != requested_seats.keys():
+                return None
+
+            if not await writer().fetch_val(self._has_available_seats_many(requested_seats)):
+                return None
+
+            seats_taken = await self._take_seats(data)
+            if seats_taken is None:
+                return None
+
+            data, seat_maps = seats_taken
+            values = [self._values(reservation) for reservation in data]
+
+            for start in range(0, len(values), BULK_INSERT_CHUNK_SIZE):
+                query = (
+                    reservations_table.insert()
+                    .values(values[start:start + BULK_INSERT_CHUNK_SIZE])
+                    .returning(reservations_table)
+                )
+                new_reservations.extend(await writer().fetch_all(query))
 
-        return Reservation(**dict(new_reservation)) if new_reservation else None
+            await self._save_seat_maps(seat_maps)
+            await self._update_rollups(added=data)
+
+        return Reservation.from_records(new_reservations)
 
     async def update_reservation(
             self,
@@ -72,63 +275,491 @@ class ReservationRepository(IReservationRepository):
     ) -> Any | None:
         """The method updating reservation data in the data storage.
 
+        The repertoire row is locked for the transaction and the reservation
+        is updated only if enough seats are free besides its own ones. The
+        previously picked seats are freed in favour of the new ones. If no
+        seats are picked, the current seats are kept when the repertoire
+        and the number of seats stay the same, otherwise the best available
+        seats are assigned. The rollups of the repertoires are updated
+        in the same transaction.
+
         Args:
             reservation_id (int): The id of the reservation.
             data (ReservationIn): The details of the updated reservation.
 
         Returns:
-            Any | None: The updated reservation details.
+            Any | None: The updated reservation details or None if it does
+                not exist or the repertoire has not enough available seats.
         """
 
-        if self._get_by_id(reservation_id):
-            query = (
-                reservations_table.update()
+        async with writer().transaction():
+            current = await writer().fetch_one(
+                reservations_table.select()
                 .where(reservations_table.c.id == reservation_id)
-                .values(**data.model_dump())
+                .with_for_update()
             )
-            await database.execute(query)
+            if not current:
+                return None
 
-            reservation = await self._get_by_id(reservation_id)
+            current = Reservation.from_record(current)
+            repertoire_ids = {current.repertoire_id, data.repertoire_id}
+            if data.repertoire_id not in await self._lock_repertoires(repertoire_ids):
+                return None
 
-            return Reservation(**dict(reservation)) if reservation else None
+            seat_maps = await self._get_seat_maps(repertoire_ids)
+            seat_maps[current.repertoire_id].release(current.seats or [])
+            if data.seats is None and current.seats and \
+               current.repertoire_id == data.repertoire_id and \
+               len(current.seats) == data.number_of_seats:
+                data = data.model_copy(update={"seats": current.seats})
 
-        return None
+            data = self._pick_seats(seat_maps[data.repertoire_id], data)
+            if data is None:
+                return None
 
-    async def delete_reservation(self, reservation_id: int) -> bool:
+            query = (
+                reservations_table.update()
+                .where(reservations_table.c.id == reservation_id)
+                .where(self._has_available_seats(
+                    data.repertoire_id,
+                    data.number_of_seats,
+                    excluded_reservation_id=reservation_id,
+                ))
+                .values(**self._values(data))
+                .returning(reservations_table)
+            )
+            reservation = await writer().fetch_one(query)
+            if reservation:
+                await self._save_seat_maps(seat_maps)
+                await self._update_rollups(added=[data], removed=[current])
+
+        return Reservation.from_record(reservation) if reservation else None
+
+    async def delete_reservation(self, reservation_id: int) -> Any | None:
         """The method updating removing reservation from the data storage.
 
+        Its seats are freed in the seat map and the rollup of the repertoire
+        is updated in the same transaction.
+
         Args:
             reservation_id (int): The id of the reservation.
 
         Returns:
-            bool: Success of the operation.
+            Any | None: The removed reservation.
         """
 
-        if self._get_by_id(reservation_id):
-            query = reservations_table \
-                .delete() \
-                .where(reservations_table.c.id == reservation_id)
-            await database.execute(query)
+        query = reservations_table \
+            .delete() \
+            .where(reservations_table.c.id == reservation_id) \
+            .returning(reservations_table)
 
-            return True
+        async with writer().transaction():
+            reservation = await writer().fetch_one(query)
+            if not reservation:
+                return None
 
-        return False
+            reservation = Reservation.from_record(reservation)
+            await self._lock_repertoires([reservation.repertoire_id])
+            if reservation.seats:
+                seat_maps = await self._get_seat_maps([reservation.repertoire_id])
+                seat_maps[reservation.repertoire_id].release(reservation.seats)
+                await self._save_seat_maps(seat_maps)
+            await self._update_rollups(removed=[reservation])
 
-    async def _get_by_id(self, reservation_id: int) -> Record | None:
-        """A private method getting reservation from the DB based on its ID.
+        return reservation
+
+    async def add_hold(self, data: SeatHoldIn) -> Any | None:
+        """The method holding free seats of the repertoire for a limited time.
+
+        The repertoire row is locked for the transaction and the hold is
+        inserted only if enough seats are free, counting the reservations
+        and the other active holds. Expired holds of the repertoire are
+        removed on the way.
 
         Args:
-            reservation_id (int): The ID of the reservation.
+            data (SeatHoldIn): The details of the hold.
 
         Returns:
-            Any | None: Reservation record if exists.
+            Any | None: The new hold or None if the repertoire does not
+                exist or has not enough available seats.
+        """
+
+        async with writer().transaction():
+            if not await self._lock_repertoires([data.repertoire_id]):
+                return None
+
+            await writer().execute(
+                seat_holds_table.delete()
+                .where(seat_holds_table.c.repertoire_id == data.repertoire_id)
+                .where(seat_holds_table.c.expires_at <= func.now())
+            )
+            query = (
+                seat_holds_table.insert()
+                .from_select(
+                    ["id", "repertoire_id", "number_of_seats", "expires_at"],
+                    select(
+                        literal(uuid.uuid4().hex),
+                        literal(data.repertoire_id),
+                        literal(data.number_of_seats),
+                        func.now() + literal(self._hold_ttl),
+                    )
+                    .where(self._has_available_seats(data.repertoire_id, data.number_of_seats)),
+                )
+                .returning(seat_holds_table)
+            )
+            hold = await writer().fetch_one(query)
+
+        return SeatHold.from_record(hold) if hold else None
+
+    async def get_hold(self, hold_id: str) -> Any | None:
+        """The method getting the active seat hold.
+
+        The primary DB is asked, as the hold may have just been written.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            Any | None: The hold if it is active.
+        """
+
+        hold = await writer().fetch_one(self._active_hold_query(hold_id))
+
+        return SeatHold.from_record(hold) if hold else None
+
+    async def delete_hold(self, hold_id: str) -> Any | None:
+        """The method ending the active seat hold, freeing its seats.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            Any | None: The ended hold if it was active.
+        """
+
+        query = (
+            seat_holds_table.delete()
+            .where(seat_holds_table.c.id == hold_id)
+            .where(seat_holds_table.c.expires_at > func.now())
+            .returning(seat_holds_table)
+        )
+        hold = await writer().fetch_one(query)
+
+        return SeatHold.from_record(hold) if hold else None
+
+    async def delete_expired_holds(self) -> None:
+        """The method removing holds past their expiry time."""
+
+        await writer().execute(
+            seat_holds_table.delete()
+            .where(seat_holds_table.c.expires_at <= func.now())
+        )
+
+    @staticmethod
+    def _active_hold_query(hold_id: str) -> Any:
+        """A private method building the query of the active hold.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            Any: The query selecting the hold if it has not expired.
+        """
+
+        return (
+            seat_holds_table.select()
+            .where(seat_holds_table.c.id == hold_id)
+            .where(seat_holds_table.c.expires_at > func.now())
+        )
+
+    @staticmethod
+    def _values(data: ReservationIn) -> dict[str, Any]:
+        """A private method preparing column values of the reservation.
+
+        Args:
+            data (ReservationIn): The details of the reservation.
+
+        Returns:
+            dict[str, Any]: The column values, with seats as nested lists
+                because asyncpg encodes tuples as records.
+        """
+
+        values = data.model_dump()
+        if data.seats is not None:
+            values["seats"] = [list(seat) for seat in data.seats]
+
+        return values
+
+    @staticmethod
+    async def _get_seat_maps(repertoire_ids: Iterable[int]) -> dict[int, SeatMap]:
+        """A private method getting seat maps of the repertoires.
+
+        Args:
+            repertoire_ids (Iterable[int]): The ids of the repertoires.
+
+        Returns:
+            dict[int, SeatMap]: The seat maps by repertoire id.
+        """
+
+        query = (
+            select(
+                repertoires_table.c.id,
+                repertoires_table.c.seat_map,
+                screening_rooms_table.c.rows_count,
+                screening_rooms_table.c.seats_in_row,
+            )
+            .select_from(
+                repertoires_table.join(
+                    screening_rooms_table,
+                    repertoires_table.c.screening_room_id == screening_rooms_table.c.id,
+                )
+            )
+            .where(repertoires_table.c.id.in_(set(repertoire_ids)))
+        )
+        rows = await writer().fetch_all(query)
+
+        return {row["id"]: SeatMap.from_record(row) for row in rows}
+
+    @staticmethod
+    async def _save_seat_maps(seat_maps: Mapping[int, SeatMap]) -> None:
+        """A private method storing seat maps of the repertoires.
+
+        Args:
+            seat_maps (Mapping[int, SeatMap]): The seat maps by repertoire id.
+        """
+
+        for repertoire_id, seat_map in seat_maps.items():
+            query = (
+                repertoires_table.update()
+                .where(repertoires_table.c.id == repertoire_id)
+                .values(seat_map=seat_map.to_bytes())
+            )
+            await writer().execute(query)
+
+    @staticmethod
+    async def _update_rollups(
+            added: Iterable[ReservationIn] = (),
+            removed: Iterable[ReservationIn] = (),
+    ) -> None:
+        """A private method applying reservation changes to the repertoire rollups.
+
+        The changes are summed per repertoire and written with a single
+        upsert, so the rollups never need a scan of the reservations.
+        The repertoires have to be locked by the transaction already.
+
+        Args:
+            added (Iterable[ReservationIn], optional): The written reservations.
+                Defaults to ().
+            removed (Iterable[ReservationIn], optional): The removed reservations,
+                or previous versions of updated ones. Defaults to ().
+        """
+
+        changes: dict[int, dict[str, Any]] = defaultdict(
+            lambda: {"reservations": 0, "reserved_seats": 0, "revenue": Decimal(0)}
+        )
+        for sign, reservations in ((1, added), (-1, removed)):
+            for reservation in reservations:
+                change = changes[reservation.repertoire_id]
+                change["reservations"] += sign
+                change["reserved_seats"] += sign * reservation.number_of_seats
+                change["revenue"] += sign * Decimal(str(reservation.get_price()))
+
+        if not changes:
+            return
+
+        query = insert(repertoire_rollups_table).values([
+            {"repertoire_id": repertoire_id, **change}
+            for repertoire_id, change in sorted(changes.items())
+        ])
+        query = query.on_conflict_do_update(
+            index_elements=[repertoire_rollups_table.c.repertoire_id],
+            set_={
+                name: repertoire_rollups_table.c[name] + query.excluded[name]
+                for name in ("reservations", "reserved_seats", "revenue")
+            },
+        )
+        await writer().execute(query)
+
+    async def _take_seats(
+            self,
+            reservations: Iterable[ReservationIn],
+    ) -> tuple[List[ReservationIn], dict[int, SeatMap]] | None:
+        """A private method taking seats of the reservations in the seat maps.
+
+        The repertoires have to be locked. The maps are changed in memory
+        only and have to be saved after the reservations are written.
+
+        Args:
+            reservations (Iterable[ReservationIn]): The reservations.
+
+        Returns:
+            tuple[List[ReservationIn], dict[int, SeatMap]] | None: The
+                reservations with their seats and the changed seat maps by
+                repertoire id, or None if the seats can not be taken.
+        """
+
+        reservations = list(reservations)
+        seat_maps = await self._get_seat_maps(
+            reservation.repertoire_id for reservation in reservations
+        )
+        seated = []
+        for reservation in reservations:
+            reservation = self._pick_seats(seat_maps[reservation.repertoire_id], reservation)
+            if reservation is None:
+                return None
+            seated.append(reservation)
+
+        return seated, seat_maps
+
+    @staticmethod
+    def _pick_seats(seat_map: SeatMap, reservation: ReservationIn) -> ReservationIn | None:
+        """A private method taking seats of the reservation in the seat map.
+
+        Args:
+            seat_map (SeatMap): The seat map of the repertoire.
+            reservation (ReservationIn): The reservation.
+
+        Returns:
+            ReservationIn | None: The reservation with its seats or None if
+                the picked seats are taken or not enough seats are free.
+        """
+
+        if reservation.seats is None:
+            seats = seat_map.best_available(reservation.number_of_seats)
+            if seats is None:
+                return None
+            reservation = reservation.model_copy(update={"seats": seats})
+
+        return reservation if seat_map.take(reservation.seats) else None
+
+    @staticmethod
+    async def _lock_repertoires(repertoire_ids: Iterable[int]) -> set[int]:
+        """A private method locking repertoire rows until the transaction ends.
+
+        Rows are locked in id order, so concurrent transactions locking
+        several repertoires can not deadlock.
+
+        Args:
+            repertoire_ids (Iterable[int]): The ids of the repertoires.
+
+        Returns:
+            set[int]: The ids of the locked, existing repertoires.
         """
 
         query = (
-            reservations_table.select()
-            .where(reservations_table.c.id == reservation_id)
+            select(repertoires_table.c.id)
+            .where(repertoires_table.c.id.in_(set(repertoire_ids)))
+            .order_by(repertoires_table.c.id)
+            .with_for_update()
+        )
+        rows = await writer().fetch_all(query)
+
+        return {row["id"] for row in rows}
+
+    @staticmethod
+    def _available_seats(
+            repertoire_id: int,
+            excluded_reservation_id: int | None = None,
+            excluded_hold_id: str | None = None,
+    ) -> ScalarSelect:
+        """A private method building the query of free seats of the repertoire.
+
+        Seats of reservations and of active holds are not free. It has to
+        run in a statement issued after the repertoire is locked, so that
+        it sees reservations and holds committed while waiting for the lock.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+            excluded_reservation_id (int | None, optional): The id of the
+                reservation not counted as taken. Defaults to None.
+            excluded_hold_id (str | None, optional): The id of the hold
+                not counted as taken. Defaults to None.
 
+        Returns:
+            ScalarSelect: The number of free seats.
+        """
+
+        taken_seats = (
+            select(func.coalesce(func.sum(reservations_table.c.number_of_seats), 0))
+            .where(reservations_table.c.repertoire_id == repertoire_id)
+        )
+        if excluded_reservation_id is not None:
+            taken_seats = taken_seats.where(reservations_table.c.id != excluded_reservation_id)
+
+        return (
+            select(
+                screening_rooms_table.c.rows_count * screening_rooms_table.c.seats_in_row
+                - taken_seats.scalar_subquery()
+                - held_seats(repertoire_id, excluded_hold_id)
+            )
+            .select_from(
+                repertoires_table.join(
+                    screening_rooms_table,
+                    repertoires_table.c.screening_room_id == screening_rooms_table.c.id,
+                )
+            )
+            .where(repertoires_table.c.id == repertoire_id)
+            .scalar_subquery()
         )
 
-        return await database.fetch_one(query)
+    def _has_available_seats(
+            self,
+            repertoire_id: int,
+            number_of_seats: int,
+            excluded_reservation_id: int | None = None,
+            excluded_hold_id: str | None = None,
+    ) -> ColumnElement[bool]:
+        """A private method building the condition of enough free seats.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+            number_of_seats (int): The number of requested seats.
+            excluded_reservation_id (int | None, optional): The id of the
+                reservation not counted as taken. Defaults to None.
+            excluded_hold_id (str | None, optional): The id of the hold
+                not counted as taken. Defaults to None.
+
+        Returns:
+            ColumnElement[bool]: The condition.
+        """
+
+        return self._available_seats(
+            repertoire_id,
+            excluded_reservation_id,
+            excluded_hold_id,
+        ) >= number_of_seats
+
+    def _has_available_seats_many(self, number_of_seats: Mapping[int, int]) -> Any:
+        """A private method building the query checking free seats of many repertoires.
+
+        Args:
+            number_of_seats (Mapping[int, int]): The number of requested seats
+                by repertoire id.
+
+        Raises:
+            ValueError: If no repertoire is given.
+
+        Returns:
+            Any: The query selecting True if every repertoire has enough seats.
+        """
+
+        if not number_of_seats:
+            raise ValueError("No repertoires to check")
+
+        return select(and_(*(
+            self._has_available_seats(repertoire_id, seats)
+            for repertoire_id, seats in number_of_seats.items()
+        )))
+
+    async def _get_by_id(self, reservation_id: int) -> Record | None:
+        """A private method getting reservation from the DB based on its ID.
+
+        Args:
+            reservation_id (int): The ID of the reservation.
+
+        Returns:
+            Any | None: Reservation record if exists.
+        """
+
+        return await GET_RESERVATION_BY_ID.fetch_one(reservation_id=reservation_id)
 
@@ -3,20 +3,40 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import bindparam, select, join
 
 from cinema_management.core.repositories.i_screening_room_repository import IScreeningRoomRepository
 from cinema_management.core.domains.screeningroom import ScreeningRoom, ScreeningRoomIn
 from cinema_management.db import (
+    CompiledQuery,
+    BULK_INSERT_CHUNK_SIZE,
+    repertoires_table,
     screening_rooms_table,
-    database,
+    reader,
+    writer,
+)
+from cinema_management.infrastructure.repositories.seat_maps import rebuild_seat_maps
+
+GET_SCREENING_ROOM_BY_ID = CompiledQuery(
+    screening_rooms_table.select()
+    .where(screening_rooms_table.c.id == bindparam("screening_room_id"))
 )
 
 class Screening_roomRepository(IScreeningRoomRepository):
     """A class representing continent DB repository."""
 
-    async def get_all_screening_rooms(self) -> Iterable[Any]:
-        """The method getting all screening_rooms from the data storage.
+    async def get_all_screening_rooms(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Any]:
+        """The method getting screening_rooms from the data storage ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of screening_rooms
+                to return. Defaults to None.
+            after (int | None, optional): Return only screening_rooms with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Any]: Screening_rooms in the data storage.
@@ -24,11 +44,15 @@ class Screening_roomRepository(IScreeningRoomRepository):
 
         query = (
             select(screening_rooms_table)
-            .order_by(screening_rooms_table.c.number.asc())
+            .order_by(screening_rooms_table.c.id.asc())
         )
-        screening_rooms = await database.fetch_all(query)
+        if after is not None:
+            query = query.where(screening_rooms_table.c.id > after)
+        if limit is not None:
+            query = query.limit(limit)
+        screening_rooms = await reader().fetch_all(query)
 
-        return [ScreeningRoom.from_record(screening_room) for screening_room in screening_rooms]
+        return ScreeningRoom.from_records(screening_rooms)
 
     async def get_by_id(self, screening_room_id: int) -> Any | None:
         """The method getting screening_room by provided id.
@@ -57,11 +81,58 @@ class Screening_roomRepository(IScreeningRoomRepository):
             Any | None: The newly added screening_room.
         """
 
-        query = screening_rooms_table.insert().values(**data.model_dump())
-        new_screening_room_id = await database.execute(query)
-        new_screening_room = await self._get_by_id(new_screening_room_id)
+        query = (
+            screening_rooms_table.insert()
+            .values(**data.model_dump())
+            .returning(screening_rooms_table)
+        )
+        new_screening_room = await writer().fetch_one(query)
+
+        return ScreeningRoom.from_record(new_screening_room) if new_screening_room else None
+
+    async def add_many(self, data: Iterable[ScreeningRoomIn]) -> Iterable[Any]:
+        """The method adding many screening_rooms to the data storage at once.
 
-        return ScreeningRoom(**dict(new_screening_room)) if new_screening_room else None
+        The rows are written with multi-row inserts in a single transaction.
+
+        Args:
+            data (Iterable[ScreeningRoomIn]): The details of the new screening_rooms.
+
+        Returns:
+            Iterable[Any]: The newly added screening_rooms.
+        """
+
+        values = [screening_room.model_dump() for screening_room in data]
+        new_screening_rooms = []
+
+        async with writer().transaction():
+            for start in range(0, len(values), BULK_INSERT_CHUNK_SIZE):
+                query = (
+                    screening_rooms_table.insert()
+                    .values(values[start:start + BULK_INSERT_CHUNK_SIZE])
+                    .returning(screening_rooms_table)
+                )
+                new_screening_rooms.extend(await writer().fetch_all(query))
+
+        return ScreeningRoom.from_records(new_screening_rooms)
+
+    async def get_existing_ids(self, screening_room_ids: Iterable[int]) -> set[int]:
+        """The method getting which of the provided screening_room ids exist.
+
+        Args:
+            screening_room_ids (Iterable[int]): The ids to look up.
+
+        Returns:
+            set[int]: The ids present in the data storage.
+        """
+
+        query = (
+            select(screening_rooms_table.c.id)
+            .where(screening_rooms_table.c.id.in_(set(screening_room_ids)))
+        )
+        rows = await reader().fetch_all(query)
+
+        return {row["id"] for row in rows}
 
     async def update_screening_room(
             self,
@@ -70,27 +141,52 @@ class Screening_roomRepository(IScreeningRoomRepository):
     ) -> Any | None:
         """The method updating screening_room data in the data storage.
 
+        When the size of the room changes, the room and its repertoires are
+        locked for the transaction and the seat maps of the repertoires are
+        rebuilt from the seats of their reservations.
+
         Args:
             screening_room_id (int): The id of the screening_room.
             data (ScreeningRoomIn): The details of the updated screening_room.
 
         Returns:
-            Any | None: The updated screening_room details.
+            Any | None: The updated screening_room details or None if it does
+                not exist or the reservations do not fit in the new size.
         """
 
-        if self._get_by_id(screening_room_id):
-            query = (
-                screening_rooms_table.update()
+        query = (
+            screening_rooms_table.update()
+            .where(screening_rooms_table.c.id == screening_room_id)
+            .values(**data.model_dump())
+            .returning(screening_rooms_table)
+        )
+
+        async with writer().transaction():
+            current = await writer().fetch_one(
+                screening_rooms_table.select()
                 .where(screening_rooms_table.c.id == screening_room_id)
-                .values(**data.model_dump())
+                .with_for_update()
             )
-            await database.execute(query)
-
-            screening_room = await self._get_by_id(screening_room_id)
-
-            return ScreeningRoom(**dict(screening_room)) if screening_room else None
+            if not current:
+                return None
+
+            if (current["rows_count"], current["seats_in_row"]) != (data.rows_count, data.seats_in_row):
+                repertoires = await writer().fetch_all(
+                    select(repertoires_table.c.id)
+                    .where(repertoires_table.c.screening_room_id == screening_room_id)
+                    .order_by(repertoires_table.c.id)
+                    .with_for_update()
+                )
+                if not await rebuild_seat_maps(
+                    (repertoire["id"] for repertoire in repertoires),
+                    data.rows_count,
+                    data.seats_in_row,
+                ):
+                    return None
+
+            screening_room = await writer().fetch_one(query)
 
-        return None
+        return ScreeningRoom.from_record(screening_room) if screening_room else None
 
     async def delete_screening_room(self, screening_room_id: int) -> bool:
         """The method updating removing screening_room from the data storage.
@@ -102,15 +198,12 @@ class Screening_roomRepository(IScreeningRoomRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(screening_room_id):
-            query = screening_rooms_table \
-                .delete() \
-                .where(screening_rooms_table.c.id == screening_room_id)
-            await database.execute(query)
-
-            return True
+        query = screening_rooms_table \
+            .delete() \
+            .where(screening_rooms_table.c.id == screening_room_id) \
+            .returning(screening_rooms_table.c.id)
 
-        return False
+        return await writer().fetch_one(query) is not None
 
     async def _get_by_id(self, screening_room_id: int) -> Record | None:
         """A private method getting screening_room from the DB based on its ID.
@@ -122,9 +215,4 @@ class Screening_roomRepository(IScreeningRoomRepository):
             Any | None: Screening_room record if exists.
         """
 
-        query = (
-            screening_rooms_table.select()
-            .where(screening_rooms_table.c.id == screening_room_id)
-        )
-
-        return await database.fetch_one(query)
\ No newline at end of file
+        return await GET_SCREENING_ROOM_BY_ID.fetch_one(screening_room_id=screening_room_id)
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""Module containing seat helpers shared by the repositories."""
+
+from collections import defaultdict
+from typing import Any, Iterable
+
+from sqlalchemy import ScalarSelect, func, select
+
+from cinema_management.core.domains.seat_map import Seat, SeatMap
+from cinema_management.db import repertoires_table, reservations_table, seat_holds_table, writer
+
+
+def held_seats(repertoire_id: Any, excluded_hold_id: str | None = None) -> ScalarSelect:
+    """Function building the query of seats in active holds of the repertoire.
+
+    Args:
+        repertoire_id (Any): The id of the repertoire or the column of
+            the outer query holding it.
+        excluded_hold_id (str | None, optional): The id of the hold not
+            counted. Defaults to None.
+
+    Returns:
+        ScalarSelect: The number of held seats.
+    """
+
+    query = (
+        select(func.coalesce(func.sum(seat_holds_table.c.number_of_seats), 0))
+        .where(seat_holds_table.c.repertoire_id == repertoire_id)
+        .where(seat_holds_table.c.expires_at > func.now())
+    )
+    if excluded_hold_id is not None:
+        query = query.where(seat_holds_table.c.id != excluded_hold_id)
+
+    return query.scalar_subquery()
+
+
+async def rebuild_seat_maps(
+        repertoire_ids: Iterable[int],
+        rows_count: int,
+        seats_in_row: int,
+) -> bool:
+    """Function rebuilding seat maps of the repertoires for a room size.
+
+    The maps are filled from the seats stored with the reservations, so
+    they stay valid when a repertoire moves to another room or its room
+    changes size. The repertoires have to be locked by the transaction.
+
+    Args:
+        repertoire_ids (Iterable[int]): The ids of the repertoires.
+        rows_count (int): The number of rows in the room.
+        seats_in_row (int): The number of seats in a row.
+
+    Returns:
+        bool: True if the maps were saved, False if the reservations
+            do not fit in the room.
+    """
+
+    repertoire_ids = set(repertoire_ids)
+    if not repertoire_ids:
+        return True
+
+    query = (
+        select(
+            reservations_table.c.repertoire_id,
+            reservations_table.c.number_of_seats,
+            reservations_table.c.seats,
+        )
+        .where(reservations_table.c.repertoire_id.in_(repertoire_ids))
+    )
+    reserved_seats: dict[int, int] = defaultdict(int)
+    seat_maps = {
+        repertoire_id: SeatMap(rows_count, seats_in_row)
+        for repertoire_id in repertoire_ids
+    }
+    for row in await writer().fetch_all(query):
+        repertoire_id = row["repertoire_id"]
+        reserved_seats[repertoire_id] += row["number_of_seats"]
+        if not seat_maps[repertoire_id].take(Seat(*seat) for seat in row["seats"] or []):
+            return False
+
+    if any(seats > rows_count * seats_in_row for seats in reserved_seats.values()):
+        return False
+
+    for repertoire_id, seat_map in seat_maps.items():
+        await writer().execute(
+            repertoires_table.update()
+            .where(repertoires_table.c.id == repertoire_id)
+            .values(seat_map=seat_map.to_bytes())
+        )
+
+    return True
@@ -5,6 +5,8 @@ from typing import Iterable, List
 from cinema_management.core.domains.movie import Movie, MovieIn
 from cinema_management.core.repositories.i_movie_repository import IMovieRepository
 from cinema_management.core.services.i_movie_service import IMovieService
+from cinema_management.db import primary_reads
+from cinema_management.utils.cache import DailyCache
 
 
 
@@ -12,40 +14,59 @@ class MovieService(IMovieService):
     """A class implementing the movie service."""
 
     _movie_repository: IMovieRepository
+    _upcoming_movies_cache: DailyCache
 
 
-    def __init__(self, movie_repository: IMovieRepository) -> None:
+    def __init__(
+            self,
+            movie_repository: IMovieRepository,
+            upcoming_movies_cache: DailyCache,
+    ) -> None:
         """The initializer of the `movie service`.
 
         Args:
             movie_repository (IMovieRepository): The reference to the repository.
+            upcoming_movies_cache (DailyCache): The cache of today's upcoming movies.
         """
         self._movie_repository = movie_repository
+        self._upcoming_movies_cache = upcoming_movies_cache
+
+    async def get_all(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Movie]:
+        """The method getting movies from the repository ordered by id.
 
-    async def get_all(self) -> Iterable[Movie]:
-        """The method getting all movies from the repository.
+        Args:
+            limit (int | None, optional): The maximum number of movies
+                to return. Defaults to None.
+            after (int | None, optional): Return only movies with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Movie]: All movies.
         """
 
-        return await self._movie_repository.get_all_movies()
+        return await self._movie_repository.get_all_movies(limit=limit, after=after)
 
     async def get_all_upcoming_movies(self) -> List[Movie]:
         """The method getting all upcoming movies from the repository.
 
+        The cache is refilled from the primary DB, and not at all if a
+        movie changed while the movies were read.
+
         Returns:
             Iterable[Movie]: All movies.
         """
-        all_movies = await self.get_all()
-        today = datetime.date.today()
-        new_movies = [movies for movies in all_movies if movies.premiere > today]
-
-        return new_movies
-
-
-
+        movies = self._upcoming_movies_cache.get()
+        if movies is None:
+            generation = self._upcoming_movies_cache.generation
+            with primary_reads():
+                movies = await self._movie_repository.get_upcoming_movies(datetime.date.today())
+            self._upcoming_movies_cache.set(movies, generation)
 
+        return movies
 
     async def get_by_id(self, movie_id: int) -> Movie | None:
         """The method getting movie by provided id.
@@ -70,7 +91,37 @@ class MovieService(IMovieService):
         """
 
 
-        return await self._movie_repository.add_movie(data)
+        movie = await self._movie_repository.add_movie(data)
+        self._upcoming_movies_cache.clear()
+
+        return movie
+
+    async def add_many(self, data: Iterable[MovieIn]) -> Iterable[Movie]:
+        """The method adding many movies to the data storage at once.
+
+        Args:
+            data (Iterable[MovieIn]): The details of the new movies.
+
+        Returns:
+            Iterable[Movie]: Full details of the newly added movies.
+        """
+
+        movies = await self._movie_repository.add_many(data)
+        self._upcoming_movies_cache.clear()
+
+        return movies
+
+    async def get_existing_ids(self, movie_ids: Iterable[int]) -> set[int]:
+        """The method getting which of the provided movie ids exist.
+
+        Args:
+            movie_ids (Iterable[int]): The ids to look up.
+
+        Returns:
+            set[int]: The ids present in the data storage.
+        """
+
+        return await self._movie_repository.get_existing_ids(movie_ids)
 
     async def update_movie(
             self,
@@ -87,10 +138,13 @@ class MovieService(IMovieService):
             Movie | None: The updated movie details.
         """
 
-        return await self._movie_repository.update_movie(
+        movie = await self._movie_repository.update_movie(
             movie_id=movie_id,
             data=data,
         )
+        self._upcoming_movies_cache.clear()
+
+        return movie
 
     async def delete_movie(self, movie_id: int) -> bool:
         """The method updating removing movie from the data storage.
@@ -102,4 +156,7 @@ class MovieService(IMovieService):
             bool: Success of the operation.
         """
 
-        return await self._movie_repository.delete_movie(movie_id)
+        deleted = await self._movie_repository.delete_movie(movie_id)
+        self._upcoming_movies_cache.clear()
+
+        return deleted
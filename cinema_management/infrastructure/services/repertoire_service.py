@@ -1,12 +1,19 @@
 """Module containing continent service implementation."""
 
-from typing import Iterable, List
-
-from cinema_management.core.domains.repertoire import Repertoire, RepertoireIn
+from datetime import date, datetime, time, timedelta
+from typing import AsyncIterator, Iterable, List, Mapping
+
+from cinema_management.core.domains.repertoire import Repertoire, RepertoireIn, RepertoireSeats
+from cinema_management.core.domains.reservation import Reservation, ReservationIn
+from cinema_management.core.domains.schedule import ScheduleRequest, generate_schedule
+from cinema_management.core.domains.seat_hold import SeatHold, SeatHoldIn
+from cinema_management.core.domains.seat_map import SeatMap
 from cinema_management.core.repositories.i_repertoire_repository import IRepertoireRepository
+from cinema_management.core.services.i_movie_service import IMovieService
 from cinema_management.core.services.i_repertoire_service import IRepertoireService
 from cinema_management.core.services.i_reservation_service import IReservationService
 from cinema_management.core.services.i_screening_room_service import IScreeningRoomService
+from cinema_management.infrastructure.services.seat_inventory import SeatInventory
 
 
 class RepertoireService(IRepertoireService):
@@ -15,66 +22,312 @@ class RepertoireService(IRepertoireService):
     _repertoire_repository: IRepertoireRepository
     _reservation_service: IReservationService
     _screening_room_service: IScreeningRoomService
+    _seat_inventory: SeatInventory
+    _movie_service: IMovieService
+    _cleaning_buffer: timedelta
 
 
     def __init__(self,
                  repertoire_repository: IRepertoireRepository,
                  reservation_service: IReservationService,
-                 screening_room_service: IScreeningRoomService) -> None:
+                 screening_room_service: IScreeningRoomService,
+                 seat_inventory: SeatInventory,
+                 movie_service: IMovieService,
+                 cleaning_buffer_minutes: float = 0) -> None:
         """The initializer of the `repertoire service`.
 
         Args:
             repertoire_repository (IRepertoireRepository): The reference to the repository.
             reservation_service (IReservationService): The reference to the reservation service.
             screening_room_service (IScreeningRoomService): The reference to the screening_room service.
+            seat_inventory (SeatInventory): The reference to the free seats counters.
+            movie_service (IMovieService): The reference to the movie service.
+            cleaning_buffer_minutes (float, optional): The time a screening room
+                stays occupied after a movie ends. Defaults to 0.
         """
         self._repertoire_repository = repertoire_repository
-        self._reservations_service = reservation_service
+        self._reservation_service = reservation_service
         self._screening_room_service = screening_room_service
+        self._seat_inventory = seat_inventory
+        self._movie_service = movie_service
+        self._cleaning_buffer = timedelta(minutes=cleaning_buffer_minutes)
 
-    async def get_all(self) -> Iterable[Repertoire]:
-        """The method getting all repertoires from the repository.
+    async def get_all(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Repertoire]:
+        """The method getting repertoires from the repository ordered by id.
+
+        Args:
+            limit (int | None, optional): The maximum number of repertoires
+                to return. Defaults to None.
+            after (int | None, optional): Return only repertoires with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Repertoire]: All repertoires.
         """
 
-        return await self._repertoire_repository.get_all_repertoires()
+        return await self._repertoire_repository.get_all_repertoires(limit=limit, after=after)
+
+    async def iterate_all(self) -> AsyncIterator[Repertoire]:
+        """The method streaming all repertoires from the repository.
+
+        Returns:
+            AsyncIterator[Repertoire]: All repertoires ordered by id.
+        """
+
+        async for repertoire in self._repertoire_repository.iterate_repertoires():
+            yield repertoire
+
+    async def get_seats(self, repertoire_id: int) -> RepertoireSeats | None:
+        """The method getting seat occupancy by provided repertoire_id.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            RepertoireSeats | None: The capacity, taken and available seats.
+        """
+
+        return await self._repertoire_repository.get_seats(repertoire_id)
+
+    async def get_seats_many(self, repertoire_ids: Iterable[int]) -> Iterable[RepertoireSeats]:
+        """The method getting seat occupancy of many repertoires at once.
+
+        Args:
+            repertoire_ids (Iterable[int]): The ids of the repertoires.
+
+        Returns:
+            Iterable[RepertoireSeats]: The seat occupancy of the existing repertoires.
+        """
+
+        return await self._repertoire_repository.get_seats_many(repertoire_ids)
+
+    async def get_seat_map(self, repertoire_id: int) -> SeatMap | None:
+        """The method getting taken seats map by provided repertoire_id.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            SeatMap | None: The seat map if the repertoire exists.
+        """
+
+        return await self._repertoire_repository.get_seat_map(repertoire_id)
 
     async def number_of_taken_seats(self, repertoire_id: int) -> int:
+        """The method getting number of taken seats by provided repertoire_id.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            number of taken seats.
+        """
+        seats = await self.get_seats(repertoire_id)
+
+        return seats.taken_seats if seats else 0
+
+    async def available_seats(self, repertoire_id: int) -> int | None:
         """The method getting number of free seats by provided repertoire_id.
 
+        The number is read from the seat inventory, which is loaded from
+        the repository when the repertoire is not counted yet.
+
         Args:
             repertoire_id (int): The id of the repertoire.
 
         Returns:
-            number of free seats.
+            int | None: The number of free seats if the repertoire exists.
         """
-        reservations = await self._reservations_service.get_by_repertoire_id(repertoire_id)
-        taken_seats = 0
-        for reservation in reservations:
-            taken_seats += reservation.number_of_seats
 
-        return taken_seats
+        return (await self.available_seats_many([repertoire_id])).get(repertoire_id)
 
+    async def available_seats_many(self, repertoire_ids: Iterable[int]) -> dict[int, int]:
+        """The method getting number of free seats of many repertoires at once.
 
-    async def available_seats(self, repertoire_id: int) -> int:
-        """The method getting number of free seats by provided repertoire_id.
+        Args:
+            repertoire_ids (Iterable[int]): The ids of the repertoires.
+
+        Returns:
+            dict[int, int]: The number of free seats by id of existing repertoires.
+        """
+
+        repertoire_ids = set(repertoire_ids)
+        missing_ids = {
+            repertoire_id for repertoire_id in repertoire_ids
+            if self._seat_inventory.get(repertoire_id) is None
+        }
+        if missing_ids:
+            seats = await self.get_seats_many(missing_ids)
+            # Counters loaded by concurrent requests meanwhile are newer.
+            self._seat_inventory.load(
+                repertoire_seats for repertoire_seats in seats
+                if self._seat_inventory.get(repertoire_seats.repertoire_id) is None
+            )
+
+        return {
+            repertoire_id: free_seats
+            for repertoire_id in repertoire_ids
+            if (free_seats := self._seat_inventory.get(repertoire_id)) is not None
+        }
+
+    async def reserve_seats(self, repertoire_id: int, number_of_seats: int) -> bool:
+        """The method taking free seats of the repertoire.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+            number_of_seats (int): The number of seats to take.
+
+        Returns:
+            bool: True if the seats were taken.
+        """
+
+        return await self.reserve_seats_many({repertoire_id: number_of_seats})
+
+    async def reserve_seats_many(self, number_of_seats: Mapping[int, int]) -> bool:
+        """The method taking free seats of many repertoires, all or nothing.
+
+        The counters of this process miss seats freed by other workers
+        until the next reconciliation, so counters which seem to be short
+        of seats are reloaded from the repository before the seats are
+        refused.
+
+        Args:
+            number_of_seats (Mapping[int, int]): The number of seats by repertoire id.
+
+        Returns:
+            bool: True if the seats were taken.
+        """
+
+        available_seats = await self.available_seats_many(number_of_seats)
+        if self._seat_inventory.reserve_many(number_of_seats):
+            return True
+
+        short_ids = {
+            repertoire_id for repertoire_id, seats in number_of_seats.items()
+            if available_seats.get(repertoire_id, 0) < seats
+        }
+        self._seat_inventory.load(await self.get_seats_many(short_ids))
+
+        return self._seat_inventory.reserve_many(number_of_seats)
+
+    def release_seats(self, repertoire_id: int, number_of_seats: int) -> None:
+        """The method giving taken seats of the repertoire back.
 
         Args:
             repertoire_id (int): The id of the repertoire.
+            number_of_seats (int): The number of seats to give back.
+        """
+
+        self._seat_inventory.release(repertoire_id, number_of_seats)
+
+    def release_seats_many(self, number_of_seats: Mapping[int, int]) -> None:
+        """The method giving taken seats of many repertoires back.
+
+        Args:
+            number_of_seats (Mapping[int, int]): The number of seats by repertoire id.
+        """
+
+        self._seat_inventory.release_many(number_of_seats)
+
+    async def hold_seats(self, data: SeatHoldIn) -> SeatHold | None:
+        """The method holding free seats of the repertoire for a limited time.
+
+        The hold is stored in the DB, where every worker counts it against
+        the free seats. The seats are taken from the local counter too and
+        come back to it when the counters are reconciled after the hold
+        expires.
+
+        Args:
+            data (SeatHoldIn): The details of the hold.
 
         Returns:
-            number of free seats.
+            SeatHold | None: The new hold or None if not enough seats are free.
         """
 
-        taken_seats = await self.number_of_taken_seats(repertoire_id)
-        repertoire = await self.get_by_id(repertoire_id)
-        screening_room = await self._screening_room_service.get_by_id(repertoire.screening_room_id)
-        free_seats = screening_room.number_of_seats()
+        if not await self.reserve_seats(data.repertoire_id, data.number_of_seats):
+            return None
+        version = self._seat_inventory.version(data.repertoire_id)
 
-        return free_seats - taken_seats
+        try:
+            hold = await self._reservation_service.add_hold(data)
+        except Exception:
+            self.release_seats(data.repertoire_id, data.number_of_seats)
+            raise
 
+        if not hold:
+            self.release_seats(data.repertoire_id, data.number_of_seats)
+            return None
+
+        self._seat_inventory.track_hold(hold.id, hold.repertoire_id, hold.number_of_seats, version)
+
+        return hold
+
+    async def get_hold(self, hold_id: str) -> SeatHold | None:
+        """The method getting the active seat hold.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            SeatHold | None: The hold if it is active.
+        """
+
+        return await self._reservation_service.get_hold(hold_id)
+
+    async def release_hold(self, hold_id: str) -> SeatHold | None:
+        """The method ending the seat hold, freeing its seats.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            SeatHold | None: The ended hold if it was active.
+        """
+
+        if hold := await self._reservation_service.delete_hold(hold_id):
+            self._seat_inventory.release_hold(hold_id)
+
+        return hold
+
+    async def confirm_hold(self, hold_id: str, data: ReservationIn) -> Reservation | None:
+        """The method turning the seat hold into a reservation.
+
+        The held seats stay taken in the local counter. If the hold expired
+        meanwhile, the seats this process took for it and did not give back
+        yet are given back.
+
+        Args:
+            hold_id (str): The id of the hold.
+            data (ReservationIn): The details of the reservation matching the hold.
+
+        Returns:
+            Reservation | None: The new reservation or None if the hold is not
+                active for the same seats or the seats are not free any more.
+        """
+
+        reservation = await self._reservation_service.add_reservation(data, hold_id=hold_id)
+        if reservation:
+            self._seat_inventory.forget_hold(hold_id)
+        elif not await self.get_hold(hold_id):
+            self._seat_inventory.release_hold(hold_id)
+
+        return reservation
+
+    async def reconcile_seats(self) -> None:
+        """The method reloading free seats of upcoming repertoires from the repository.
+
+        Expired seat holds are removed first. Counters of past repertoires
+        are dropped and loaded again on demand.
+        """
+
+        await self._reservation_service.delete_expired_holds()
+        self._seat_inventory.replace(
+            await self._repertoire_repository.get_seats_from_date(date.today())
+        )
 
     async def get_by_screening_room_id(self, screening_room_id: int) -> List[Repertoire] | None:
         """The method getting repertoire by provided screening_room id.
@@ -85,10 +338,56 @@ class RepertoireService(IRepertoireService):
         Returns:
             Repertoire | None: The repertoire details.
         """
-        all_repertoires = await self.get_all()
-        filtered_repertoires = [repertoire for repertoire in all_repertoires if repertoire.screening_room_id == screening_room_id]
 
-        return filtered_repertoires
+        return await self._repertoire_repository.get_by_screening_room_id(screening_room_id)
+
+    async def get_by_dates(
+            self,
+            from_date: date | None = None,
+            to_date: date | None = None,
+            movie_id: int | None = None,
+            screening_room_id: int | None = None,
+            limit: int | None = None,
+            after: tuple[date, time, int] | None = None,
+    ) -> Iterable[Repertoire]:
+        """The method getting repertoires within the dates ordered by time.
+
+        Without the first date, the repertoires start from now, so past
+        showings are skipped. Without the last date, only repertoires of
+        the first date are returned.
+
+        Args:
+            from_date (date | None, optional): The first date of the repertoires.
+                Defaults to None.
+            to_date (date | None, optional): The last date of the repertoires.
+                Defaults to None.
+            movie_id (int | None, optional): The id of the movie. Defaults to None.
+            screening_room_id (int | None, optional): The id of the screening_room.
+                Defaults to None.
+            limit (int | None, optional): The maximum number of repertoires
+                to return. Defaults to None.
+            after (tuple[date, time, int] | None, optional): Return only
+                repertoires following this (date, start_time, id) cursor.
+                Defaults to None.
+
+        Returns:
+            Iterable[Repertoire]: Repertoires within the dates.
+        """
+
+        from_time = None
+        if from_date is None:
+            now = datetime.now()
+            from_date, from_time = now.date(), now.time()
+
+        return await self._repertoire_repository.get_by_dates(
+            from_date,
+            to_date or from_date,
+            from_time=from_time,
+            movie_id=movie_id,
+            screening_room_id=screening_room_id,
+            limit=limit,
+            after=after,
+        )
 
     async def get_by_movie_id(self, movie_id: int) -> List[Repertoire] | None:
         """The method getting repertoire by provided movie id.
@@ -99,10 +398,32 @@ class RepertoireService(IRepertoireService):
         Returns:
             Repertoire | None: The repertoire details.
         """
-        all_repertoires = await self.get_all()
-        filtered_repertoires = [repertoire for repertoire in all_repertoires if repertoire.movie_id == movie_id]
 
-        return filtered_repertoires
+        return await self._repertoire_repository.get_by_movie_id(movie_id)
+
+    async def exists_by_movie_id(self, movie_id: int) -> bool:
+        """The method checking if any repertoire of the movie exists.
+
+        Args:
+            movie_id (int): The id of the movie.
+
+        Returns:
+            bool: True if the movie has at least one repertoire.
+        """
+
+        return await self._repertoire_repository.exists_by_movie_id(movie_id)
+
+    async def exists_by_screening_room_id(self, screening_room_id: int) -> bool:
+        """The method checking if any repertoire in the screening_room exists.
+
+        Args:
+            screening_room_id (int): The id of the screening_room.
+
+        Returns:
+            bool: True if the screening_room has at least one repertoire.
+        """
+
+        return await self._repertoire_repository.exists_by_screening_room_id(screening_room_id)
 
     async def get_by_id(self, repertoire_id: int) -> Repertoire | None:
         """The method getting repertoire by provided id.
@@ -123,12 +444,51 @@ class RepertoireService(IRepertoireService):
             data (RepertoireIn): The details of the new repertoire.
 
         Returns:
-            Repertoire | None: Full details of the newly added repertoire.
+            Repertoire | None: Full details of the newly added repertoire or None
+                if it overlaps another repertoire in the screening room.
         """
 
 
         return await self._repertoire_repository.add_repertoire(data)
 
+    async def add_many(self, data: Iterable[RepertoireIn]) -> Iterable[Repertoire] | None:
+        """The method adding many repertoires to the data storage at once.
+
+        Args:
+            data (Iterable[RepertoireIn]): The details of the new repertoires.
+
+        Returns:
+            Iterable[Repertoire] | None: Full details of the newly added repertoires
+                or None if any of them overlaps another repertoire in its screening room.
+        """
+
+        return await self._repertoire_repository.add_many(data)
+
+    async def generate_schedule(self, request: ScheduleRequest) -> List[RepertoireIn]:
+        """The method planning repertoires filling the free screening room time.
+
+        Args:
+            request (ScheduleRequest): The parameters of the schedule.
+
+        Returns:
+            List[RepertoireIn]: The planned repertoires, not saved.
+        """
+
+        movies = await self._movie_service.get_all()
+        screening_rooms = await self._screening_room_service.get_all()
+        scheduled = await self._repertoire_repository.get_showings(
+            request.week_start - timedelta(days=1),
+            request.week_start + timedelta(days=request.days),
+        )
+
+        return generate_schedule(
+            movies,
+            screening_rooms,
+            scheduled,
+            request,
+            self._cleaning_buffer,
+        )
+
     async def update_repertoire(
             self,
             repertoire_id: int,
@@ -141,13 +501,18 @@ class RepertoireService(IRepertoireService):
             data (RepertoireIn): The details of the updated repertoire.
 
         Returns:
-            Repertoire | None: The updated repertoire details.
+            Repertoire | None: The updated repertoire details or None if it does not
+                exist, overlaps another repertoire in the screening room
+                or its reservations do not fit in the new room.
         """
 
-        return await self._repertoire_repository.update_repertoire(
+        repertoire = await self._repertoire_repository.update_repertoire(
             repertoire_id=repertoire_id,
             data=data,
         )
+        self._seat_inventory.forget(repertoire_id)
+
+        return repertoire
 
     async def delete_repertoire(self, repertoire_id: int) -> bool:
         """The method updating removing repertoire from the data storage.
@@ -159,4 +524,7 @@ class RepertoireService(IRepertoireService):
             bool: Success of the operation.
         """
 
-        return await self._repertoire_repository.delete_repertoire(repertoire_id)
\ No newline at end of file
+        deleted = await self._repertoire_repository.delete_repertoire(repertoire_id)
+        self._seat_inventory.forget(repertoire_id)
+
+        return deleted
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""Module containing report service implementation."""
+
+from datetime import date
+from typing import Iterable
+
+from cinema_management.core.domains.report import OccupancyReport, RevenueReport
+from cinema_management.core.repositories.i_report_repository import IReportRepository
+from cinema_management.core.services.i_report_service import IReportService
+
+
+class ReportService(IReportService):
+    """A class implementing the report service."""
+
+    _report_repository: IReportRepository
+
+    def __init__(self, report_repository: IReportRepository) -> None:
+        """The initializer of the `report service`.
+
+        Args:
+            report_repository (IReportRepository): The reference to the repository.
+        """
+        self._report_repository = report_repository
+
+    async def get_occupancy(self, from_date: date, to_date: date) -> Iterable[OccupancyReport]:
+        """The method getting seat occupancy grouped by day, movie and screening room.
+
+        Args:
+            from_date (date): The first date of the report.
+            to_date (date): The last date of the report.
+
+        Returns:
+            Iterable[OccupancyReport]: The occupancy rows.
+        """
+
+        return await self._report_repository.get_occupancy(from_date, to_date)
+
+    async def get_revenue(self, from_date: date, to_date: date) -> Iterable[RevenueReport]:
+        """The method getting revenue grouped by day, movie and screening room.
+
+        Args:
+            from_date (date): The first date of the report.
+            to_date (date): The last date of the report.
+
+        Returns:
+            Iterable[RevenueReport]: The revenue rows.
+        """
+
+        return await self._report_repository.get_revenue(from_date, to_date)
+
+    async def rebuild_rollups(self) -> None:
+        """The method computing the report rollups from all reservations."""
+
+        await self._report_repository.rebuild_rollups()
+
+    async def rollups_missing(self) -> bool:
+        """The method checking whether the report rollups lack existing reservations.
+
+        Returns:
+            bool: True if there are reservations but no rollups.
+        """
+
+        return await self._report_repository.rollups_missing()
@@ -1,55 +1,137 @@
 """Module containing continent service implementation."""
 
-from typing import Iterable, List
+import asyncio
+from concurrent.futures import Executor
+from datetime import date
+from typing import AsyncIterator, Iterable, List
 
 from cinema_management.core.domains.reservation import Reservation, ReservationIn
+from cinema_management.core.domains.seat_hold import SeatHold, SeatHoldIn
 from cinema_management.core.repositories.i_reservation_repository import IReservationRepository
 from cinema_management.core.services.i_reservation_service import IReservationService
+from cinema_management.utils.invoice import INVOICE_CHUNK_SIZE, invoice_data, render_invoices
 
 
 class ReservationService(IReservationService):
     """A class implementing the reservation service."""
 
     _reservation_repository: IReservationRepository
+    _invoice_executor: Executor
 
 
-    def __init__(self, reservation_repository: IReservationRepository) -> None:
+    def __init__(
+            self,
+            reservation_repository: IReservationRepository,
+            invoice_executor: Executor,
+    ) -> None:
         """The initializer of the `reservation service`.
 
         Args:
             reservation_repository (IReservationRepository): The reference to the repository.
+            invoice_executor (Executor): The pool rendering invoices.
         """
         self._reservation_repository = reservation_repository
+        self._invoice_executor = invoice_executor
+
+    async def get_all(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[Reservation]:
+        """The method getting reservations from the repository ordered by id.
 
-    async def get_all(self) -> Iterable[Reservation]:
-        """The method getting all reservations from the repository.
+        Args:
+            limit (int | None, optional): The maximum number of reservations
+                to return. Defaults to None.
+            after (int | None, optional): Return only reservations with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[Reservation]: All reservations.
         """
 
-        return await self._reservation_repository.get_all_reservations()
+        return await self._reservation_repository.get_all_reservations(limit=limit, after=after)
+
+    async def iterate_all(self) -> AsyncIterator[Reservation]:
+        """The method streaming all reservations from the repository.
+
+        Returns:
+            AsyncIterator[Reservation]: All reservations ordered by id.
+        """
+
+        async for reservation in self._reservation_repository.iterate_reservations():
+            yield reservation
 
 
-    async def invoice(self,reservation_id: id, address: str) -> dict:
-        """The method getting invoice by provided repertoire_id.
+    async def invoice(self, reservation_id: int, address: str) -> dict | None:
+        """The method getting invoice by provided reservation_id.
 
         Args:
-            reservation_id (int): The id of the repertoire.
-            address (str): The address.
+            reservation_id (int): The id of the reservation.
+            address (str): The address of the buyer.
 
         Returns:
-            invoice.
+            dict | None: The invoice if the reservation exists.
         """
+
         reservation = await self.get_by_id(reservation_id)
-        return {
-            "Buyer": reservation.firstName+" "+reservation.lastName,
-            "Buyer's address": address,
-            "Seller": "Cinema name",
-            "Seller's address": "Olsztyn ul kwiatowa 16 11-064 Olsztyn",
-            "items on invoice": str(reservation.number_of_seats)+" ticket(s)",
-            "price": str(reservation.get_price()) +" zł"
-        }
+
+        return invoice_data(reservation, address) if reservation else None
+
+    async def invoices(
+            self,
+            repertoire_id: int | None = None,
+            from_date: date | None = None,
+            to_date: date | None = None,
+    ) -> AsyncIterator[tuple[str, bytes]]:
+        """The method rendering invoices of a repertoire or of repertoires within the dates.
+
+        The reservations are fetched with a single query. Invoices are
+        rendered in chunks on the invoice executor, all chunks are submitted
+        at once and yielded in order as they complete.
+
+        The reservations do not store the addresses of the buyers, so
+        they are left off these invoices.
+
+        Args:
+            repertoire_id (int | None, optional): The id of the repertoire.
+                Defaults to None.
+            from_date (date | None, optional): The first date of the repertoires,
+                used without the repertoire_id. Defaults to None.
+            to_date (date | None, optional): The last date of the repertoires,
+                used without the repertoire_id. Defaults to None.
+
+        Returns:
+            AsyncIterator[tuple[str, bytes]]: The file names and HTML documents
+                of the invoices.
+        """
+
+        if repertoire_id is not None:
+            reservations = await self.get_by_repertoire_id(repertoire_id)
+        else:
+            reservations = await self._reservation_repository.get_by_dates(from_date, to_date)
+
+        invoices = [
+            (reservation.id, invoice_data(reservation))
+            for reservation in reservations
+        ]
+        chunks = [
+            invoices[i:i + INVOICE_CHUNK_SIZE]
+            for i in range(0, len(invoices), INVOICE_CHUNK_SIZE)
+        ]
+        loop = asyncio.get_running_loop()
+        rendered = [
+            loop.run_in_executor(self._invoice_executor, render_invoices, chunk)
+            for chunk in chunks
+        ]
+
+        try:
+            for chunk, documents in zip(chunks, rendered):
+                for (number, _), document in zip(chunk, await documents):
+                    yield f"invoice_{number}.html", document
+        finally:
+            for documents in rendered:
+                documents.cancel()
 
 
     async def get_by_id(self, reservation_id: int) -> Reservation | None:
@@ -73,10 +155,8 @@ class ReservationService(IReservationService):
         Returns:
             Reservation | None: The reservation details.
         """
-        all_reservations = await self.get_all()
-        filtered_reservations = [reservation for reservation in all_reservations if reservation.repertoire_id == repertoire_id]
 
-        return filtered_reservations
+        return await self._reservation_repository.get_by_repertoire_id(repertoire_id)
 
     async def count_all_reservation_repertoire_id(self, repertoire_id: id) -> int:
         """The method getting number of reservations by provided id.
@@ -90,18 +170,39 @@ class ReservationService(IReservationService):
         return len(await self.get_by_repertoire_id( repertoire_id))
 
 
-    async def add_reservation(self, data: ReservationIn) -> Reservation | None:
+    async def add_reservation(
+            self,
+            data: ReservationIn,
+            hold_id: str | None = None,
+    ) -> Reservation | None:
         """The method adding new reservation to the data storage.
 
         Args:
             data (ReservationIn): The details of the new reservation.
+            hold_id (str | None, optional): The id of the active hold whose
+                seats the reservation takes. Defaults to None.
 
         Returns:
-            Reservation | None: Full details of the newly added reservation.
+            Reservation | None: Full details of the newly added reservation or None
+                if the repertoire does not exist, has not enough available seats
+                or the hold is not active for the same seats.
         """
 
 
-        return await self._reservation_repository.add_reservation(data)
+        return await self._reservation_repository.add_reservation(data, hold_id=hold_id)
+
+    async def add_many(self, data: Iterable[ReservationIn]) -> Iterable[Reservation] | None:
+        """The method adding many reservations to the data storage at once.
+
+        Args:
+            data (Iterable[ReservationIn]): The details of the new reservations.
+
+        Returns:
+            Iterable[Reservation] | None: The newly added reservations or None if any
+                repertoire does not exist or has not enough available seats.
+        """
+
+        return await self._reservation_repository.add_many(data)
 
     async def update_reservation(
             self,
@@ -115,7 +216,8 @@ class ReservationService(IReservationService):
             data (ReservationIn): The details of the updated reservation.
 
         Returns:
-            Reservation | None: The updated reservation details.
+            Reservation | None: The updated reservation details or None if it does
+                not exist or the repertoire has not enough available seats.
         """
 
         return await self._reservation_repository.update_reservation(
@@ -123,14 +225,56 @@ class ReservationService(IReservationService):
             data=data,
         )
 
-    async def delete_reservation(self, reservation_id: int) -> bool:
+    async def delete_reservation(self, reservation_id: int) -> Reservation | None:
         """The method updating removing reservation from the data storage.
 
         Args:
             reservation_id (int): The id of the reservation.
 
         Returns:
-            bool: Success of the operation.
+            Reservation | None: The removed reservation.
+        """
+
+        return await self._reservation_repository.delete_reservation(reservation_id)
+
+    async def add_hold(self, data: SeatHoldIn) -> SeatHold | None:
+        """The method holding free seats of the repertoire for a limited time.
+
+        Args:
+            data (SeatHoldIn): The details of the hold.
+
+        Returns:
+            SeatHold | None: The new hold or None if the repertoire does not
+                exist or has not enough available seats.
         """
 
-        return await self._reservation_repository.delete_reservation(reservation_id)
\ No newline at end of file
+        return await self._reservation_repository.add_hold(data)
+
+    async def get_hold(self, hold_id: str) -> SeatHold | None:
+        """The method getting the active seat hold.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            SeatHold | None: The hold if it is active.
+        """
+
+        return await self._reservation_repository.get_hold(hold_id)
+
+    async def delete_hold(self, hold_id: str) -> SeatHold | None:
+        """The method ending the active seat hold, freeing its seats.
+
+        Args:
+            hold_id (str): The id of the hold.
+
+        Returns:
+            SeatHold | None: The ended hold if it was active.
+        """
+
+        return await self._reservation_repository.delete_hold(hold_id)
+
+    async def delete_expired_holds(self) -> None:
+        """The method removing holds past their expiry time."""
+
+        await self._reservation_repository.delete_expired_holds()
\ No newline at end of file
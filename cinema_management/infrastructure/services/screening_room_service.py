@@ -5,30 +5,48 @@ from typing import Iterable
 from cinema_management.core.domains.screeningroom import ScreeningRoom, ScreeningRoomIn
 from cinema_management.core.repositories.i_screening_room_repository import IScreeningRoomRepository
 from cinema_management.core.services.i_screening_room_service import IScreeningRoomService
+from cinema_management.infrastructure.services.seat_inventory import SeatInventory
 
 
 class ScreeningRoomService(IScreeningRoomService):
     """A class implementing the screening_room service."""
 
     _screening_room_repository: IScreeningRoomRepository
+    _seat_inventory: SeatInventory
 
 
-    def __init__(self, screening_room_repository: IScreeningRoomRepository) -> None:
+    def __init__(
+            self,
+            screening_room_repository: IScreeningRoomRepository,
+            seat_inventory: SeatInventory,
+    ) -> None:
         """The initializer of the `screening_room service`.
 
         Args:
             screening_room_repository (IScreeningRoomRepository): The reference to the repository.
+            seat_inventory (SeatInventory): The reference to the free seats counters.
         """
         self._screening_room_repository = screening_room_repository
+        self._seat_inventory = seat_inventory
+
+    async def get_all(
+            self,
+            limit: int | None = None,
+            after: int | None = None,
+    ) -> Iterable[ScreeningRoom]:
+        """The method getting screening_rooms from the repository ordered by id.
 
-    async def get_all(self) -> Iterable[ScreeningRoom]:
-        """The method getting all screening_rooms from the repository.
+        Args:
+            limit (int | None, optional): The maximum number of screening_rooms
+                to return. Defaults to None.
+            after (int | None, optional): Return only screening_rooms with id
+                greater than this cursor. Defaults to None.
 
         Returns:
             Iterable[ScreeningRoom]: All screening_rooms.
         """
 
-        return await self._screening_room_repository.get_all_screening_rooms()
+        return await self._screening_room_repository.get_all_screening_rooms(limit=limit, after=after)
 
     async def get_by_id(self, screening_room_id: int) -> ScreeningRoom | None:
         """The method getting screening_room by provided id.
@@ -54,6 +72,30 @@ class ScreeningRoomService(IScreeningRoomService):
 
         return await self._screening_room_repository.add_screening_room(data)
 
+    async def add_many(self, data: Iterable[ScreeningRoomIn]) -> Iterable[ScreeningRoom]:
+        """The method adding many screening_rooms to the data storage at once.
+
+        Args:
+            data (Iterable[ScreeningRoomIn]): The details of the new screening_rooms.
+
+        Returns:
+            Iterable[ScreeningRoom]: Full details of the newly added screening_rooms.
+        """
+
+        return await self._screening_room_repository.add_many(data)
+
+    async def get_existing_ids(self, screening_room_ids: Iterable[int]) -> set[int]:
+        """The method getting which of the provided screening_room ids exist.
+
+        Args:
+            screening_room_ids (Iterable[int]): The ids to look up.
+
+        Returns:
+            set[int]: The ids present in the data storage.
+        """
+
+        return await self._screening_room_repository.get_existing_ids(screening_room_ids)
+
     async def update_screening_room(
             self,
             screening_room_id: int,
@@ -61,22 +103,32 @@ class ScreeningRoomService(IScreeningRoomService):
     ) -> ScreeningRoom | None:
         """The method updating screening_room data in the data storage.
 
+        Free seats counters are dropped, as the capacity of the repertoires
+        in the room may have changed.
+
         Args:
             screening_room_id (int): The id of the screening_room.
             data (ScreeningRoomIn): The details of the updated screening_room.
 
         Returns:
-            ScreeningRoom | None: The updated screening_room details.
+            ScreeningRoom | None: The updated screening_room details or None if it
+                does not exist or the reservations do not fit in the new size.
         """
 
-        return await self._screening_room_repository.update_screening_room(
+        screening_room = await self._screening_room_repository.update_screening_room(
             screening_room_id=screening_room_id,
             data=data,
         )
+        if screening_room:
+            self._seat_inventory.clear()
+
+        return screening_room
 
     async def delete_screening_room(self, screening_room_id: int) -> bool:
         """The method updating removing screening_room from the data storage.
 
+        Free seats counters are dropped along with the repertoires in the room.
+
         Args:
             screening_room_id (int): The id of the screening_room.
 
@@ -84,4 +136,7 @@ class ScreeningRoomService(IScreeningRoomService):
             bool: Success of the operation.
         """
 
-        return await self._screening_room_repository.delete_screening_room(screening_room_id)
+        if deleted := await self._screening_room_repository.delete_screening_room(screening_room_id):
+            self._seat_inventory.clear()
+
+        return deleted
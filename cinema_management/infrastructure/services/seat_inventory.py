@@ -0,0 +1,216 @@
+"""Module containing in-memory seat inventory implementation."""
+
+from typing import Iterable, Mapping
+
+from cinema_management.core.domains.repertoire import RepertoireSeats
+
+
+class SeatInventory:
+    """A class keeping live free-seat counters of repertoires in memory.
+
+    Counters are changed without awaiting anything in between the check
+    and the update, so every operation is atomic within the event loop.
+    Seats held during checkout are stored in the DB and are not available
+    when the counters are loaded.
+
+    The counters live in the memory of one process. With several workers
+    each keeps its own, and they drift apart until the next reconciliation.
+    They only let requests through to the DB: a reservation is accepted
+    once the DB finds enough free seats under the repertoire lock, and a
+    counter refusing seats is reloaded from the DB before the request is
+    rejected.
+
+    Seats taken for holds are tracked by hold until they are given back.
+    A counter set from the DB again already reflects the hold, so its
+    tracked holds are dropped then and never give their seats back twice.
+    """
+
+    _free_seats: dict[int, int]
+    _versions: dict[int, int]
+    _next_version: int
+    _holds: dict[str, tuple[int, int, int]]
+
+    def __init__(self) -> None:
+        """The initializer of the `seat inventory`."""
+        self._free_seats = {}
+        self._versions = {}
+        self._next_version = 0
+        self._holds = {}
+
+    def get(self, repertoire_id: int) -> int | None:
+        """The method getting the free seats counter of the repertoire.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            int | None: The number of free seats if the counter is loaded.
+        """
+
+        return self._free_seats.get(repertoire_id)
+
+    def load(self, seats: Iterable[RepertoireSeats]) -> None:
+        """The method setting counters from the seat occupancy.
+
+        Args:
+            seats (Iterable[RepertoireSeats]): The seat occupancy of repertoires.
+        """
+
+        for repertoire_seats in seats:
+            self._free_seats[repertoire_seats.repertoire_id] = repertoire_seats.available_seats
+            self._set_version(repertoire_seats.repertoire_id)
+
+    def replace(self, seats: Iterable[RepertoireSeats]) -> None:
+        """The method replacing all counters with the seat occupancy.
+
+        Args:
+            seats (Iterable[RepertoireSeats]): The seat occupancy of repertoires.
+        """
+
+        self.clear()
+        self.load(seats)
+
+    def reserve(self, repertoire_id: int, number_of_seats: int) -> bool:
+        """The method taking seats from the loaded counter if enough are free.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+            number_of_seats (int): The number of seats to take. A negative
+                number gives seats back.
+
+        Returns:
+            bool: True if the seats were taken.
+        """
+
+        return self.reserve_many({repertoire_id: number_of_seats})
+
+    def reserve_many(self, number_of_seats: Mapping[int, int]) -> bool:
+        """The method taking seats from many loaded counters, all or nothing.
+
+        Args:
+            number_of_seats (Mapping[int, int]): The number of seats by
+                repertoire id.
+
+        Returns:
+            bool: True if the seats were taken from every counter.
+        """
+
+        for repertoire_id, seats in number_of_seats.items():
+            free_seats = self._free_seats.get(repertoire_id)
+            if free_seats is None or free_seats < seats:
+                return False
+
+        for repertoire_id, seats in number_of_seats.items():
+            self._free_seats[repertoire_id] -= seats
+
+        return True
+
+    def release(self, repertoire_id: int, number_of_seats: int) -> None:
+        """The method giving seats back to the loaded counter.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+            number_of_seats (int): The number of seats to give back.
+        """
+
+        self.release_many({repertoire_id: number_of_seats})
+
+    def release_many(self, number_of_seats: Mapping[int, int]) -> None:
+        """The method giving seats back to many loaded counters.
+
+        Args:
+            number_of_seats (Mapping[int, int]): The number of seats by
+                repertoire id.
+        """
+
+        for repertoire_id, seats in number_of_seats.items():
+            if repertoire_id in self._free_seats:
+                self._free_seats[repertoire_id] += seats
+
+    def version(self, repertoire_id: int) -> int | None:
+        """The method getting the version of the counter of the repertoire.
+
+        The version changes whenever the counter is set from the DB.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+
+        Returns:
+            int | None: The version if the counter is loaded.
+        """
+
+        return self._versions.get(repertoire_id)
+
+    def track_hold(
+            self,
+            hold_id: str,
+            repertoire_id: int,
+            number_of_seats: int,
+            version: int | None,
+    ) -> None:
+        """The method remembering the seats taken from the counter for the hold.
+
+        Args:
+            hold_id (str): The id of the hold.
+            repertoire_id (int): The id of the repertoire.
+            number_of_seats (int): The number of held seats.
+            version (int | None): The version of the counter read when the
+                seats were taken. If the counter was set from the DB since,
+                it does not miss these seats and the hold is not tracked.
+        """
+
+        if version is not None and self._versions.get(repertoire_id) == version:
+            self._holds[hold_id] = (repertoire_id, number_of_seats, version)
+
+    def release_hold(self, hold_id: str) -> None:
+        """The method giving the seats of the hold back to the counter.
+
+        Nothing is given back if the seats were not taken for the hold by
+        this process, or the counter was set from the DB since.
+
+        Args:
+            hold_id (str): The id of the hold.
+        """
+
+        if (hold := self._holds.pop(hold_id, None)) is None:
+            return
+
+        repertoire_id, number_of_seats, version = hold
+        if self._versions.get(repertoire_id) == version:
+            self._free_seats[repertoire_id] += number_of_seats
+
+    def forget_hold(self, hold_id: str) -> None:
+        """The method dropping the hold, keeping its seats taken.
+
+        Args:
+            hold_id (str): The id of the hold.
+        """
+
+        self._holds.pop(hold_id, None)
+
+    def forget(self, repertoire_id: int) -> None:
+        """The method dropping the counter of the repertoire.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+        """
+
+        self._free_seats.pop(repertoire_id, None)
+        self._versions.pop(repertoire_id, None)
+
+    def clear(self) -> None:
+        """The method dropping all counters, so they are loaded again on demand."""
+
+        self._free_seats = {}
+        self._versions = {}
+        self._holds = {}
+
+    def _set_version(self, repertoire_id: int) -> None:
+        """A private method marking the counter of the repertoire as set from the DB.
+
+        Args:
+            repertoire_id (int): The id of the repertoire.
+        """
+
+        self._versions[repertoire_id] = self._next_version
+        self._next_version += 1
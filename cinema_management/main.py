@@ -1,15 +1,18 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 
 from cinema_management.api.routers.movie import router as movie_router
+from cinema_management.api.routers.report import router as report_router
 from cinema_management.api.routers.reservation import router as reservation_router
 from cinema_management.api.routers.repertoire import router as repertoire_router
 from cinema_management.api.routers.screening_room import router as screening_room_router
 
+from cinema_management.config import config
 from cinema_management.container import Container
-from cinema_management.db import database
+from cinema_management.db import close_db
 from cinema_management.db import init_db
 from cinema_management.utils import setup
 
@@ -20,17 +23,42 @@ container.wire(modules=[
     "cinema_management.api.routers.screening_room",
     "cinema_management.api.routers.repertoire",
     "cinema_management.api.routers.reservation",
-    "cinema_management.utils.setup"
+    "cinema_management.api.routers.report",
 ])
 
+async def reconcile_seats(interval: float) -> None:
+    """Function periodically checking the seat inventory against the DB.
+
+    Args:
+        interval (float): The number of seconds between the checks.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await container.repertoire_service().reconcile_seats()
+        except Exception as e:
+            print(f"Seat inventory reconciliation failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
     await init_db()
-    await database.connect()
-    await  setup.main()
+    if config.SEED_DB:
+        await setup.main()
+    report_service = container.report_service()
+    if config.SEED_DB or config.REBUILD_ROLLUPS or await report_service.rollups_missing():
+        await report_service.rebuild_rollups()
+    await container.repertoire_service().reconcile_seats()
+    reconciliation = asyncio.create_task(
+        reconcile_seats(config.SEAT_INVENTORY_RECONCILE_SECONDS)
+    )
     yield
-    await database.disconnect()
+    reconciliation.cancel()
+    with suppress(asyncio.CancelledError):
+        await reconciliation
+    container.shutdown_resources()
+    await close_db()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -38,4 +66,5 @@ app = FastAPI(lifespan=lifespan)
 app.include_router(movie_router, prefix="/movie")
 app.include_router(screening_room_router, prefix="/screening_room")
 app.include_router(repertoire_router, prefix="/repertoire")
-app.include_router(reservation_router, prefix="/reservation")
\ No newline at end of file
+app.include_router(reservation_router, prefix="/reservation")
+app.include_router(report_router, prefix="/reports")
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""A module providing in-process caches."""
+
+import datetime
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class DailyCache:
+    """A class holding a single value until the next local midnight.
+
+    Every clear bumps `generation`, so a value read from the data storage
+    before a clear can be told apart from a fresh one and left out.
+    """
+
+    _value: Any
+    _day: datetime.date | None
+    generation: int
+
+    def __init__(self) -> None:
+        """The initializer of the `daily cache`."""
+        self._value = None
+        self._day = None
+        self.generation = 0
+
+    def get(self) -> Any | None:
+        """The method getting the value cached today.
+
+        Returns:
+            Any | None: The cached value or None if it expired.
+        """
+
+        if self._day != datetime.date.today():
+            return None
+
+        return self._value
+
+    def set(self, value: Any, generation: int | None = None) -> None:
+        """The method caching the value until the next local midnight.
+
+        Args:
+            value (Any): The value to cache.
+            generation (int | None, optional): The generation read before
+                the value was loaded. The value is not cached if the cache
+                was cleared since. Defaults to None.
+        """
+
+        if generation is not None and generation != self.generation:
+            return
+
+        self._value = value
+        self._day = datetime.date.today()
+
+    def clear(self) -> None:
+        """The method dropping the cached value."""
+
+        self._value = None
+        self._day = None
+        self.generation += 1
+
+
+class LRUCache:
+    """A class holding a bounded number of values for a limited time.
+
+    The least recently used entry is evicted when the cache is full and
+    entries older than `ttl` seconds are treated as missing.
+    """
+
+    _entries: OrderedDict[Hashable, tuple[float, Any]]
+    _maxsize: int
+    _ttl: float
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """The initializer of the `LRU cache`.
+
+        Args:
+            maxsize (int): The maximum number of entries.
+            ttl (float): The lifetime of an entry in seconds.
+        """
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """The method getting the value cached under the key.
+
+        Args:
+            key (Hashable): The key of the entry.
+
+        Returns:
+            Any | None: The cached value or None if missing or expired.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """The method caching the value under the key.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to cache.
+        """
+
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """The method dropping the entry cached under the key.
+
+        Args:
+            key (Hashable): The key of the entry.
+        """
+
+        self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """The method getting the cache counters.
+
+        Returns:
+            dict[str, int]: The hits, misses, evictions and current size.
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
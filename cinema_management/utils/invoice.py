@@ -0,0 +1,85 @@
+"""A module preparing reservation invoices."""
+
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+from typing import Iterator, List
+
+from cinema_management.core.domains.reservation import Reservation
+
+SELLER = "Cinema name"
+SELLER_ADDRESS = "Olsztyn ul kwiatowa 16 11-064 Olsztyn"
+INVOICE_CHUNK_SIZE = 200
+
+INVOICE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Invoice {number}</title></head>
+<body>
+<h1>Invoice {number}</h1>
+<table>
+{rows}
+</table>
+</body>
+</html>
+"""
+
+
+def invoice_data(reservation: Reservation, address: str | None = None) -> dict:
+    """Function preparing the invoice of the reservation.
+
+    Args:
+        reservation (Reservation): The reservation.
+        address (str | None, optional): The address of the buyer, left
+            off the invoice when None. Defaults to None.
+
+    Returns:
+        dict: The invoice fields.
+    """
+    invoice = {"Buyer": reservation.firstName+" "+reservation.lastName}
+    if address is not None:
+        invoice["Buyer's address"] = address
+
+    return invoice | {
+        "Seller": SELLER,
+        "Seller's address": SELLER_ADDRESS,
+        "items on invoice": str(reservation.number_of_seats)+" ticket(s)",
+        "price": str(reservation.get_price()) +" zł"
+    }
+
+
+def render_invoices(invoices: List[tuple[int, dict]]) -> List[bytes]:
+    """Function rendering invoices as HTML documents.
+
+    It runs in worker processes, so it only takes and returns picklable
+    plain data.
+
+    Args:
+        invoices (List[tuple[int, dict]]): The invoice numbers and fields.
+
+    Returns:
+        List[bytes]: The UTF-8 encoded documents.
+    """
+    return [
+        INVOICE_TEMPLATE.format(
+            number=number,
+            rows="\n".join(
+                f"<tr><th>{escape(name)}</th><td>{escape(value)}</td></tr>"
+                for name, value in invoice.items()
+            ),
+        ).encode()
+        for number, invoice in invoices
+    ]
+
+
+def init_invoice_executor(max_workers: int | None) -> Iterator[ProcessPoolExecutor]:
+    """Function providing the process pool rendering invoices.
+
+    Args:
+        max_workers (int | None): The number of worker processes,
+            None for the number of CPUs.
+
+    Returns:
+        Iterator[ProcessPoolExecutor]: The pool, shut down on resource shutdown.
+    """
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    yield executor
+    executor.shutdown(cancel_futures=True)
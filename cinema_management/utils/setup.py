@@ -1,179 +1,72 @@
-from dependency_injector.wiring import Provide
-from datetime import date
-from datetime import time
-
-from cinema_management.core.domains.movie import MovieIn
-from cinema_management.core.domains.screeningroom import ScreeningRoomIn
-from cinema_management.core.domains.reservation import ReservationIn
-from cinema_management.core.domains.repertoire import RepertoireIn
-from cinema_management.core.services.i_reservation_service import IReservationService
-from cinema_management.core.services.i_repertoire_service import IRepertoireService
-from cinema_management.core.services.i_screening_room_service import IScreeningRoomService
-from cinema_management.core.services.i_movie_service import IMovieService
-from cinema_management.container import Container
-from cinema_management.db import screening_rooms_table
-
-
-async def main(
-        movie_service: IMovieService = Provide[Container.movie_service],
-        repertoire_service: IRepertoireService = Provide[Container.repertoire_service],
-        reservation_service: IReservationService = Provide[Container.reservation_service],
-        screening_room_service: IScreeningRoomService = Provide[Container.screening_room_service]
-
-):
-    movies=[]
-    screening_rooms =[]
-    repertoires =[]
-    reservations=[]
-
-    movies.append(await movie_service.add_movie(MovieIn(
-        name="shrek",
-        length=2.7,
-        premiere=date(2024, 12, 25),
-        director="Maciej Kornatow"
-    )))
-
-    movies.append(await movie_service.add_movie(MovieIn(
-        name="sonic",
-        length=2.2,
-        premiere=date(2024, 12, 12),
-        director="Maciej Kornatow"
-    )))
-
-    movies.append(await movie_service.add_movie(MovieIn(
-        name="glawiator 2",
-        length=2.7,
-        premiere=date(2025, 11, 25),
-        director="Maciej Kornatow"
-    )))
-
-    movies.append(await movie_service.add_movie(MovieIn(
-        name="catman",
-        length=2.7,
-        premiere=date(2025, 2, 25),
-        director="Maciej Kornatow"
-    )))
-
-
-    movies.append(await movie_service.add_movie(MovieIn(
-        name="wicked",
-        length=3.1,
-        premiere=date(2024, 12, 1),
-        director="Maciej Kornatow"
-    )))
-
-    movies.append(await movie_service.add_movie(MovieIn(
-        name="Grinch",
-        length=2.11,
-        premiere=date(200, 2, 12),
-        director="Maciej Kornatow"
-    )))
-
-    movies.append(await movie_service.add_movie(MovieIn(
-        name="Smerfy",
-        length=1.8,
-        premiere=date(2025, 1, 30),
-        director="Maciej Kornatow"
-    )))
-
-    movies.append(await movie_service.add_movie(MovieIn(
-        name="Awatar",
-        length=3.4,
-        premiere=date(2013, 2, 7),
-        director="Maciej Kornatow"
-    )))
-
-    movies.append(await movie_service.add_movie(MovieIn(
-        name="Warcraft",
-        length=3.3,
-        premiere=date(2018, 5, 12),
-        director="Maciej Kornatow"
-    )))
-
-    movies.append(await movie_service.add_movie(MovieIn(
-        name="Matylda",
-        length=2.8,
-        premiere=date(2025, 12, 1),
-        director="Maciej Kornatow"
-    )))
-
-    screening_rooms.append(await screening_room_service.add_screening_room(ScreeningRoomIn(
-        number= 1,
-        rows_count= 13,
-        seats_in_row= 22
-    )))
-
-    screening_rooms.append(await screening_room_service.add_screening_room(ScreeningRoomIn(
-        number= 2,
-        rows_count= 2,
-        seats_in_row= 2
-    )))
-
-    screening_rooms.append(await screening_room_service.add_screening_room(ScreeningRoomIn(
-        number= 3,
-        rows_count= 14,
-        seats_in_row= 36
-    )))
-
-
-    repertoires.append(await repertoire_service.add_repertoire(RepertoireIn(
-        movie_id= movies[1].id,
-        screening_room_id = screening_rooms[1].id,
-        start_time= time(12,10),
-        date =date(2025,1,8)
-    )))
-
-    repertoires.append(await repertoire_service.add_repertoire(RepertoireIn(
-        movie_id= movies[0].id,
-        screening_room_id = screening_rooms[1].id,
-        start_time= time(14,30),
-        date =date(2025,1,8)
-    )))
-
-    repertoires.append(await repertoire_service.add_repertoire(RepertoireIn(
-        movie_id= movies[0].id,
-        screening_room_id = screening_rooms[1].id,
-        start_time= time(17,20),
-        date =date(2025,1,8)
-    )))
-
-    repertoires.append(await repertoire_service.add_repertoire(RepertoireIn(
-        movie_id= movies[3].id,
-        screening_room_id = screening_rooms[2].id,
-        start_time= time(20,00),
-        date =date(2025,1,8)
-    )))
-
-    reservations.append(await reservation_service.add_reservation(ReservationIn(
-        repertoire_id= repertoires[0].id,
-        firstName= "Franek",
-        lastName= "Kowalski",
-        telephone= "666000999",
-        email= "kamil@gmail.com",
-        number_of_seats=2
-
-    )))
-
-    reservations.append(await reservation_service.add_reservation(ReservationIn(
-        repertoire_id= repertoires[1].id,
-        firstName= "Marek",
-        lastName= "Kowalski",
-        telephone= "666000999",
-        email= "kamil@gmail.com",
-        number_of_seats=2
-
-    )))
-
-    reservations.append(await reservation_service.add_reservation(ReservationIn(
-        repertoire_id= repertoires[2].id,
-        firstName= "Marek",
-        lastName= "Kowalski",
-        telephone= "666000999",
-        email= "kamil@gmail.com",
-        number_of_seats=2
-
-    )))
-
-
-
- 
\ No newline at end of file
+"""A module loading fixture data into the DB."""
+
+import json
+from pathlib import Path
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from cinema_management.config import config
+from cinema_management.core.domains.movie import Movie
+from cinema_management.core.domains.screeningroom import ScreeningRoom
+from cinema_management.core.domains.reservation import Reservation
+from cinema_management.core.domains.repertoire import Repertoire
+from cinema_management.db import (
+    BULK_INSERT_CHUNK_SIZE,
+    movies_table,
+    screening_rooms_table,
+    repertoires_table,
+    reservations_table,
+    database,
+)
+
+DEFAULT_FIXTURE = Path(__file__).parent / "fixtures" / "demo.json"
+
+FIXTURE_TABLES = (
+    ("movies", movies_table, Movie),
+    ("screening_rooms", screening_rooms_table, ScreeningRoom),
+    ("repertoires", repertoires_table, Repertoire),
+    ("reservations", reservations_table, Reservation),
+)
+
+
+async def load_fixture(path: str | Path) -> None:
+    """Function bulk-loading a JSON fixture into the DB.
+
+    Rows keep the ids from the fixture and rows already present are
+    skipped, so loading the same fixture again is a no-op. Id sequences
+    are moved past the loaded rows afterwards.
+
+    Args:
+        path (str | Path): The path of the fixture file.
+    """
+    fixture = json.loads(Path(path).read_text(encoding="utf-8"))
+
+    async with database.transaction():
+        for name, table, model in FIXTURE_TABLES:
+            rows = [model(**row).model_dump() for row in fixture.get(name, [])]
+            if not rows:
+                continue
+
+            for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                query = (
+                    insert(table)
+                    .values(rows[start:start + BULK_INSERT_CHUNK_SIZE])
+                    .on_conflict_do_nothing(index_elements=[table.c.id])
+                )
+                await database.execute(query)
+
+            await database.execute(select(func.setval(
+                func.pg_get_serial_sequence(table.name, "id"),
+                select(func.max(table.c.id)).scalar_subquery(),
+            )))
+
+
+async def main(path: str | Path | None = None) -> None:
+    """Function seeding the DB with the configured fixture.
+
+    Args:
+        path (str | Path | None, optional): The path of the fixture file.
+            Defaults to `SEED_FILE` or the bundled demo fixture.
+    """
+    await load_fixture(path or config.SEED_FILE or DEFAULT_FIXTURE)
@@ -0,0 +1,26 @@
+"""Tests of the demo data seeded into the DB."""
+import json
+from datetime import date, time, timedelta
+
+from cinema_management.config import config
+from cinema_management.core.domains.schedule import Showing, find_conflicts
+from cinema_management.utils.setup import DEFAULT_FIXTURE
+
+
+def test_demo_showings_do_not_overlap() -> None:
+    fixture = json.loads(DEFAULT_FIXTURE.read_text())
+    lengths = {movie["id"]: movie["length"] for movie in fixture["movies"]}
+    buffer = timedelta(minutes=config.CLEANING_BUFFER_MINUTES)
+
+    showings = [
+        Showing.of(
+            repertoire["screening_room_id"],
+            date.fromisoformat(repertoire["date"]),
+            time.fromisoformat(repertoire["start_time"]),
+            lengths[repertoire["movie_id"]],
+            buffer,
+        )
+        for repertoire in fixture["repertoires"]
+    ]
+
+    assert find_conflicts([], showings) == []
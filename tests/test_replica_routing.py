@@ -0,0 +1,163 @@
+"""Tests of routing queries between the primary DB and the replicas.
+
+The DBs are replaced by stand-ins counting the queries they serve, so
+no PostgreSQL is needed.
+"""
+import asyncio
+from datetime import date
+from typing import Any
+
+import pytest
+
+from cinema_management import db
+from cinema_management.infrastructure.repositories.cached_movie_repository import CachedMovieRepository
+from cinema_management.infrastructure.repositories.movie_repository import MovieRepository
+from cinema_management.core.domains.movie import MovieIn
+from cinema_management.infrastructure.services.movie_service import MovieService
+from cinema_management.utils.cache import DailyCache, LRUCache
+
+
+class CountingDatabase:
+    """A stand-in DB counting the queries it serves.
+
+    Every backend holds its own copy of one movie, so a replica lagging
+    behind the primary can be told apart by the data it returns.
+    """
+
+    def __init__(self, name: str) -> None:
+        """The initializer of the `counting database`.
+
+        Args:
+            name (str): The name of the stored movie.
+        """
+        self.queries = 0
+        self.movie = {
+            "id": 1,
+            "name": name,
+            "length": 2.0,
+            "premiere": date(2024, 1, 1),
+            "director": "Director",
+        }
+
+    @property
+    def raw_connection(self) -> "CountingDatabase":
+        """The stand-in of the asyncpg connection."""
+        return self
+
+    def connection(self) -> "CountingDatabase":
+        """The method getting the stand-in of the pooled connection."""
+        return self
+
+    async def __aenter__(self) -> "CountingDatabase":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def fetch_one(self, query: Any) -> dict[str, Any]:
+        """The method serving a query built by the repositories."""
+        self.queries += 1
+        return self.movie
+
+    async def fetch_all(self, query: Any) -> list[dict[str, Any]]:
+        """The method serving a query built by the repositories."""
+        self.queries += 1
+        return [self.movie]
+
+    async def fetchrow(self, sql: str, *params: Any) -> dict[str, Any]:
+        """The method serving a compiled query."""
+        self.queries += 1
+        return self.movie
+
+
+@pytest.fixture
+def backends(monkeypatch: pytest.MonkeyPatch) -> tuple[CountingDatabase, CountingDatabase]:
+    """Fixture replacing the primary and the only replica by stand-ins.
+
+    The replica lags behind and still returns the old name of the movie.
+    """
+    primary = CountingDatabase("New name")
+    replica = CountingDatabase("Old name")
+    monkeypatch.setattr(db, "database", primary)
+    monkeypatch.setattr(db, "replicas", [replica])
+    monkeypatch.setattr(db, "_next_replica", iter(lambda: replica, None))
+
+    return primary, replica
+
+
+def movie_in() -> MovieIn:
+    return MovieIn(name="New name", length=2.0, premiere=date(2024, 1, 1), director="Director")
+
+
+def test_reads_go_to_replicas_until_request_writes(backends) -> None:
+    primary, replica = backends
+
+    async def request() -> None:
+        repository = MovieRepository()
+        await repository.get_by_id(1)
+        await repository.get_all_movies()
+        assert (primary.queries, replica.queries) == (0, 2)
+
+        await repository.update_movie(1, movie_in())
+        assert (await repository.get_by_id(1)).name == "New name"
+        assert (primary.queries, replica.queries) == (2, 2)
+
+    asyncio.run(request())
+
+    # The next request is not pinned by the write of the previous one.
+    asyncio.run(MovieRepository().get_by_id(1))
+    assert (primary.queries, replica.queries) == (2, 3)
+
+
+def test_cache_is_not_refilled_from_lagging_replica(backends) -> None:
+    primary, replica = backends
+    repository = CachedMovieRepository(MovieRepository(), LRUCache(maxsize=10, ttl=60))
+
+    asyncio.run(repository.update_movie(1, movie_in()))
+    movie = asyncio.run(repository.get_by_id(1))
+    cached = asyncio.run(repository.get_by_id(1))
+
+    assert movie.name == cached.name == "New name"
+    assert (primary.queries, replica.queries) == (2, 0)
+
+
+def test_primary_reads_keep_pin_of_write(backends) -> None:
+    primary, replica = backends
+
+    async def request() -> None:
+        with db.primary_reads():
+            assert db.reader() is primary
+            db.writer()
+        assert db.reader() is primary
+
+    asyncio.run(request())
+    assert db.reader() is replica
+
+
+def test_upcoming_movies_are_refilled_from_primary(backends) -> None:
+    primary, replica = backends
+    service = MovieService(MovieRepository(), DailyCache())
+
+    movies = asyncio.run(service.get_all_upcoming_movies())
+    cached = asyncio.run(service.get_all_upcoming_movies())
+
+    assert movies == cached
+    assert movies[0].name == "New name"
+    assert (primary.queries, replica.queries) == (1, 0)
+
+
+def test_upcoming_movies_changed_during_refill_are_not_cached(backends) -> None:
+    primary, replica = backends
+    cache = DailyCache()
+    service = MovieService(MovieRepository(), cache)
+    fetch_all = primary.fetch_all
+
+    async def fetch_all_during_write(query: Any) -> list[dict[str, Any]]:
+        movies = await fetch_all(query)
+        cache.clear()
+        return movies
+
+    primary.fetch_all = fetch_all_during_write  # type: ignore[method-assign]
+    asyncio.run(service.get_all_upcoming_movies())
+
+    assert cache.get() is None
@@ -0,0 +1,229 @@
+"""Stress tests of concurrent reservations and seat holds against PostgreSQL.
+
+They need the DB configured by the `DB_*` variables, for example
+`DB_HOST=localhost DB_NAME=app DB_USER=postgres DB_PASSWORD=pass
+python -m pytest tests`. Without DB_HOST they are skipped, and with it
+an unreachable DB fails them.
+"""
+import asyncio
+from datetime import date, time
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+import pytest
+from sqlalchemy import func, select
+
+from cinema_management.config import config
+from cinema_management.core.domains.movie import MovieIn
+from cinema_management.core.domains.repertoire import RepertoireIn
+from cinema_management.core.domains.reservation import ReservationIn
+from cinema_management.core.domains.screeningroom import ScreeningRoomIn
+from cinema_management.core.domains.seat_hold import SeatHoldIn
+from cinema_management.db import (
+    close_db,
+    database,
+    init_db,
+    movies_table,
+    repertoires_table,
+    reservations_table,
+    screening_rooms_table,
+    seat_holds_table,
+)
+from cinema_management.infrastructure.repositories.movie_repository import MovieRepository
+from cinema_management.infrastructure.repositories.repertoire_repository import RepertoireRepository
+from cinema_management.infrastructure.repositories.reservation_repository import ReservationRepository
+from cinema_management.infrastructure.repositories.screening_room_repository import (
+    Screening_roomRepository,
+)
+
+ROWS_COUNT = 20
+SEATS_IN_ROW = 50
+CAPACITY = ROWS_COUNT * SEATS_IN_ROW
+PARALLEL_REQUESTS = 3000
+# Writes to one repertoire queue on its row lock, so this is a floor for
+# a single serialized repertoire, not for the whole app.
+MIN_WRITES_PER_SECOND = 200
+
+pytestmark = pytest.mark.skipif(
+    not config.DB_HOST,
+    reason="DB_HOST is not configured, the PostgreSQL stress tests did not run",
+)
+
+
+def run_on_repertoire(scenario: Callable[[int], Awaitable[Any]]) -> None:
+    """Function running the scenario on a new repertoire and removing it after.
+
+    Args:
+        scenario (Callable[[int], Awaitable[Any]]): The scenario taking
+            the id of the repertoire.
+    """
+
+    async def run() -> None:
+        try:
+            await init_db(retries=1, delay=0)
+        except ConnectionError:
+            pytest.fail(f"DB at {config.DB_HOST} is not reachable")
+
+        movie = await MovieRepository().add_movie(MovieIn(
+            name="Stress test",
+            length=2.0,
+            premiere=date(2024, 1, 1),
+            director="Test",
+        ))
+        screening_room = await Screening_roomRepository().add_screening_room(ScreeningRoomIn(
+            number=0,
+            rows_count=ROWS_COUNT,
+            seats_in_row=SEATS_IN_ROW,
+        ))
+        repertoire = await RepertoireRepository(cleaning_buffer_minutes=15).add_repertoire(
+            RepertoireIn(
+                movie_id=movie.id,
+                screening_room_id=screening_room.id,
+                start_time=time(12, 0),
+                date=date(2099, 1, 1),
+            )
+        )
+        try:
+            await scenario(repertoire.id)
+        finally:
+            await database.execute(
+                reservations_table.delete()
+                .where(reservations_table.c.repertoire_id == repertoire.id)
+            )
+            await database.execute(
+                repertoires_table.delete().where(repertoires_table.c.id == repertoire.id)
+            )
+            await database.execute(
+                screening_rooms_table.delete()
+                .where(screening_rooms_table.c.id == screening_room.id)
+            )
+            await database.execute(movies_table.delete().where(movies_table.c.id == movie.id))
+            await close_db()
+
+    asyncio.run(run())
+
+
+def reservation(repertoire_id: int, number_of_seats: int) -> ReservationIn:
+    """Function preparing a reservation of the repertoire.
+
+    Args:
+        repertoire_id (int): The id of the repertoire.
+        number_of_seats (int): The number of seats.
+
+    Returns:
+        ReservationIn: The reservation.
+    """
+
+    return ReservationIn(
+        repertoire_id=repertoire_id,
+        firstName="Jan",
+        lastName="Kowalski",
+        telephone="123456789",
+        email="jan@example.com",
+        number_of_seats=number_of_seats,
+    )
+
+
+async def assert_not_overbooked(repertoire_id: int) -> list:
+    """Function checking the stored reservations fit in the room.
+
+    Args:
+        repertoire_id (int): The id of the repertoire.
+
+    Returns:
+        list: The stored reservations.
+    """
+
+    stored = await ReservationRepository().get_by_repertoire_id(repertoire_id)
+    seats = [seat for stored_reservation in stored for seat in stored_reservation.seats]
+
+    assert sum(stored_reservation.number_of_seats for stored_reservation in stored) <= CAPACITY
+    assert len(seats) == len(set(seats))
+
+    return stored
+
+
+async def timed(writes: list[Awaitable[Any]]) -> list[Any]:
+    """Function running the writes in parallel and checking their throughput.
+
+    Args:
+        writes (list[Awaitable[Any]]): The writes to run.
+
+    Returns:
+        list[Any]: The results of the writes.
+    """
+
+    start = perf_counter()
+    results = await asyncio.gather(*writes)
+    writes_per_second = len(writes) / (perf_counter() - start)
+
+    assert writes_per_second >= MIN_WRITES_PER_SECOND, f"{writes_per_second:.0f} writes/s"
+
+    return results
+
+
+def test_parallel_reservations_never_overbook() -> None:
+    async def scenario(repertoire_id: int) -> None:
+        repository = ReservationRepository()
+        results = await timed([
+            repository.add_reservation(reservation(repertoire_id, 1))
+            for _ in range(PARALLEL_REQUESTS)
+        ])
+
+        accepted = [result for result in results if result]
+        stored = await assert_not_overbooked(repertoire_id)
+        assert len(accepted) == len(stored) == CAPACITY
+
+    run_on_repertoire(scenario)
+
+
+def test_parallel_mixed_writes_never_overbook() -> None:
+    async def scenario(repertoire_id: int) -> None:
+        repository = ReservationRepository()
+        writes = []
+        for index in range(PARALLEL_REQUESTS):
+            if index % 3 == 0:
+                writes.append(repository.add_many([
+                    reservation(repertoire_id, 1),
+                    reservation(repertoire_id, 2),
+                ]))
+            else:
+                writes.append(repository.add_reservation(
+                    reservation(repertoire_id, index % 3)
+                ))
+        results = await timed(writes)
+
+        accepted_seats = sum(
+            new_reservation.number_of_seats
+            for result in results if result
+            for new_reservation in (result if isinstance(result, list) else [result])
+        )
+        stored = await assert_not_overbooked(repertoire_id)
+        assert accepted_seats == sum(
+            stored_reservation.number_of_seats for stored_reservation in stored
+        )
+
+    run_on_repertoire(scenario)
+
+
+def test_expired_hold_frees_seats_before_the_sweep() -> None:
+    async def scenario(repertoire_id: int) -> None:
+        repository = ReservationRepository(hold_ttl_seconds=1)
+        hold = await repository.add_hold(
+            SeatHoldIn(repertoire_id=repertoire_id, number_of_seats=CAPACITY)
+        )
+        assert hold
+        assert await repository.add_reservation(reservation(repertoire_id, 1)) is None
+
+        await asyncio.sleep(1.5)
+
+        assert await repository.get_hold(hold.id) is None
+        assert await repository.add_reservation(reservation(repertoire_id, CAPACITY))
+        # The expired hold is still stored, no sweep freed its seats.
+        assert await database.fetch_val(
+            select(func.count())
+            .select_from(seat_holds_table)
+            .where(seat_holds_table.c.id == hold.id)
+        ) == 1
+
+    run_on_repertoire(scenario)
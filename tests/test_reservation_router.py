@@ -0,0 +1,11 @@
+"""Tests of the reservation endpoints which need no PostgreSQL."""
+from fastapi.testclient import TestClient
+
+from cinema_management.main import app
+
+
+def test_empty_bulk_reservation_adds_nothing() -> None:
+    response = TestClient(app).post("/reservation/bulk", json=[])
+
+    assert response.status_code == 201
+    assert response.json() == []
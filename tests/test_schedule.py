@@ -0,0 +1,64 @@
+"""Tests of the generated repertoire schedules."""
+from datetime import date, time, timedelta
+
+import pytest
+
+from cinema_management.core.domains.movie import Movie
+from cinema_management.core.domains.schedule import ScheduleRequest, generate_schedule
+from cinema_management.core.domains.screeningroom import ScreeningRoom
+
+SCREENING_ROOM = ScreeningRoom(id=1, number=1, rows_count=10, seats_in_row=10)
+REQUEST = ScheduleRequest(
+    week_start=date(2099, 1, 5),
+    days=1,
+    opening=time(10, 0),
+    closing=time(14, 0),
+)
+
+
+def movie(movie_id: int, length: float) -> Movie:
+    """Function building a movie released before the scheduled week.
+
+    Args:
+        movie_id (int): The id of the movie.
+        length (float): The length of the movie in hours.
+
+    Returns:
+        Movie: The movie.
+    """
+
+    return Movie(
+        id=movie_id,
+        name=f"Movie {movie_id}",
+        length=length,
+        premiere=date(2099, 1, 1),
+        director="Director",
+    )
+
+
+@pytest.mark.parametrize(
+    ("length", "buffer"),
+    [(0.0, timedelta(0)), (-0.25, timedelta(minutes=15)), (-1.0, timedelta(minutes=15))],
+)
+def test_movies_taking_no_time_are_skipped(length: float, buffer: timedelta) -> None:
+    repertoires = generate_schedule(
+        [movie(1, length), movie(2, 1.75)],
+        [SCREENING_ROOM],
+        [],
+        REQUEST,
+        buffer,
+    )
+
+    assert [repertoire.movie_id for repertoire in repertoires] == [2, 2]
+
+
+def test_schedule_without_usable_movies_is_empty() -> None:
+    repertoires = generate_schedule(
+        [movie(1, 0.0)],
+        [SCREENING_ROOM],
+        [],
+        REQUEST,
+        timedelta(0),
+    )
+
+    assert repertoires == []
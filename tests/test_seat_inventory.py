@@ -0,0 +1,181 @@
+"""Tests of taking seats through the in-memory free-seat counters.
+
+The repository and the reservation service are replaced by stand-ins
+holding what the DB would report, so no PostgreSQL is needed.
+"""
+import asyncio
+from datetime import date, datetime
+from typing import Any, Iterable
+
+from cinema_management.core.domains.repertoire import RepertoireSeats
+from cinema_management.core.domains.reservation import ReservationIn
+from cinema_management.core.domains.seat_hold import SeatHold, SeatHoldIn
+from cinema_management.infrastructure.services.repertoire_service import RepertoireService
+from cinema_management.infrastructure.services.seat_inventory import SeatInventory
+
+CAPACITY = 10
+
+
+class SeatsRepository:
+    """A stand-in repository reporting the free seats of repertoires."""
+
+    def __init__(self, available_seats: dict[int, int]) -> None:
+        """The initializer of the `seats repository`.
+
+        Args:
+            available_seats (dict[int, int]): The free seats by repertoire id.
+        """
+        self.available_seats = available_seats
+        self.queries = 0
+
+    async def get_seats_many(self, repertoire_ids: Iterable[int]) -> list[RepertoireSeats]:
+        """The method serving the seat occupancy of existing repertoires."""
+        self.queries += 1
+        return [
+            RepertoireSeats(
+                repertoire_id=repertoire_id,
+                capacity=CAPACITY,
+                taken_seats=CAPACITY - self.available_seats[repertoire_id],
+                available_seats=self.available_seats[repertoire_id],
+            )
+            for repertoire_id in repertoire_ids
+            if repertoire_id in self.available_seats
+        ]
+
+    async def get_seats_from_date(self, from_date: date) -> list[RepertoireSeats]:
+        """The method serving the seat occupancy of upcoming repertoires."""
+        return await self.get_seats_many(self.available_seats)
+
+
+class HoldsService:
+    """A stand-in reservation service keeping seat holds in memory.
+
+    Holds take seats from the free seats of the stand-in repository until
+    they expire, as the DB predicates do.
+    """
+
+    def __init__(self, repository: SeatsRepository) -> None:
+        """The initializer of the `holds service`.
+
+        Args:
+            repository (SeatsRepository): The repository holding the free seats.
+        """
+        self.repository = repository
+        self.holds: dict[str, SeatHold] = {}
+
+    def expire(self, hold_id: str) -> None:
+        """The method letting the hold expire."""
+        hold = self.holds.pop(hold_id)
+        self.repository.available_seats[hold.repertoire_id] += hold.number_of_seats
+
+    async def add_hold(self, data: SeatHoldIn) -> SeatHold:
+        """The method storing a new hold."""
+        hold = SeatHold(id=f"hold-{len(self.holds)}", expires_at=datetime.max, **data.model_dump())
+        self.holds[hold.id] = hold
+        self.repository.available_seats[hold.repertoire_id] -= hold.number_of_seats
+        return hold
+
+    async def get_hold(self, hold_id: str) -> SeatHold | None:
+        """The method getting the active hold."""
+        return self.holds.get(hold_id)
+
+    async def add_reservation(self, data: ReservationIn, hold_id: str | None = None) -> None:
+        """The method refusing every reservation, like for a hold which expired."""
+        return None
+
+    async def delete_expired_holds(self) -> None:
+        """The method sweeping expired holds, which are never stored here."""
+        return None
+
+
+def service(repository: SeatsRepository, inventory: SeatInventory) -> RepertoireService:
+    none: Any = None
+    return RepertoireService(repository, HoldsService(repository), none, inventory, none)
+
+
+def reservation(number_of_seats: int) -> ReservationIn:
+    return ReservationIn(
+        repertoire_id=1,
+        firstName="Jan",
+        lastName="Kowalski",
+        telephone="123456789",
+        email="jan@example.com",
+        number_of_seats=number_of_seats,
+    )
+
+
+def test_counter_short_of_seats_is_reloaded_before_refusing() -> None:
+    repository = SeatsRepository({1: 0, 2: 4})
+    inventory = SeatInventory()
+    repertoire_service = service(repository, inventory)
+    asyncio.run(repertoire_service.available_seats_many([1, 2]))
+
+    # Another worker frees seats the counters of this process do not see.
+    repository.available_seats[1] = 6
+
+    assert asyncio.run(repertoire_service.reserve_seats_many({1: 5, 2: 3}))
+    assert (inventory.get(1), inventory.get(2)) == (1, 1)
+
+
+def test_seats_are_refused_when_the_reloaded_counter_is_short() -> None:
+    repository = SeatsRepository({1: 2})
+    inventory = SeatInventory()
+    repertoire_service = service(repository, inventory)
+
+    assert not asyncio.run(repertoire_service.reserve_seats(1, 3))
+    assert not asyncio.run(repertoire_service.reserve_seats(2, 1))
+    assert inventory.get(1) == 2
+    assert repository.queries == 4
+
+
+def test_counter_with_enough_seats_is_not_reloaded() -> None:
+    repository = SeatsRepository({1: 5})
+    inventory = SeatInventory()
+    repertoire_service = service(repository, inventory)
+
+    assert asyncio.run(repertoire_service.reserve_seats(1, 2))
+    assert asyncio.run(repertoire_service.reserve_seats(1, 3))
+    assert inventory.get(1) == 0
+    assert repository.queries == 1
+
+
+def test_failed_confirmation_gives_back_seats_of_expired_hold_once() -> None:
+    repository = SeatsRepository({1: 10})
+    inventory = SeatInventory()
+    repertoire_service = service(repository, inventory)
+    holds = repertoire_service._reservation_service
+
+    hold = asyncio.run(repertoire_service.hold_seats(SeatHoldIn(repertoire_id=1, number_of_seats=4)))
+    assert inventory.get(1) == 6
+
+    holds.expire(hold.id)
+    assert asyncio.run(repertoire_service.confirm_hold(hold.id, reservation(4))) is None
+    assert inventory.get(1) == 10
+    assert asyncio.run(repertoire_service.confirm_hold(hold.id, reservation(4))) is None
+    assert inventory.get(1) == 10
+
+
+def test_failed_confirmation_after_reconciliation_gives_nothing_back() -> None:
+    repository = SeatsRepository({1: 10})
+    inventory = SeatInventory()
+    repertoire_service = service(repository, inventory)
+    holds = repertoire_service._reservation_service
+
+    hold = asyncio.run(repertoire_service.hold_seats(SeatHoldIn(repertoire_id=1, number_of_seats=4)))
+    holds.expire(hold.id)
+    asyncio.run(repertoire_service.reconcile_seats())
+    assert inventory.get(1) == 10
+
+    assert asyncio.run(repertoire_service.confirm_hold(hold.id, reservation(4))) is None
+    assert inventory.get(1) == 10
+
+
+def test_failed_confirmation_keeps_seats_of_active_hold() -> None:
+    repository = SeatsRepository({1: 10})
+    inventory = SeatInventory()
+    repertoire_service = service(repository, inventory)
+
+    hold = asyncio.run(repertoire_service.hold_seats(SeatHoldIn(repertoire_id=1, number_of_seats=4)))
+
+    assert asyncio.run(repertoire_service.confirm_hold(hold.id, reservation(4))) is None
+    assert inventory.get(1) == 6